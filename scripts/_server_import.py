@@ -0,0 +1,60 @@
+"""Import ``server`` from the repository root for the scripts in this directory.
+
+Scripts run as ``python scripts/<name>.py`` and use ``from _server_import import ROOT, server``.
+The import puts the repository root on ``sys.path`` and imports ``server`` with its
+import-time output discarded, so a script's stdout stays machine-readable.
+
+The benchmarks that drive a real server process share :func:`free_port` and
+:func:`start_server` from here too.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Sequence
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+with contextlib.redirect_stdout(io.StringIO()):
+    import server  # noqa: E402
+
+__all__ = ["ROOT", "free_port", "server", "start_server"]
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(mode: str, extra: Sequence[str] = (), timeout: float = 60.0) -> tuple[subprocess.Popen, int]:
+    """Start ``server.py --server MODE`` on a free port with the access log off.
+
+    Returns the process and its port once it accepts connections. stderr goes to
+    a temporary file rather than a pipe, so a chatty server cannot block on it;
+    it is reported if the server exits before listening.
+    """
+    port = free_port()
+    command = [sys.executable, str(ROOT / "server.py"), "--port", str(port), "--server", mode, "--access-log", "off"]
+    stderr = tempfile.TemporaryFile()
+    process = subprocess.Popen([*command, *extra], cwd=ROOT, stdout=subprocess.DEVNULL, stderr=stderr)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            stderr.seek(0)
+            raise RuntimeError(f"server.py exited: {stderr.read().decode(errors='replace')}")
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+            return process, port
+        except OSError:
+            time.sleep(0.05)
+    process.kill()
+    raise RuntimeError(f"server.py --server {mode} did not start")
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Compare --server threading and --server pool under a burst of concurrent connections.
+
+For each mode, ``server.py`` is started as a subprocess with the access log
+off. An asyncio client then opens ``--connections`` connections at once. Each
+one sends ``POST /api/new-game`` and waits for the answer; connection errors
+count as failures. The report gives, per mode:
+- response counts by status
+- client-side latency percentiles in milliseconds
+- the burst's wall time
+- peak server threads and peak RSS, sampled from /proc every 5 ms
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+
+from _server_import import start_server
+
+REQUEST = b'POST /api/new-game HTTP/1.0\r\nContent-Type: application/json\r\nContent-Length: 2\r\n\r\n{}'
+
+
+def watch(pid: int, stop: threading.Event, peaks: dict[str, int]) -> None:
+    while not stop.wait(0.005):
+        try:
+            status = Path(f"/proc/{pid}/status").read_text()
+        except OSError:
+            return
+        for line in status.splitlines():
+            name, _, value = line.partition(":")
+            if name == "Threads":
+                peaks["threads"] = max(peaks.get("threads", 0), int(value))
+            elif name == "VmHWM":
+                peaks["rssKb"] = int(value.split()[0])
+
+
+async def one_request(port: int, timeout: float) -> tuple[str, float]:
+    started = time.perf_counter()
+    try:
+        reader, writer = await asyncio.wait_for(asyncio.open_connection("127.0.0.1", port), timeout)
+        writer.write(REQUEST)
+        status_line = await asyncio.wait_for(reader.readline(), timeout)
+        await asyncio.wait_for(reader.read(), timeout)
+        writer.close()
+        status = status_line.split()[1].decode() if status_line else "closed"
+    except (OSError, asyncio.TimeoutError) as exc:
+        status = type(exc).__name__
+    return status, (time.perf_counter() - started) * 1e3
+
+
+async def burst(port: int, connections: int, timeout: float) -> list[tuple[str, float]]:
+    return await asyncio.gather(*(one_request(port, timeout) for _ in range(connections)))
+
+
+def bench(mode: str, extra: list[str], connections: int, timeout: float) -> dict:
+    process, port = start_server(mode, extra)
+    time.sleep(0.5)
+    peaks: dict[str, int] = {}
+    stop = threading.Event()
+    watcher = threading.Thread(target=watch, args=(process.pid, stop, peaks))
+    watcher.start()
+    try:
+        started = time.perf_counter()
+        results = asyncio.run(burst(port, connections, timeout))
+        elapsed = time.perf_counter() - started
+    finally:
+        stop.set()
+        watcher.join()
+        process.terminate()
+        process.wait()
+    latencies = sorted(ms for status, ms in results if status == "200")
+    quantiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else [0.0] * 99
+    return {
+        "statuses": dict(Counter(status for status, _ in results)),
+        "okLatencyMs": {"p50": round(quantiles[49], 1), "p99": round(quantiles[98], 1)},
+        "wallMs": round(elapsed * 1e3),
+        "peakThreads": peaks.get("threads"),
+        "peakRssMb": round(peaks.get("rssKb", 0) / 1024, 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--connections", type=int, default=1000)
+    parser.add_argument("--timeout", type=float, default=30.0, help="client timeout per request in seconds")
+    parser.add_argument("--pool-size", type=int, default=32)
+    parser.add_argument("--pool-queue", type=int, default=128)
+    args = parser.parse_args()
+
+    pool_args = ["--pool-size", str(args.pool_size), "--pool-queue", str(args.pool_queue)]
+    report = {
+        "threading": bench("threading", [], args.connections, args.timeout),
+        "pool": bench("pool", pool_args, args.connections, args.timeout),
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
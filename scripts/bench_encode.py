@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""Compare game-state response encoding: json.dumps(to_response()) vs encode_response().
+
+For games with 0-6 guesses (in progress, won and lost), this checks that both
+encodings are byte-identical and reports microseconds per response for each.
+It also times a whole guess both ways: ``apply_guess`` plus ``json.dumps``
+against ``apply_guess_encoded``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import timeit
+
+from _server_import import server
+
+
+def per_call_us(stmt, number: int) -> float:
+    return round(min(timeit.repeat(stmt, number=number, repeat=5)) / number * 1e6, 3)
+
+
+def played_game(word_length: int, rng: random.Random, guesses: int, finish: str) -> server.GameState:
+    bank = server.WORD_BANK[word_length]
+    answer = rng.choice(bank.answers)
+    game = server.GameState(answer, bank.guesses, word_length, feedback=server.get_feedback_table(word_length, build=True))
+    for _ in range(guesses - (finish == "won")):
+        word = bank.guesses[rng.randrange(len(bank.guesses))]
+        game.apply_guess(word if word != answer else bank.guesses[0])
+    if finish == "won":
+        game.apply_guess(answer)
+    return game
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--length", type=int, default=5, choices=server.SUPPORTED_WORD_LENGTHS)
+    parser.add_argument("--number", type=int, default=20000, help="iterations per timing sample")
+    args = parser.parse_args()
+    rng = random.Random(0)
+
+    cases = [(count, "in_progress") for count in range(6)] + [(3, "won"), (6, "won"), (6, "lost")]
+    results = []
+    for count, finish in cases:
+        game = played_game(args.length, rng, count, finish)
+        expected = json.dumps(game.to_response()).encode("utf-8")
+        if game.encode_response() != expected:
+            sys.exit(f"Encodings differ for {count} guesses ({finish}):\n{expected!r}\n{game.encode_response()!r}")
+        results.append(
+            {
+                "guesses": count,
+                "status": game.status,
+                "bytes": len(expected),
+                "jsonDumpsUs": per_call_us(lambda: json.dumps(game.to_response()).encode("utf-8"), args.number),
+                "encodeResponseUs": per_call_us(game.encode_response, args.number),
+            }
+        )
+
+    # A full guess round trip, replaying the same game from a fresh copy each time.
+    base = played_game(args.length, rng, 3, "in_progress")
+    record = base.to_record()
+    word = server.WORD_BANK[args.length].guesses[1]
+
+    def fresh() -> server.GameState:
+        game = server.GameState.from_record(record)
+        game.encode_response()
+        return game
+
+    number = args.number // 4
+    setup_us = per_call_us(fresh, number)
+    dumps_us = per_call_us(lambda: json.dumps(fresh().apply_guess(word)).encode("utf-8"), number)
+    encoded_us = per_call_us(lambda: fresh().apply_guess_encoded(word), number)
+    guess = {
+        "applyGuessDumpsUs": round(dumps_us - setup_us, 3),
+        "applyGuessEncodedUs": round(encoded_us - setup_us, 3),
+    }
+    print(json.dumps({"wordLength": args.length, "responses": results, "guessAfter3": guess}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Measure /api/hint engine latency per word length.
+
+Plays random games: a random first guess, then up to three hinted guesses. Each
+``HintEngine.suggest`` call is timed and p50/p99/max are reported. The first-move
+opener is warmed beforehand, as it is on a running server. Requires NumPy.
+
+Before warming, ``coldHintMs`` times ``hint_for_game`` for a game whose engine
+is not ready yet, which is what ``/api/hint`` does during startup or after a
+reload. It should return ``None`` (a 503) at once rather than build the opener,
+and ``coldHintReturned`` confirms it did.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+
+from _server_import import server
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def bench_length(word_length: int, games: int, rng: random.Random) -> dict[str, object]:
+    bank = server.WORD_BANK[word_length]
+    feedback = server.get_feedback_table(word_length, build=True, bank=bank)
+    server._HINT_ENGINES.pop(bank.digest, None)
+    game = server.GameState(bank.answers[0], bank.guesses, word_length, feedback=feedback, bank=bank)
+    started = time.perf_counter()
+    cold = server.hint_for_game(game)
+    cold_ms = (time.perf_counter() - started) * 1e3
+
+    engine = server.get_hint_engine(word_length)
+    started = time.perf_counter()
+    engine.opener()
+    opener_ms = (time.perf_counter() - started) * 1e3
+    latencies = []
+    for _ in range(games):
+        answer = rng.randrange(len(engine.bank.answers))
+        guess = rng.randrange(len(engine.bank.guesses))
+        history = [(guess, engine.table.pattern(guess, answer))]
+        for _step in range(3):
+            started = time.perf_counter()
+            hint = engine.suggest(history)
+            latencies.append((time.perf_counter() - started) * 1e3)
+            if hint["remaining"] == 1:
+                break
+            guess = engine.bank.guesses.find(hint["guess"])
+            history.append((guess, engine.table.pattern(guess, answer)))
+    return {
+        "wordLength": word_length,
+        "coldHintMs": round(cold_ms, 3),
+        "coldHintReturned": cold,
+        "openerMs": round(opener_ms, 1),
+        "calls": len(latencies),
+        "p50Ms": round(percentile(latencies, 0.50), 2),
+        "p99Ms": round(percentile(latencies, 0.99), 2),
+        "maxMs": round(max(latencies), 2),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    if server.np is None:
+        sys.exit("NumPy is required for the hint engine benchmark.")
+    rng = random.Random(args.seed)
+    print(json.dumps([bench_length(length, args.games, rng) for length in server.SUPPORTED_WORD_LENGTHS], indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Measure the per-request cost of Metrics.record() and the cost of a /metrics scrape.
+
+``record()`` is timed with 1..N threads recording concurrently. Two
+implementations are compared:
+- ``perThread``: ``server.Metrics``, where each thread records into its own shard
+- ``singleLock``: the same counters behind one shared lock
+Results are nanoseconds per call, measured as wall time over all calls.
+
+``threadChurn`` runs many short-lived recording threads, as
+``ThreadingHTTPServer`` does, and checks two things: no counts are lost, and the
+shards of exited threads are retired. ``renderMs`` is the time to build the
+exposition text once the counters are populated.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import threading
+import time
+
+from _server_import import server
+
+
+class SingleLockMetrics(server.Metrics):
+    def __init__(self) -> None:
+        super().__init__()
+        self._record_lock = threading.Lock()
+
+    def record(self, route: str, method: str, status: int, seconds: float) -> None:
+        with self._record_lock:
+            super().record(route, method, status, seconds)
+
+
+ROUTES = [("/api/guess", "POST"), ("/api/state", "GET"), ("/api/new-game", "POST"), ("static", "GET")]
+
+
+def record_ns(metrics: server.Metrics, threads: int, calls: int) -> float:
+    barrier = threading.Barrier(threads + 1)
+
+    def work(offset: int) -> None:
+        barrier.wait()
+        for index in range(calls):
+            route, method = ROUTES[(index + offset) % len(ROUTES)]
+            metrics.record(route, method, 200, (index % 97) * 1e-4)
+
+    workers = [threading.Thread(target=work, args=(offset,)) for offset in range(threads)]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    started = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    return round((time.perf_counter() - started) / (threads * calls) * 1e9, 1)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200_000, help="record() calls per thread")
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 4, 16, 64])
+    parser.add_argument("--churn", type=int, default=2000, help="short-lived threads for the churn check")
+    args = parser.parse_args()
+
+    report: dict = {"recordNs": {}}
+    for threads in args.threads:
+        calls = max(1000, args.calls // threads)
+        report["recordNs"][str(threads)] = {
+            "perThread": min(record_ns(server.Metrics(), threads, calls) for _ in range(3)),
+            "singleLock": min(record_ns(SingleLockMetrics(), threads, calls) for _ in range(3)),
+        }
+
+    metrics = server.Metrics()
+    for _ in range(args.churn // 50):
+        record_ns(metrics, 50, 20)
+    requests, _ = metrics.snapshot()
+    report["threadChurn"] = {
+        "threads": args.churn // 50 * 50,
+        "recorded": sum(requests.values()),
+        "expected": args.churn // 50 * 50 * 20,
+        "liveShards": len(metrics._live),
+    }
+
+    metrics = server.Metrics()
+    record_ns(metrics, 4, 10_000)
+    started = time.perf_counter()
+    for _ in range(100):
+        metrics.render()
+    report["renderMs"] = round((time.perf_counter() - started) / 100 * 1e3, 3)
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
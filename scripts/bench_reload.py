@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""Measure request latency while a word bank is hot-reloaded under load.
+
+The word lists are copied to a scratch directory, with a fresh cache, and the
+threading server runs in this process with its ``--watch-wordlists`` watcher.
+A client process plays ``--length`` games from ``--users`` threads, one
+connection per request. After ``--before`` seconds, every tenth line of that
+length's answers file is dropped, along with the answer of a game started
+beforehand. The watcher then rebuilds the bank, its feedback table and hint
+opener, and swaps it in.
+
+Latency percentiles, in milliseconds, are reported for three phases:
+- before the edit
+- between the edit and the swap
+- after the swap
+
+Each phase also lists non-200/400 responses. The checks confirm that a game
+started before the edit keeps its original snapshot, and can still be won with
+its now-removed answer, while a game started after the swap gets the new bank.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import http.client
+import io
+import json
+import multiprocessing
+import random
+import shutil
+import statistics
+import tempfile
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from _server_import import free_port, server
+
+
+def request(conn: http.client.HTTPConnection, method: str, path: str, cookie: str | None, payload=None):
+    headers = {"Content-Type": "application/json"}
+    if cookie:
+        headers["Cookie"] = cookie
+    conn.request(method, path, body=json.dumps(payload).encode() if payload is not None else None, headers=headers)
+    response = conn.getresponse()
+    body = response.read()
+    set_cookie = response.getheader("Set-Cookie")
+    return response.status, json.loads(body) if body.startswith(b"{") else None, set_cookie
+
+
+def client(task: tuple[int, int, int, str, list[str]]) -> list[tuple[float, float, int]]:
+    """Play games until ``stop_path`` exists; return ``(wall time, latency ms, status)`` per request."""
+    port, users, length, stop_path, words = task
+    stop = Path(stop_path)
+    samples: list[tuple[float, float, int]] = []
+    lock = threading.Lock()
+
+    def user(seed: int) -> None:
+        rng = random.Random(seed)
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+        cookie = None
+        while not stop.exists():
+            calls = [("POST", "/api/new-game", {"wordLength": length})]
+            calls += [("POST", "/api/guess", {"guess": rng.choice(words)}) for _ in range(3)]
+            calls.append(("GET", "/api/state", None))
+            for method, path, payload in calls:
+                started = time.perf_counter()
+                try:
+                    status, _, set_cookie = request(conn, method, path, cookie, payload)
+                except (OSError, http.client.HTTPException):
+                    conn.close()
+                    status, set_cookie = 0, None
+                with lock:
+                    samples.append((time.time(), (time.perf_counter() - started) * 1e3, status))
+                if set_cookie:
+                    cookie = set_cookie.split(";", 1)[0]
+        conn.close()
+
+    threads = [threading.Thread(target=user, args=(seed,)) for seed in range(users)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return samples
+
+
+def summarize(samples: list[tuple[float, float, int]]) -> dict:
+    latencies = sorted(ms for _, ms, _ in samples)
+    cuts = statistics.quantiles(latencies, n=100, method="inclusive") if len(latencies) > 1 else latencies * 99
+    return {
+        "requests": len(latencies),
+        "p50Ms": round(cuts[49], 2) if cuts else None,
+        "p99Ms": round(cuts[98], 2) if cuts else None,
+        "maxMs": round(latencies[-1], 2) if latencies else None,
+        "unexpected": dict(Counter(status for _, _, status in samples if status not in (200, 400))),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--length", type=int, default=6, choices=server.SUPPORTED_WORD_LENGTHS)
+    parser.add_argument("--users", type=int, default=4, help="client threads")
+    parser.add_argument("--before", type=float, default=3.0, help="seconds of load before the edit")
+    parser.add_argument("--after", type=float, default=3.0, help="seconds of load after the swap")
+    parser.add_argument("--interval", type=float, default=0.2, help="watcher poll interval in seconds")
+    args = parser.parse_args()
+
+    scratch = Path(tempfile.mkdtemp(prefix="wordle-reload-"))
+    shutil.copytree(server.WORDLIST_DIR, scratch / "wordlist")
+    server.WORDLIST_DIR, server.CACHE_DIR = scratch / "wordlist", scratch / "cache"
+    server.configure_access_log(None)
+    server.configure_sessions("memory")
+    server.configure_wordlist_watch(args.interval)
+    with contextlib.redirect_stdout(io.StringIO()):
+        server.warm_solver()
+    old_bank = server.WORD_BANK[args.length]
+
+    port = free_port()
+    httpd = server.WordleHTTPServer(("127.0.0.1", port), server.WordleHandler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    server.WORDLIST_WATCHER.start()
+
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+    _, early, early_cookie = request(conn, "POST", "/api/new-game", None, {"wordLength": args.length})
+    early_game = server.GAMES.get(early["id"])
+
+    stop_path = scratch / "stop"
+    answers_path = server.word_list_files(args.length)[1]
+    with ProcessPoolExecutor(1, mp_context=multiprocessing.get_context("spawn")) as pool:
+        future = pool.submit(client, (port, args.users, args.length, str(stop_path), list(old_bank.guesses)))
+        # Let the client process start and reach a steady state.
+        time.sleep(args.before)
+        lines = answers_path.read_text().splitlines()
+        edited = time.time()
+        kept = [line for index, line in enumerate(lines) if index % 10 and line.strip() != early_game.answer]
+        answers_path.write_text("\n".join(kept) + "\n")
+        while server.WORD_BANK.version(args.length) == 1:
+            time.sleep(0.005)
+        swapped = time.time()
+        time.sleep(args.after)
+        stop_path.touch()
+        samples = future.result()
+
+    cookie = early_cookie.split(";", 1)[0]
+    _, finished, _ = request(conn, "POST", "/api/guess", cookie, {"guess": early_game.answer})
+    _, late, _ = request(conn, "POST", "/api/new-game", None, {"wordLength": args.length})
+    late_game = server.GAMES.get(late["id"])
+    conn.close()
+    httpd.shutdown()
+    httpd.server_close()
+    server.WORDLIST_WATCHER.stop()
+    new_bank = server.WORD_BANK[args.length]
+    shutil.rmtree(scratch)
+
+    report = {
+        "length": args.length,
+        "answers": {"before": len(old_bank.answers), "after": len(new_bank.answers)},
+        "reloadSeconds": round(swapped - edited, 3),
+        "phases": {
+            "beforeEdit": summarize([s for s in samples if s[0] < edited]),
+            "duringReload": summarize([s for s in samples if edited <= s[0] < swapped]),
+            "afterSwap": summarize([s for s in samples if s[0] >= swapped]),
+        },
+        "checks": {
+            "earlyGameKeptOldBank": early_game.bank is old_bank,
+            "earlyGameAnswerStillWins": finished["status"] == "won",
+            "earlyAnswerInNewBank": early_game.answer in new_bank.answers,
+            "lateGameOnNewBank": late_game.bank is new_bank and new_bank is not old_bank,
+            "version": server.WORD_BANK.version(args.length),
+        },
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
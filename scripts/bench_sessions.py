@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""Measure what the durable session backend costs per guess and on restart.
+
+- guess latency: the same scripted guesses go through ``store.locked()`` and
+  ``apply_guess`` on the in-memory store and on ``DurableSessionStore``. The
+  difference is the added latency per guess. The time to drain the write-behind
+  queue afterwards is reported separately because requests never wait on it.
+- recovery: a SQLite file is seeded with ``--stored`` games. The report covers
+  the time to open a ``DurableSessionStore`` on it (the restart cost) and the
+  latency of the lazy first lookup of a stored game. ``--eager`` also times
+  loading every stored game up front, for comparison.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import random
+import sqlite3
+import statistics
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+from _server_import import server
+
+
+def percentiles_us(samples: list[float]) -> dict[str, float]:
+    samples = sorted(samples)
+    pick = lambda q: samples[min(len(samples) - 1, int(q * len(samples)))] * 1e6  # noqa: E731
+    return {
+        "mean": round(statistics.fmean(samples) * 1e6, 2),
+        "p50": round(pick(0.50), 2),
+        "p99": round(pick(0.99), 2),
+        "max": round(samples[-1] * 1e6, 2),
+    }
+
+
+def play(store, word_length: int, games: int, seed: int) -> list[float]:
+    """Play ``games`` games of random guesses and return per-guess latencies in seconds."""
+    bank = server.WORD_BANK[word_length]
+    rng = random.Random(seed)
+    feedback = server.get_feedback_table(word_length)
+    timings = []
+    for _ in range(games):
+        game = server.GameState(rng.choice(bank.answers), bank.guesses, word_length, feedback=feedback)
+        store.add(game)
+        while game.status == "in_progress":
+            guess = bank.guesses[rng.randrange(len(bank.guesses))]
+            started = time.perf_counter()
+            with store.locked(game.id) as locked:
+                locked.apply_guess(guess)
+            timings.append(time.perf_counter() - started)
+    return timings
+
+
+def bench_guesses(word_length: int, games: int, workdir: Path) -> dict[str, object]:
+    memory = play(server.SessionStore(), word_length, games, seed=1)
+    store = server.DurableSessionStore(workdir / "guesses.sqlite3")
+    durable = play(store, word_length, games, seed=1)
+    started = time.perf_counter()
+    store.close()
+    drain = time.perf_counter() - started
+    memory_us, durable_us = percentiles_us(memory), percentiles_us(durable)
+    return {
+        "guesses": len(durable),
+        "memoryUs": memory_us,
+        "durableUs": durable_us,
+        "addedUs": {key: round(durable_us[key] - memory_us[key], 2) for key in ("mean", "p50", "p99")},
+        "finalDrainMs": round(drain * 1e3, 2),
+        "writer": store.stats(),
+    }
+
+
+def seed_games(path: Path, word_length: int, count: int) -> list[str]:
+    """Write ``count`` mid-game records straight into a session file; return their ids."""
+    bank = server.WORD_BANK[word_length]
+    rng = random.Random(2)
+    conn = sqlite3.connect(path, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(server.SqliteSessionStore.SCHEMA)
+    ids = []
+    now = time.time()
+    batch = []
+    for _ in range(count):
+        game = server.GameState(rng.choice(bank.answers), bank.guesses, word_length)
+        for _ in range(rng.randrange(0, 4)):
+            if game.status != "in_progress":
+                break
+            game.apply_guess(bank.guesses[rng.randrange(len(bank.guesses))])
+        record = game.to_record()
+        ids.append(game.id)
+        batch.append((game.id, record["status"], now, json.dumps(record, separators=(",", ":"))))
+        if len(batch) == 10_000:
+            conn.execute("BEGIN")
+            conn.executemany("INSERT INTO games (id, status, last_seen, record) VALUES (?, ?, ?, ?)", batch)
+            conn.execute("COMMIT")
+            batch.clear()
+    if batch:
+        conn.execute("BEGIN")
+        conn.executemany("INSERT INTO games (id, status, last_seen, record) VALUES (?, ?, ?, ?)", batch)
+        conn.execute("COMMIT")
+    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    conn.close()
+    return ids
+
+
+def bench_recovery(word_length: int, stored: int, lookups: int, eager: bool, workdir: Path) -> dict[str, object]:
+    path = workdir / "recovery.sqlite3"
+    started = time.perf_counter()
+    ids = seed_games(path, word_length, stored)
+    seeded = time.perf_counter() - started
+
+    started = time.perf_counter()
+    store = server.DurableSessionStore(path, max_entries=stored)
+    opened = time.perf_counter() - started
+
+    rng = random.Random(3)
+    first, again = [], []
+    for game_id in rng.sample(ids, min(lookups, len(ids))):
+        started = time.perf_counter()
+        game = store.get(game_id)
+        first.append(time.perf_counter() - started)
+        started = time.perf_counter()
+        store.get(game_id)
+        again.append(time.perf_counter() - started)
+        assert game is not None and game.id == game_id
+    missing = str(uuid.uuid4())
+    started = time.perf_counter()
+    assert store.get(missing) is None
+    unknown = time.perf_counter() - started
+    store.close()
+
+    report: dict[str, object] = {
+        "storedGames": stored,
+        "fileMB": round(path.stat().st_size / 1e6, 1),
+        "seedSeconds": round(seeded, 2),
+        "openMs": round(opened * 1e3, 2),
+        "firstLookupUs": percentiles_us(first),
+        "warmLookupUs": percentiles_us(again),
+        "unknownIdUs": round(unknown * 1e6, 2),
+    }
+    if eager:
+        started = time.perf_counter()
+        conn = sqlite3.connect(path)
+        loaded = 0
+        for (record,) in conn.execute("SELECT record FROM games"):
+            server.GameState.from_record(json.loads(record))
+            loaded += 1
+        conn.close()
+        report["eagerLoadSeconds"] = round(time.perf_counter() - started, 2)
+        report["eagerLoaded"] = loaded
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--length", type=int, default=5, choices=server.SUPPORTED_WORD_LENGTHS)
+    parser.add_argument("--games", type=int, default=2000, help="games played for the guess-latency comparison")
+    parser.add_argument("--stored", type=int, default=1_000_000, help="games seeded for the recovery measurement")
+    parser.add_argument("--lookups", type=int, default=2000, help="stored games looked up after the restart")
+    parser.add_argument("--eager", action="store_true", help="also time loading every stored game at startup")
+    parser.add_argument("--dir", type=Path, help="where to put the SQLite files (default: a temp dir)")
+    args = parser.parse_args()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        server.get_feedback_table(args.length, build=True)
+    with tempfile.TemporaryDirectory(dir=args.dir) as tmp:
+        workdir = Path(tmp)
+        report = {
+            "wordLength": args.length,
+            "guessLatency": bench_guesses(args.length, args.games, workdir),
+            "recovery": bench_recovery(args.length, args.stored, args.lookups, args.eager, workdir),
+        }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
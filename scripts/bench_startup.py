@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""Time server.py cold start with and without the binary word-bank cache.
+
+Each scenario runs in a fresh interpreter ``--runs`` times and reports the
+median wall time in milliseconds:
+- ``import``: ``import server`` alone (banks are loaded lazily)
+- ``mappedBanks``: import, then touch every length with the cache in place
+- ``rebuiltBanks``: the same after deleting the cache files (parse and rewrite)
+- ``parsedBanks``: import, then parse every length from text, as every start did before
+
+It also reports in-process per-length times for mapping a cached bank and for
+building one from the text lists.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+from _server_import import ROOT, server
+
+TOUCH = "import server\nfor length in server.SUPPORTED_WORD_LENGTHS:\n    server.WORD_BANK[length].guesses.find('x')\n"
+SCENARIOS = {
+    "import": "import server\n",
+    "mappedBanks": TOUCH,
+    "rebuiltBanks": TOUCH,
+    "parsedBanks": "import server\nfor length in server.SUPPORTED_WORD_LENGTHS:\n    server.build_word_bank(length)\n",
+}
+
+
+def clear_cache() -> None:
+    for length in server.SUPPORTED_WORD_LENGTHS:
+        server.WordBank.cache_path(length).unlink(missing_ok=True)
+
+
+def run_ms(code: str) -> float:
+    started = time.perf_counter()
+    subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True, stdout=subprocess.DEVNULL)
+    return (time.perf_counter() - started) * 1e3
+
+
+def per_length(repeat: int) -> list[dict[str, object]]:
+    results = []
+    for length in server.SUPPORTED_WORD_LENGTHS:
+        fingerprint = server.WordBank.source_fingerprint(length)
+        with contextlib.redirect_stdout(io.StringIO()):
+            server.load_word_bank(length)
+            started = time.perf_counter()
+            for _ in range(repeat):
+                server.build_word_bank(length)
+            parsed = (time.perf_counter() - started) / repeat
+        started = time.perf_counter()
+        for _ in range(repeat):
+            server.WordBank.load_cached(length, server.WordBank.source_fingerprint(length))
+        mapped = (time.perf_counter() - started) / repeat
+        results.append(
+            {
+                "wordLength": length,
+                "cacheBytes": server.WordBank.cache_path(length).stat().st_size,
+                "fingerprintMatches": server.WordBank.load_cached(length, fingerprint) is not None,
+                "parseMs": round(parsed * 1e3, 3),
+                "mapMs": round(mapped * 1e3, 3),
+            }
+        )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=15, help="interpreter launches per scenario")
+    parser.add_argument("--repeat", type=int, default=20, help="in-process loads per length")
+    args = parser.parse_args()
+
+    samples: dict[str, list[float]] = {"interpreter": []}
+    samples.update((name, []) for name in SCENARIOS)
+    # Interleave scenarios so machine drift affects them all alike.
+    for _ in range(args.runs):
+        samples["interpreter"].append(run_ms("pass"))
+        for name, code in SCENARIOS.items():
+            if name == "rebuiltBanks":
+                clear_cache()
+            samples[name].append(run_ms(code))
+    startup = {name: round(statistics.median(values), 1) for name, values in samples.items()}
+    report = {"numpy": server.np is not None, "startupMs": startup, "perLength": per_length(args.repeat)}
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""Measure static-file requests/sec with and without the in-memory asset cache.
+
+For each server mode (``threading``, ``asyncio``), ``server.py`` is started
+twice as a subprocess: once with ``--no-static-cache`` (every request reads the
+file from disk, as before the cache) and once with the cache. Client processes
+then hammer ``/`` (index.html), ``/app.js`` and ``/styles.css`` for
+``--seconds`` each, in three ways:
+- ``plain``: no Accept-Encoding
+- ``gzip``: ``Accept-Encoding: gzip, br``
+- ``revalidate``: ``If-None-Match`` with the ETag from the first response
+  (304 with the cache; the disk handler has no validators, so always 200)
+
+Clients use keep-alive connections; the threading server is HTTP/1.0, so it
+still pays one connection per request. On small machines the Python clients
+are the bottleneck, so ``serverUs`` also times the server-side work alone:
+``AsyncWordleServer._serve_static`` writing into a null transport.
+"""
+
+from __future__ import annotations
+
+import argparse
+import email.message
+import http.client
+import json
+import time
+import timeit
+from concurrent.futures import ProcessPoolExecutor
+
+from _server_import import server, start_server
+
+PATHS = ("/", "/app.js", "/styles.css")
+VARIANTS = ("plain", "gzip", "revalidate")
+
+
+def hammer(task: tuple[int, str, dict[str, str], float]) -> tuple[int, int]:
+    """Send GETs until ``seconds`` elapse; return (responses, bytes received)."""
+    port, path, headers, seconds = task
+    conn = http.client.HTTPConnection("127.0.0.1", port)
+    count = received = 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        conn.request("GET", path, headers=headers)
+        response = conn.getresponse()
+        received += len(response.read())
+        if response.status not in (200, 304):
+            raise RuntimeError(f"GET {path} returned {response.status}")
+        count += 1
+    conn.close()
+    return count, received
+
+
+def headers_for(port: int, path: str, variant: str) -> dict[str, str]:
+    if variant == "gzip":
+        return {"Accept-Encoding": "gzip, br"}
+    if variant == "revalidate":
+        conn = http.client.HTTPConnection("127.0.0.1", port)
+        conn.request("GET", path)
+        response = conn.getresponse()
+        response.read()
+        conn.close()
+        etag = response.getheader("ETag")
+        return {"If-None-Match": etag} if etag else {}
+    return {}
+
+
+def bench_server(mode: str, cached: bool, clients: int, seconds: float, pool: ProcessPoolExecutor) -> dict:
+    process, port = start_server(mode, [] if cached else ["--no-static-cache"])
+    results: dict[str, dict[str, dict[str, float]]] = {}
+    try:
+        for path in PATHS:
+            results[path] = {}
+            for variant in VARIANTS:
+                headers = headers_for(port, path, variant)
+                started = time.perf_counter()
+                totals = list(pool.map(hammer, [(port, path, headers, seconds)] * clients))
+                elapsed = time.perf_counter() - started
+                count = sum(done for done, _ in totals)
+                results[path][variant] = {
+                    "rps": round(count / elapsed, 1),
+                    "bytesPerResponse": round(sum(size for _, size in totals) / count) if count else 0,
+                }
+    finally:
+        process.terminate()
+        process.wait()
+    return results
+
+
+class NullWriter:
+    def write(self, data: bytes) -> None:
+        pass
+
+
+def server_side_us(number: int) -> dict[str, dict[str, float]]:
+    writer = NullWriter()
+    disk = server.AsyncWordleServer("127.0.0.1", 0)
+    disk.assets = None
+    cached = server.AsyncWordleServer("127.0.0.1", 0)
+    results = {}
+    for path in PATHS:
+        headers = email.message.Message()
+        headers["Accept-Encoding"] = "gzip, br"
+        results[path] = {}
+        for name, instance in (("disk", disk), ("cache", cached)):
+            elapsed = min(
+                timeit.repeat(
+                    lambda: instance._serve_static(writer, path, headers, True, head=False), number=number, repeat=5
+                )
+            )
+            results[path][name] = round(elapsed / number * 1e6, 2)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mode", action="append", choices=("threading", "asyncio"))
+    parser.add_argument("--clients", type=int, default=4, help="concurrent client processes")
+    parser.add_argument("--seconds", type=float, default=2.0, help="duration of each measurement")
+    args = parser.parse_args()
+
+    report = {"serverUs": server_side_us(2000)}
+    with ProcessPoolExecutor(max_workers=args.clients) as pool:
+        for mode in args.mode or ("threading", "asyncio"):
+            report[mode] = {
+                "disk": bench_server(mode, False, args.clients, args.seconds, pool),
+                "cache": bench_server(mode, True, args.clients, args.seconds, pool),
+            }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
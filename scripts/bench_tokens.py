@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Compare session lookup cost for cookie-id sessions and stateless game tokens.
+
+Per request, the server turns the ``Cookie`` header into a ``GameState``. This
+reports, in microseconds per call:
+- ``simpleCookieDictLookup``: the old path, ``SimpleCookie`` parse plus a
+  ``SessionStore`` lookup
+- ``cookieIdLookup``: the current cookie parse plus the same lookup
+- ``tokenVerify``: cookie parse, base64 decode and MAC check of a game token
+- ``tokenDecode/<n>``: the full token path rebuilding a game with n guesses
+- ``tokenEncode/<n>``: minting the cookie after a guess
+
+It also reports the token size in bytes and cookie characters.
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import contextlib
+import hmac
+import io
+import json
+import os
+import random
+import timeit
+from http.cookies import SimpleCookie
+
+from _server_import import server
+
+
+def per_call_us(stmt, number: int) -> float:
+    return round(min(timeit.repeat(stmt, number=number, repeat=5)) / number * 1e6, 3)
+
+
+def game_with_guesses(word_length: int, count: int, rng: random.Random) -> server.GameState:
+    bank = server.WORD_BANK[word_length]
+    while True:
+        game = server.GameState(
+            rng.choice(bank.answers), bank.guesses, word_length, feedback=server.get_feedback_table(word_length)
+        )
+        for _ in range(count):
+            game.apply_guess(bank.guesses[rng.randrange(len(bank.guesses))])
+            if game.status == "won":
+                break
+        if len(game.guesses) == count:
+            return game
+
+
+def simple_cookie_lookup(header: str, store: server.SessionStore):
+    cookie = SimpleCookie()
+    cookie.load(header)
+    return store.get(cookie["gameId"].value)
+
+
+def token_verify(header: str, tokens: server.TokenSessionStore) -> bool:
+    token = server.game_id_from_cookie(header)
+    raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+    return hmac.compare_digest(raw[-tokens.TAG_SIZE :], tokens._tag(raw[: -tokens.TAG_SIZE]))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--length", type=int, default=5, choices=server.SUPPORTED_WORD_LENGTHS)
+    parser.add_argument("--number", type=int, default=20000, help="iterations per timing sample")
+    args = parser.parse_args()
+    with contextlib.redirect_stdout(io.StringIO()):
+        server.get_feedback_table(args.length, build=True)
+
+    rng = random.Random(0)
+    store = server.SessionStore()
+    for _ in range(10_000):
+        store.add(game_with_guesses(args.length, 0, rng))
+    game = game_with_guesses(args.length, 3, rng)
+    store.add(game)
+    # Browsers usually send a few unrelated cookies too.
+    extra = "theme=dark; _ga=GA1.1.123456789.1700000000"
+    id_header = f"{extra}; gameId={game.id}"
+
+    tokens = server.TokenSessionStore(os.urandom(32))
+    timings = {
+        "simpleCookieDictLookup": per_call_us(lambda: simple_cookie_lookup(id_header, store), args.number),
+        "cookieIdLookup": per_call_us(lambda: store.get(server.game_id_from_cookie(id_header)), args.number),
+    }
+    sizes = {}
+    for count in (0, 3, 6):
+        token = tokens.encode(game_with_guesses(args.length, count, rng))
+        header = f"{extra}; gameId={token}"
+        if count == 6:
+            timings["tokenVerify"] = per_call_us(lambda: token_verify(header, tokens), args.number)
+        timings[f"tokenDecode/{count}"] = per_call_us(
+            lambda: tokens.get(server.game_id_from_cookie(header)), args.number
+        )
+        sample = tokens.decode(token)
+        timings[f"tokenEncode/{count}"] = per_call_us(lambda: tokens.encode(sample), args.number)
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        sizes[str(count)] = {"bytes": len(raw), "chars": len(token)}
+
+    report = {"wordLength": args.length, "feedbackTables": server.np is not None, "us": timings, "tokenSize": sizes}
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Compare the shared packed word bank against per-game guess sets.
+
+For every supported length this reports:
+- memory held by the plain lists returned by ``load_words_for_length``
+- memory of one per-game ``set(guesses)`` copy (the old new-game behavior)
+- memory of the shared ``PackedWords`` guess/answer buffers
+- new-game setup latency and guess membership latency for both approaches
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import timeit
+import tracemalloc
+
+from _server_import import server
+
+
+def traced_bytes(build) -> tuple[int, object]:
+    tracemalloc.start()
+    try:
+        value = build()
+        size, _peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return size, value
+
+
+def per_call_us(stmt, number: int) -> float:
+    return min(timeit.repeat(stmt, number=number, repeat=5)) / number * 1e6
+
+
+def bench_length(word_length: int, number: int) -> dict[str, object]:
+    with contextlib.redirect_stdout(io.StringIO()):
+        list_bytes, lists = traced_bytes(lambda: server.load_words_for_length(word_length))
+    set_bytes, guess_set = traced_bytes(lambda: set(lists["guesses"]))
+    packed_bytes, bank = traced_bytes(lambda: server.WordBank.from_lists(word_length, lists))
+
+    probe = lists["guesses"][len(lists["guesses"]) // 2]
+    answer = lists["answers"][0]
+    return {
+        "wordLength": word_length,
+        "guesses": len(lists["guesses"]),
+        "answers": len(lists["answers"]),
+        "memoryBytes": {
+            "loadWordsLists": list_bytes,
+            "perGameGuessSet": set_bytes,
+            "sharedPackedBank": packed_bytes,
+        },
+        "newGameUs": {
+            "copySet": per_call_us(
+                lambda: server.GameState(answer, set(lists["guesses"]), word_length), max(1, number // 100)
+            ),
+            "sharedBank": per_call_us(lambda: server.GameState(answer, bank.guesses, word_length), number),
+        },
+        "membershipUs": {
+            "set": per_call_us(lambda: probe in guess_set, number),
+            "packed": per_call_us(lambda: probe in bank.guesses, number),
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20000, help="iterations per timing sample")
+    args = parser.parse_args()
+    results = [bench_length(length, args.number) for length in server.SUPPORTED_WORD_LENGTHS]
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
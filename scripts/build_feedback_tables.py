@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""Precompute the guess x answer feedback tables used by server.py.
+
+Writes ``wordlist-cache/patterns-<length>-<digest>.npy`` for every supported
+length (or only ``--length``). The digest covers the word-list contents, so a
+table is rebuilt automatically after the lists change. Requires NumPy.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+
+from _server_import import ROOT, server
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--length", type=int, action="append", choices=server.SUPPORTED_WORD_LENGTHS)
+    parser.add_argument("--force", action="store_true", help="rebuild even if a table already exists")
+    args = parser.parse_args()
+    if server.np is None:
+        sys.exit("NumPy is required to build feedback tables.")
+
+    for length in args.length or server.SUPPORTED_WORD_LENGTHS:
+        bank = server.WORD_BANK[length]
+        path = server.FeedbackTable.path_for(bank)
+        if path.exists() and not args.force:
+            print(f"{length}-letter -> {path.relative_to(ROOT)} (up to date)")
+            continue
+        started = time.perf_counter()
+        table = server.FeedbackTable.build(bank)
+        answers, guesses = table.matrix.shape
+        print(
+            f"{length}-letter -> {path.relative_to(ROOT)} "
+            f"({guesses} guesses x {answers} answers {table.matrix.dtype}, {time.perf_counter() - started:.2f}s)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""Cross-check server.py's SeededGenerator/shuffle_with_seed against web/src/rng.js.
+
+Runs the JavaScript module under Node and compares, for a spread of seeds
+(zero, negative, past 2**64, Date.now()-sized), the raw ``next()`` stream,
+``nextFloat()`` values and shuffles of several list sizes. It also compares the
+full daily schedule for every word length: ``shuffleWithSeed`` of the sorted
+answers with ``DAILY_SEED``. Exits non-zero on the first mismatch. Needs
+``node`` on PATH.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import shutil
+import subprocess
+import sys
+
+from _server_import import ROOT, server
+
+SEEDS = [0, 1, 42, server.DAILY_SEED, -7, 1_700_000_000_000, 2**63 - 1, 2**64 + 5]
+SIZES = [0, 1, 2, 3, 10, 257]
+
+NODE_SCRIPT = """
+import { SeededGenerator, shuffleWithSeed } from %(module)s;
+let input = "";
+for await (const chunk of process.stdin) input += chunk;
+const { seeds, sizes, draws, lists, dailySeed } = JSON.parse(input);
+const out = { streams: {}, floats: {}, shuffles: {}, daily: {} };
+for (const seed of seeds) {
+  const gen = new SeededGenerator(BigInt(seed));
+  out.streams[seed] = Array.from({ length: draws }, () => gen.next().toString());
+  const floats = new SeededGenerator(BigInt(seed));
+  out.floats[seed] = Array.from({ length: draws }, () => floats.nextFloat());
+  out.shuffles[seed] = sizes.map((n) => shuffleWithSeed(Array.from({ length: n }, (_, i) => i), BigInt(seed)));
+}
+for (const [length, words] of Object.entries(lists)) out.daily[length] = shuffleWithSeed(words, dailySeed);
+process.stdout.write(JSON.stringify(out));
+"""
+
+
+def python_results(draws: int) -> dict:
+    out: dict = {"streams": {}, "floats": {}, "shuffles": {}, "daily": {}}
+    for seed in SEEDS:
+        generator = server.SeededGenerator(seed)
+        out["streams"][str(seed)] = [str(generator.next()) for _ in range(draws)]
+        generator = server.SeededGenerator(seed)
+        out["floats"][str(seed)] = [generator.next_float() for _ in range(draws)]
+        out["shuffles"][str(seed)] = [server.shuffle_with_seed(range(n), seed) for n in SIZES]
+    for length in server.SUPPORTED_WORD_LENGTHS:
+        answers = server.WORD_BANK[length].answers
+        out["daily"][str(length)] = [answers[i] for i in server.daily_schedule(length)]
+    return out
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--draws", type=int, default=200, help="generator outputs compared per seed")
+    args = parser.parse_args()
+    node = shutil.which("node")
+    if node is None:
+        sys.exit("node is required for the cross-check.")
+
+    lists = {str(length): list(server.WORD_BANK[length].answers) for length in server.SUPPORTED_WORD_LENGTHS}
+    payload = {
+        # Seeds travel as strings; JSON numbers would lose precision past 2**53.
+        "seeds": [str(seed) for seed in SEEDS],
+        "sizes": SIZES,
+        "draws": args.draws,
+        "lists": lists,
+        "dailySeed": server.DAILY_SEED,
+    }
+    module = json.dumps((ROOT / "web" / "src" / "rng.js").as_uri())
+    result = subprocess.run(
+        [node, "--input-type=module", "-e", NODE_SCRIPT % {"module": module}],
+        input=json.dumps(payload),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    expected = json.loads(result.stdout)
+    actual = python_results(args.draws)
+
+    checked = 0
+    for section in ("streams", "floats", "shuffles", "daily"):
+        for key, values in expected[section].items():
+            if actual[section][key] != values:
+                sys.exit(f"Mismatch in {section} for {key!r}.")
+            checked += 1
+    print(f"rng.js and server.py agree on {checked} sequences ({len(SEEDS)} seeds, {len(lists)} daily schedules).")
+
+
+if __name__ == "__main__":
+    main()
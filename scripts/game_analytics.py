@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""Summarize a server.py --event-log directory: solve rates, guesses per answer and common openers.
+
+Segments (``events-*.wev``) are memory-mapped one ``--chunk`` of records at a
+time, so memory stays bounded by the chunk and the word lists, not by the
+number of records. Each guess record carries its game's answer and outcome,
+so no per-game state is kept. With NumPy, each chunk is counted with vectorized ``bincount`` calls.
+Without it, or with ``--pure-python``, ``struct.iter_unpack`` is used.
+
+Indexes are resolved to words through the ``bank-<length>-<digest>.json``
+files the server writes next to the segments. Events from different bank
+snapshots, before and after a hot reload, are merged by word. The JSON report
+gives, per word length:
+- games started, won and lost, and the solve rate
+- wins by guess count and the average number of guesses to win
+- the most common openers
+- the hardest and easiest answers (at least ``--min-games`` finished games),
+  with their solve rate and average guesses to win
+
+``--per-answer`` adds the full per-answer table.
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import json
+import mmap
+import struct
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+MAGIC = b"WEVT"
+HEADER = struct.Struct("<4sHHQ16x")
+RECORD = struct.Struct("<16sIHHHHBBBB")
+START, GUESS = 0, 1
+WON, LOST = 1, 2
+NO_INDEX = 0xFFFF
+
+if np is not None:
+    RECORD_DTYPE = np.dtype(
+        [
+            ("game", "V16"),
+            ("time", "<u4"),
+            ("bank", "<u2"),
+            ("answer", "<u2"),
+            ("guess", "<u2"),
+            ("pattern", "<u2"),
+            ("kind", "u1"),
+            ("length", "u1"),
+            ("number", "u1"),
+            ("outcome", "u1"),
+        ]
+    )
+    assert RECORD_DTYPE.itemsize == RECORD.size
+
+
+class BankTally:
+    """Counters for the events of one bank snapshot (word length and digest prefix), indexed like its lists."""
+
+    def __init__(self) -> None:
+        self.started = 0
+        self.won: Counter = Counter()
+        self.lost: Counter = Counter()
+        self.win_guesses: Counter = Counter()
+        self.openers: Counter = Counter()
+        self.win_histogram: Counter = Counter()
+
+    def add_arrays(self, kind, answer, guess, number, outcome) -> None:
+        self.started += int(np.count_nonzero(kind == START))
+        guesses = kind == GUESS
+        for target, mask, weights in (
+            (self.won, guesses & (outcome == WON), None),
+            (self.lost, guesses & (outcome == LOST), None),
+            (self.win_guesses, guesses & (outcome == WON), number),
+        ):
+            indexes = answer[mask]
+            counts = np.bincount(indexes, weights=None if weights is None else weights[mask])
+            for index in np.flatnonzero(counts):
+                target[int(index)] += int(counts[index])
+        for source, mask, target in (
+            (guess, guesses & (number == 1), self.openers),
+            (number, guesses & (outcome == WON), self.win_histogram),
+        ):
+            counts = np.bincount(source[mask])
+            for index in np.flatnonzero(counts):
+                target[int(index)] += int(counts[index])
+
+    def add_record(self, kind: int, answer: int, guess: int, number: int, outcome: int) -> None:
+        if kind == START:
+            self.started += 1
+            return
+        if number == 1:
+            self.openers[guess] += 1
+        if outcome == WON:
+            self.won[answer] += 1
+            self.win_guesses[answer] += number
+            self.win_histogram[number] += 1
+        elif outcome == LOST:
+            self.lost[answer] += 1
+
+
+def load_banks(directory: Path) -> dict[tuple[int, int], dict]:
+    banks = {}
+    for path in sorted(directory.glob("bank-*-*.json")):
+        bank = json.loads(path.read_text())
+        key = (int(bank["wordLength"]), int(bank["digest"][:4], 16))
+        if key in banks and banks[key]["digest"] != bank["digest"]:
+            print(f"warning: {path.name} shares a digest prefix with another bank; using the first", file=sys.stderr)
+            continue
+        banks[key] = bank
+    return banks
+
+
+def scan_segment(path: Path, tallies: dict, chunk: int, window: tuple[int, int], pure_python: bool) -> dict:
+    """Fold one segment into ``tallies``; return its record and torn-byte counts."""
+    with path.open("rb") as handle:
+        size = path.stat().st_size
+        if size < HEADER.size:
+            return {"records": 0, "tornBytes": size}
+        magic, version, record_size, _created = HEADER.unpack(handle.read(HEADER.size))
+        if magic != MAGIC or version != 1 or record_size != RECORD.size:
+            raise ValueError(f"{path} is not a version 1 game event segment")
+        count = (size - HEADER.size) // RECORD.size
+        if count == 0:
+            return {"records": 0, "tornBytes": size - HEADER.size}
+        since, until = window
+        for first in range(0, count, chunk):
+            length = min(chunk, count - first)
+            offset = HEADER.size + first * RECORD.size
+            # Map one chunk at a time, so resident pages stay bounded by --chunk rather than the segment size.
+            base = offset - offset % mmap.ALLOCATIONGRANULARITY
+            size_mapped = offset - base + length * RECORD.size
+            with mmap.mmap(handle.fileno(), size_mapped, access=mmap.ACCESS_READ, offset=base) as mapped:
+                if pure_python:
+                    data = mapped[offset - base :]
+                    for _, when, bank, answer, guess, _, kind, word_length, number, outcome in RECORD.iter_unpack(data):
+                        if not since <= when < until or (kind == GUESS and NO_INDEX in (answer, guess)):
+                            continue
+                        tally = tallies.get((word_length, bank))
+                        if tally is None:
+                            tally = tallies[(word_length, bank)] = BankTally()
+                        tally.add_record(kind, answer, guess, number, outcome)
+                    continue
+                records = np.frombuffer(mapped, dtype=RECORD_DTYPE, count=length, offset=offset - base)
+                # Guesses whose answer or word left the bank snapshot cannot be attributed; starts always count.
+                known = (records["answer"] != NO_INDEX) & (records["guess"] != NO_INDEX)
+                keep = (records["time"] >= since) & (records["time"] < until) & ((records["kind"] == START) | known)
+                # Boolean indexing copies, so nothing below holds a view into the map.
+                records = records[keep]
+                keys = records["length"].astype(np.uint32) << 16 | records["bank"]
+                for key in np.unique(keys):
+                    part = records[keys == key]
+                    tally = tallies.get((int(key) >> 16, int(key) & 0xFFFF))
+                    if tally is None:
+                        tally = tallies[(int(key) >> 16, int(key) & 0xFFFF)] = BankTally()
+                    tally.add_arrays(
+                        part["kind"],
+                        part["answer"].astype(np.intp),
+                        part["guess"].astype(np.intp),
+                        part["number"].astype(np.intp),
+                        part["outcome"],
+                    )
+    return {"records": count, "tornBytes": size - HEADER.size - count * RECORD.size}
+
+
+def summarize(word_length: int, tallies: list[tuple[int, BankTally]], banks: dict, args) -> dict:
+    started = 0
+    won: Counter = Counter()
+    lost: Counter = Counter()
+    win_guesses: Counter = Counter()
+    openers: Counter = Counter()
+    histogram: Counter = Counter()
+    for prefix, tally in tallies:
+        bank = banks.get((word_length, prefix))
+
+        def word(index: int, names: str) -> str:
+            words = bank[names] if bank else ()
+            return words[index] if index < len(words) else f"#{index}@{prefix:04x}"
+
+        started += tally.started
+        for source, target in ((tally.won, won), (tally.lost, lost), (tally.win_guesses, win_guesses)):
+            for index, count in source.items():
+                target[word(index, "answers")] += count
+        for index, count in tally.openers.items():
+            openers[word(index, "guesses")] += count
+        histogram.update(tally.win_histogram)
+
+    total_won, total_lost = sum(won.values()), sum(lost.values())
+    answers = []
+    for answer in won.keys() | lost.keys():
+        games = won[answer] + lost[answer]
+        answers.append(
+            {
+                "answer": answer,
+                "games": games,
+                "solveRate": round(won[answer] / games, 4),
+                "averageGuesses": round(win_guesses[answer] / won[answer], 3) if won[answer] else None,
+            }
+        )
+    ranked = sorted(
+        (row for row in answers if row["games"] >= args.min_games),
+        key=lambda row: (row["solveRate"], -(row["averageGuesses"] or 99), row["answer"]),
+    )
+    summary = {
+        "gamesStarted": started,
+        "won": total_won,
+        "lost": total_lost,
+        "solveRate": round(total_won / (total_won + total_lost), 4) if total_won + total_lost else None,
+        "averageGuessesToWin": round(sum(win_guesses.values()) / total_won, 3) if total_won else None,
+        "winsByGuessCount": {str(number): histogram[number] for number in sorted(histogram)},
+        "topOpeners": [
+            {"word": word, "games": count}
+            for word, count in sorted(openers.items(), key=lambda item: (-item[1], item[0]))[: args.top]
+        ],
+        "hardestAnswers": ranked[: args.top],
+        "easiestAnswers": ranked[::-1][: args.top],
+    }
+    if args.per_answer:
+        summary["answers"] = sorted(answers, key=lambda row: row["answer"])
+    return summary
+
+
+def parse_day(text: str) -> int:
+    day = datetime.date.fromisoformat(text)
+    return int(datetime.datetime.combine(day, datetime.time(), datetime.timezone.utc).timestamp())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("directory", type=Path, help="the server's --event-log directory")
+    parser.add_argument("--top", type=int, default=10, help="openers and answers listed per length")
+    parser.add_argument("--min-games", type=int, default=20, help="finished games an answer needs to be ranked")
+    parser.add_argument("--since", type=parse_day, default=0, help="only events on or after this UTC date")
+    parser.add_argument("--until", type=parse_day, default=2**32, help="only events before this UTC date")
+    parser.add_argument("--chunk", type=int, default=1 << 20, help="records counted per step")
+    parser.add_argument("--per-answer", action="store_true", help="include every answer's figures")
+    parser.add_argument("--pure-python", action="store_true", help="do not use NumPy even if it is installed")
+    args = parser.parse_args()
+
+    pure_python = args.pure_python or np is None
+    started = time.perf_counter()
+    banks = load_banks(args.directory)
+    tallies: dict[tuple[int, int], BankTally] = {}
+    segments = sorted(args.directory.glob("events-*.wev"))
+    records = torn = 0
+    for path in segments:
+        result = scan_segment(path, tallies, args.chunk, (args.since, args.until), pure_python)
+        records += result["records"]
+        torn += result["tornBytes"]
+
+    by_length: dict[int, list[tuple[int, BankTally]]] = {}
+    for (word_length, prefix), tally in sorted(tallies.items()):
+        by_length.setdefault(word_length, []).append((prefix, tally))
+    report = {
+        "segments": len(segments),
+        "records": records,
+        "tornBytes": torn,
+        "seconds": round(time.perf_counter() - started, 3),
+        "lengths": {
+            str(word_length): summarize(word_length, parts, banks, args) for word_length, parts in by_length.items()
+        },
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
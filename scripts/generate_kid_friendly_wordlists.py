@@ -8,17 +8,67 @@ Sources (public GitHub raw files):
 - LDNOOBW profanity list
 - zacanger profane-words list
 - dominictarr random-name lists (to remove proper names)
+
+Sources are fetched concurrently into a content-addressed cache under
+``wordlist-cache/sources``. Blobs are named by their SHA-256, and
+``index.json`` records each source's URL, digest, ETag and Last-Modified.
+Later runs revalidate with ``If-None-Match``/``If-Modified-Since``, so
+unchanged sources are not downloaded again. If the network is down, the
+cached copy is used with a warning. ``--offline`` never touches the network.
+It runs from the cache, or from ``--fixtures DIR``, which reads
+``DIR/<source name>`` files through ``file://`` URLs. Sources are parsed line
+by line from the cached files.
+
+Builds are incremental. ``wordlist-cache/build-manifest.json`` records, per
+word length, a hash of everything that decides that length's lists: the
+source digests, the thresholds, and the words of that length in the block and
+filter sets. It also records the hash of each list written. A length is
+rebuilt only when its input hash changed or a target copy no longer matches,
+and ``--force`` rebuilds them all. Changed lists are staged next to every
+target, in ``wordlist/``, the web app and the iOS resources, and are then
+renamed into place together. Android bundles ``wordlist/`` directly.
+Finally, ``wordlist-cache/words-<length>.bin`` is precompiled with
+``server.py``'s own loader, so a server or its ``--watch-wordlists`` reload
+maps the new lists instead of parsing them.
 """
 
 from __future__ import annotations
 
+import argparse
+import contextlib
+import hashlib
+import io
 import json
+import os
 import re
+import sys
+import tempfile
+import time
+import urllib.error
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Iterable, Iterator, TextIO
+
+from _server_import import ROOT, server
 
-ROOT = Path(__file__).resolve().parents[1]
 OUT_DIR = ROOT / "wordlist"
+# android/app/build.gradle adds wordlist/ to its assets, so it needs no copy of its own.
+TARGET_DIRS = (
+    OUT_DIR,
+    ROOT / "web" / "public" / "wordlist",
+    ROOT / "ios" / "Wordle" / "Wordle" / "Resources",
+)
+CACHE_DIR = ROOT / "wordlist-cache" / "sources"
+INDEX_PATH = CACHE_DIR / "index.json"
+MANIFEST_PATH = ROOT / "wordlist-cache" / "build-manifest.json"
+# Bump when the selection code changes in a way the hashed inputs do not capture.
+BUILD_VERSION = 1
+LENGTHS = (3, 4, 6)
+
+# Lower rank == more common.
+GUESS_RANK_THRESHOLD = {3: 30000, 4: 40000, 6: 50000}
+ANSWER_RANK_THRESHOLD = {3: 8000, 4: 12000, 6: 22000}
 
 SOURCES = {
     "dwyl": "https://raw.githubusercontent.com/dwyl/english-words/master/words_alpha.txt",
@@ -164,25 +214,125 @@ NON_PLURAL_S = {
 }
 SAFE_RE = re.compile(r"^[a-z]+$")
 
-
-def fetch(url: str) -> str:
-    with urllib.request.urlopen(url, timeout=60) as response:
-        return response.read().decode("utf-8", errors="ignore")
+# Every set the filters test words against; only the words of the length being built affect it.
+FILTER_SETS = {
+    "customBlock": CUSTOM_BLOCK,
+    "abbreviations": ABBREVIATIONS,
+    "interjections": INTERJECTIONS,
+    "archaic": ARCHAIC,
+    "answerBlock": ANSWER_BLOCK,
+    "nonPluralS": NON_PLURAL_S,
+}
 
 
-def parse_word_lines(blob: str) -> set[str]:
+def blob_path(digest: str) -> Path:
+    return CACHE_DIR / "objects" / digest[:2] / digest
+
+
+def load_index() -> dict[str, dict]:
+    try:
+        return json.loads(INDEX_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def write_json(path: Path, payload: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def store_blob(chunks: Iterable[bytes]) -> tuple[str, int]:
+    """Stream ``chunks`` into the cache; return the blob's SHA-256 and size."""
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    hasher = hashlib.sha256()
+    size = 0
+    with tempfile.NamedTemporaryFile(dir=CACHE_DIR, suffix=".tmp", delete=False) as handle:
+        for chunk in chunks:
+            handle.write(chunk)
+            hasher.update(chunk)
+            size += len(chunk)
+    digest = hasher.hexdigest()
+    path = blob_path(digest)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Same content, same name: an existing blob is already correct.
+    os.replace(handle.name, path)
+    return digest, size
+
+
+def fetch(name: str, url: str, entry: dict | None, offline: bool) -> tuple[dict, str]:
+    """Return the cache entry for ``url`` and how it was obtained, downloading only when needed."""
+    cached = entry is not None and entry.get("url") == url and blob_path(entry["sha256"]).exists()
+    if offline and not url.startswith("file:"):
+        if not cached:
+            raise SystemExit(f"{name}: not in the cache; run once online or pass --fixtures")
+        return entry, "cached"
+    request = urllib.request.Request(url, headers={"User-Agent": "wordle-wordlist-generator"})
+    if cached and not url.startswith("file:"):
+        if entry.get("etag"):
+            request.add_header("If-None-Match", entry["etag"])
+        if entry.get("lastModified"):
+            request.add_header("If-Modified-Since", entry["lastModified"])
+    try:
+        with urllib.request.urlopen(request, timeout=60) as response:
+            digest, size = store_blob(iter(lambda: response.read(1 << 16), b""))
+            headers = response.headers
+    except urllib.error.HTTPError as exc:
+        if exc.code == 304 and cached:
+            return {**entry, "checked": time.time()}, "not modified"
+        raise
+    except (urllib.error.URLError, OSError) as exc:
+        if not cached or url.startswith("file:"):
+            raise
+        print(f"warning: {name}: {exc}; using the cached copy from {time.ctime(entry['fetched'])}", file=sys.stderr)
+        return entry, "stale"
+    now = time.time()
+    fetched = {
+        "url": url,
+        "sha256": digest,
+        "size": size,
+        "etag": headers.get("ETag"),
+        "lastModified": headers.get("Last-Modified"),
+        "fetched": now,
+        "checked": now,
+    }
+    if url.startswith("file:"):
+        return fetched, "fixture"
+    return fetched, "unchanged" if cached and digest == entry["sha256"] else "downloaded"
+
+
+def fetch_all(sources: dict[str, str], offline: bool) -> dict[str, Path]:
+    """Fetch every source concurrently; return the cached file for each."""
+    index = load_index()
+    with ThreadPoolExecutor(max_workers=len(sources)) as pool:
+        futures = {name: pool.submit(fetch, name, url, index.get(name), offline) for name, url in sources.items()}
+        results = {name: future.result() for name, future in futures.items()}
+    for name, (entry, how) in results.items():
+        index[name] = entry
+        print(f"  {name:20s} {how:12s} {entry['size']:>10,d} bytes  {entry['sha256'][:12]}")
+    write_json(INDEX_PATH, index)
+    return {name: blob_path(entry["sha256"]) for name, (entry, _) in results.items()}
+
+
+def read_lines(path: Path) -> Iterator[str]:
+    with path.open(encoding="utf-8", errors="ignore") as handle:
+        yield from handle
+
+
+def parse_word_lines(lines: Iterable[str]) -> set[str]:
     words: set[str] = set()
-    for raw in blob.splitlines():
+    for raw in lines:
         word = raw.strip().lower()
         if SAFE_RE.fullmatch(word):
             words.add(word)
     return words
 
 
-def parse_freq(blob: str) -> dict[str, int]:
+def parse_freq(lines: Iterable[str]) -> dict[str, int]:
     rank_by_word: dict[str, int] = {}
     rank = 0
-    for raw in blob.splitlines():
+    for raw in lines:
         parts = raw.split()
         if not parts:
             continue
@@ -194,8 +344,8 @@ def parse_freq(blob: str) -> dict[str, int]:
     return rank_by_word
 
 
-def parse_json_words(blob: str) -> set[str]:
-    payload = json.loads(blob)
+def parse_json_words(handle: TextIO) -> set[str]:
+    payload = json.load(handle)
     result = set()
     if isinstance(payload, list):
         for item in payload:
@@ -230,51 +380,174 @@ def is_kid_friendly_answer(word: str) -> bool:
     return True
 
 
+def output_names(length: int) -> tuple[str, str]:
+    return f"allowed-guesses-{length}.txt", f"allowed-answers-{length}.txt"
+
+
+def file_digest(path: Path) -> str | None:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def input_digest(length: int, source_digests: dict[str, str]) -> str:
+    """Hash everything that decides the ``length``-letter lists."""
+    inputs = {
+        "version": BUILD_VERSION,
+        "sources": source_digests,
+        "thresholds": [GUESS_RANK_THRESHOLD[length], ANSWER_RANK_THRESHOLD[length]],
+        "sets": {name: sorted(word for word in words if len(word) == length) for name, words in FILTER_SETS.items()},
+    }
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def is_current(length: int, digest: str, manifest: dict) -> bool:
+    """Whether the manifest's build of ``length`` used ``digest`` and every target still holds it."""
+    entry = manifest.get(str(length))
+    if entry is None or entry.get("inputs") != digest:
+        return False
+    return all(
+        file_digest(directory / name) == entry["outputs"].get(name)
+        for directory in TARGET_DIRS
+        for name in output_names(length)
+    )
+
+
+def select_words(
+    length: int,
+    candidates: set[str],
+    dwyl: set[str],
+    enable1: set[str],
+    freq_rank: dict[str, int],
+    profanity: set[str],
+    names: set[str],
+) -> tuple[set[str], set[str]]:
+    base = [w for w in candidates if len(w) == length and is_kid_safe_candidate(w, profanity, names)]
+
+    guesses = {
+        w
+        for w in base
+        if (w in freq_rank and freq_rank[w] <= GUESS_RANK_THRESHOLD[length]) or (w in dwyl and w in enable1)
+    }
+
+    answers = {
+        w
+        for w in guesses
+        if w in freq_rank
+        and freq_rank[w] <= ANSWER_RANK_THRESHOLD[length]
+        and is_kid_friendly_answer(w)
+    }
+
+    # safety: answers must be subset of guesses.
+    answers &= guesses
+    return guesses, answers
+
+
+def write_targets(files: dict[str, bytes]) -> list[Path]:
+    """Write ``files`` into every target directory; return the paths whose contents changed.
+
+    Each changed file is staged as a temp file beside its target first, and
+    only then are all of them renamed into place. A failure while staging
+    leaves every target on its previous lists.
+    """
+    staged: list[tuple[Path, Path]] = []
+    try:
+        for directory in TARGET_DIRS:
+            directory.mkdir(parents=True, exist_ok=True)
+            for name, data in files.items():
+                path = directory / name
+                with contextlib.suppress(OSError):
+                    if path.read_bytes() == data:
+                        continue
+                tmp_path = path.with_name(f".{name}.{os.getpid()}.tmp")
+                tmp_path.write_bytes(data)
+                staged.append((tmp_path, path))
+    except BaseException:
+        for tmp_path, _ in staged:
+            tmp_path.unlink(missing_ok=True)
+        raise
+    for tmp_path, path in staged:
+        os.replace(tmp_path, path)
+    return [path for _, path in staged]
+
+
+def write_bank_index(length: int) -> str:
+    """Precompile the server's ``words-<length>.bin`` for the lists now in ``wordlist/``."""
+    fingerprint = server.WordBank.source_fingerprint(length)
+    if server.WordBank.load_cached(length, fingerprint) is not None:
+        return "current"
+    with contextlib.redirect_stdout(io.StringIO()):
+        bank = server.build_word_bank(length)
+    bank.save_cache(fingerprint)
+    return "written"
+
+
 def main() -> None:
-    print("Downloading source lists...")
-    dwyl = parse_word_lines(fetch(SOURCES["dwyl"]))
-    enable1 = parse_word_lines(fetch(SOURCES["enable1"]))
-    freq_rank = parse_freq(fetch(SOURCES["freq"]))
-    profanity = parse_word_lines(fetch(SOURCES["profanity_ldnoobw"]))
-    profanity |= parse_json_words(fetch(SOURCES["profanity_zacanger"]))
-    profanity |= CUSTOM_BLOCK
-    names = parse_word_lines(fetch(SOURCES["names_first"]))
-    names |= parse_word_lines(fetch(SOURCES["names_all"]))
-
-    all_candidates = dwyl | enable1 | set(freq_rank.keys())
-
-    # Lower rank == more common.
-    guess_rank_threshold = {3: 30000, 4: 40000, 6: 50000}
-    answer_rank_threshold = {3: 8000, 4: 12000, 6: 22000}
-
-    OUT_DIR.mkdir(exist_ok=True)
-
-    for length in (3, 4, 6):
-        base = [w for w in all_candidates if len(w) == length and is_kid_safe_candidate(w, profanity, names)]
-
-        guesses = {
-            w
-            for w in base
-            if (w in freq_rank and freq_rank[w] <= guess_rank_threshold[length]) or (w in dwyl and w in enable1)
-        }
-
-        answers = {
-            w
-            for w in guesses
-            if w in freq_rank
-            and freq_rank[w] <= answer_rank_threshold[length]
-            and is_kid_friendly_answer(w)
-        }
-
-        # safety: answers must be subset of guesses.
-        answers &= guesses
-
-        guess_path = OUT_DIR / f"allowed-guesses-{length}.txt"
-        answer_path = OUT_DIR / f"allowed-answers-{length}.txt"
-        guess_path.write_text("\n".join(sorted(guesses)) + "\n", encoding="utf-8")
-        answer_path.write_text("\n".join(sorted(answers)) + "\n", encoding="utf-8")
-
-        print(f"{length}-letter -> guesses: {len(guesses):5d}, answers: {len(answers):5d}")
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--offline", action="store_true", help="never use the network; run from the source cache")
+    parser.add_argument(
+        "--fixtures", type=Path, help="read each source from DIR/<source name> when that file exists (file:// URLs)"
+    )
+    parser.add_argument("--force", action="store_true", help="rebuild every length even if its inputs are unchanged")
+    args = parser.parse_args()
+
+    sources = dict(SOURCES)
+    if args.fixtures:
+        for name in sources:
+            fixture = args.fixtures / name
+            if fixture.is_file():
+                sources[name] = fixture.resolve().as_uri()
+    started = time.perf_counter()
+    print("Fetching source lists..." if not args.offline else "Reading cached source lists...")
+    paths = fetch_all(sources, args.offline)
+    print(f"Sources ready in {time.perf_counter() - started:.2f}s.")
+
+    # Blobs are named by their SHA-256.
+    source_digests = {name: path.name for name, path in paths.items()}
+    try:
+        manifest = json.loads(MANIFEST_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        manifest = {}
+    digests = {length: input_digest(length, source_digests) for length in LENGTHS}
+    stale = [length for length in LENGTHS if args.force or not is_current(length, digests[length], manifest)]
+    for length in LENGTHS:
+        if length not in stale:
+            print(f"{length}-letter -> up to date")
+
+    if stale:
+        dwyl = parse_word_lines(read_lines(paths["dwyl"]))
+        enable1 = parse_word_lines(read_lines(paths["enable1"]))
+        freq_rank = parse_freq(read_lines(paths["freq"]))
+        profanity = parse_word_lines(read_lines(paths["profanity_ldnoobw"]))
+        with paths["profanity_zacanger"].open(encoding="utf-8", errors="ignore") as handle:
+            profanity |= parse_json_words(handle)
+        profanity |= CUSTOM_BLOCK
+        names = parse_word_lines(read_lines(paths["names_first"]))
+        names |= parse_word_lines(read_lines(paths["names_all"]))
+
+        all_candidates = dwyl | enable1 | set(freq_rank.keys())
+
+        files: dict[str, bytes] = {}
+        for length in stale:
+            guesses, answers = select_words(length, all_candidates, dwyl, enable1, freq_rank, profanity, names)
+            guess_name, answer_name = output_names(length)
+            files[guess_name] = ("\n".join(sorted(guesses)) + "\n").encode("utf-8")
+            files[answer_name] = ("\n".join(sorted(answers)) + "\n").encode("utf-8")
+            manifest[str(length)] = {
+                "inputs": digests[length],
+                "outputs": {name: hashlib.sha256(files[name]).hexdigest() for name in output_names(length)},
+            }
+            print(f"{length}-letter -> guesses: {len(guesses):5d}, answers: {len(answers):5d}")
+
+        changed = write_targets(files)
+        write_json(MANIFEST_PATH, manifest)
+        print(f"Wrote {len(changed)} of {len(files) * len(TARGET_DIRS)} target files.")
+
+    for length in LENGTHS:
+        print(f"{length}-letter index -> {write_bank_index(length)}")
+
+    print(f"Done in {time.perf_counter() - started:.2f}s.")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""Drive realistic game sessions against a local server.py and report per-endpoint latency as JSON.
+
+Each virtual user plays games back to back:
+- ``POST /api/new-game`` (word length drawn from ``--lengths``)
+- up to six ``POST /api/guess`` calls with the session cookie, each followed by
+  ``--state-polls`` ``GET /api/state`` requests
+- about ``--invalid-rate`` of guesses are not words, which exercises the 400 path
+- optional ``--think-ms`` pauses between requests
+
+Users are spread over ``--processes`` client processes, each running threads
+with keep-alive ``http.client`` connections, so the client is not bound by one
+GIL. Unless ``--target`` names a running server, ``server.py`` is started on a
+free port with ``--server MODE`` plus any ``--server-arg`` values, and its
+access log is off.
+
+Requests finished during ``--warmup`` are discarded. The report covers the next
+``--duration`` seconds and gives, for each endpoint and in total: request count,
+throughput, latency p50/p95/p99/max in milliseconds, and responses by status.
+``--save`` writes the report. ``--baseline`` compares it with a saved report and
+exits 1 if throughput drops, or any endpoint's p95 rises, by more than
+``--max-regression``. Runs are reproducible for a given ``--seed``, apart from
+timing.
+"""
+
+from __future__ import annotations
+
+import argparse
+import http.client
+import json
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from _server_import import server, start_server
+
+NEW_GAME = "POST /api/new-game"
+GUESS = "POST /api/guess"
+STATE = "GET /api/state"
+
+
+class VirtualUser:
+    def __init__(self, host: str, port: int, rng: random.Random, options: dict) -> None:
+        self.conn = http.client.HTTPConnection(host, port, timeout=30)
+        self.rng = rng
+        self.options = options
+        self.cookie: str | None = None
+
+    def call(self, endpoint: str, path: str, payload: dict | None, record) -> tuple[int, dict | None]:
+        method = endpoint.split(" ", 1)[0]
+        headers = {"Content-Type": "application/json"}
+        if self.cookie:
+            headers["Cookie"] = self.cookie
+        body = json.dumps(payload).encode("utf-8") if payload is not None else None
+        started = time.perf_counter()
+        try:
+            self.conn.request(method, path, body=body, headers=headers)
+            response = self.conn.getresponse()
+            data = response.read()
+            status = response.status
+        except (OSError, http.client.HTTPException):
+            self.conn.close()
+            record(endpoint, "error", time.perf_counter() - started)
+            return 0, None
+        record(endpoint, status, time.perf_counter() - started)
+        set_cookie = response.getheader("Set-Cookie")
+        if set_cookie:
+            self.cookie = set_cookie.split(";", 1)[0]
+        if self.options["think"]:
+            time.sleep(self.options["think"])
+        return status, (json.loads(data) if data.startswith(b"{") else None)
+
+    def play(self, record) -> str:
+        length = self.rng.choice(self.options["lengths"])
+        status, game = self.call(NEW_GAME, "/api/new-game", {"wordLength": length}, record)
+        if status != 200 or game is None:
+            return "failed"
+        guesses = server.WORD_BANK[length].guesses
+        while game and game.get("status") == "in_progress":
+            if self.rng.random() < self.options["invalid_rate"]:
+                word = "q" * length
+            else:
+                word = guesses[self.rng.randrange(len(guesses))]
+            status, payload = self.call(GUESS, "/api/guess", {"guess": word}, record)
+            if status == 200:
+                game = payload
+            elif status != 400:
+                return "failed"
+            for _ in range(self.options["state_polls"]):
+                self.call(STATE, "/api/state", None, record)
+        return game.get("status", "failed") if game else "failed"
+
+
+def client_process(task: tuple[str, int, int, int, float, float, dict]) -> dict:
+    """Run ``users`` virtual users until the deadline; return raw latencies in ms per endpoint."""
+    host, port, users, seed, measure_from, deadline, options = task
+    latencies: dict[str, list[float]] = {}
+    statuses: dict[str, Counter] = {}
+    outcomes: Counter = Counter()
+    lock = threading.Lock()
+
+    def record(endpoint: str, status, seconds: float) -> None:
+        if time.time() < measure_from:
+            return
+        with lock:
+            statuses.setdefault(endpoint, Counter())[str(status)] += 1
+            latencies.setdefault(endpoint, []).append(seconds * 1e3)
+
+    def user(index: int) -> None:
+        vu = VirtualUser(host, port, random.Random(seed * 100_003 + index), options)
+        while time.time() < deadline:
+            outcome = vu.play(record)
+            if time.time() >= measure_from:
+                with lock:
+                    outcomes[outcome] += 1
+        vu.conn.close()
+
+    threads = [threading.Thread(target=user, args=(index,)) for index in range(users)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return {"latencies": latencies, "statuses": statuses, "outcomes": outcomes}
+
+
+def summarize(latencies: list[float], statuses: Counter, seconds: float) -> dict:
+    ordered = sorted(latencies)
+    cuts = statistics.quantiles(ordered, n=100, method="inclusive") if len(ordered) > 1 else ordered * 99
+    return {
+        "requests": len(ordered),
+        "rps": round(len(ordered) / seconds, 1),
+        "p50Ms": round(cuts[49], 3) if cuts else None,
+        "p95Ms": round(cuts[94], 3) if cuts else None,
+        "p99Ms": round(cuts[98], 3) if cuts else None,
+        "maxMs": round(ordered[-1], 3) if ordered else None,
+        "statuses": dict(sorted(statuses.items())),
+    }
+
+
+def regressions(report: dict, baseline: dict, tolerance: float) -> list[str]:
+    problems = []
+    before, after = baseline["total"]["rps"], report["total"]["rps"]
+    if before and after < before * (1 - tolerance):
+        problems.append(f"throughput {after} rps < baseline {before} rps")
+    for endpoint, stats in report["endpoints"].items():
+        old = baseline["endpoints"].get(endpoint)
+        if old and old.get("p95Ms") and stats["p95Ms"] and stats["p95Ms"] > old["p95Ms"] * (1 + tolerance):
+            problems.append(f"{endpoint} p95 {stats['p95Ms']} ms > baseline {old['p95Ms']} ms")
+    return problems
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--server", default="threading", help="server.py --server mode to start")
+    parser.add_argument(
+        "--server-arg",
+        action="append",
+        default=[],
+        help="extra server.py argument (repeatable), e.g. --server-arg=--sessions=token",
+    )
+    parser.add_argument("--target", help="HOST:PORT of an already running server instead of starting one")
+    parser.add_argument("--concurrency", type=int, default=32, help="virtual users")
+    parser.add_argument("--processes", type=int, default=min(4, os.cpu_count() or 1), help="client processes")
+    parser.add_argument("--duration", type=float, default=20.0, help="measured seconds")
+    parser.add_argument("--warmup", type=float, default=3.0, help="unmeasured seconds before that")
+    parser.add_argument("--lengths", type=int, nargs="+", default=[5], choices=server.SUPPORTED_WORD_LENGTHS)
+    parser.add_argument("--state-polls", type=int, default=1, help="GET /api/state calls after each guess")
+    parser.add_argument("--invalid-rate", type=float, default=0.05, help="fraction of guesses that are not words")
+    parser.add_argument("--think-ms", type=float, default=0.0, help="pause after each response")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--save", type=Path, help="also write the JSON report here")
+    parser.add_argument("--baseline", type=Path, help="saved report to compare against")
+    parser.add_argument("--max-regression", type=float, default=0.2, help="allowed fractional loss vs --baseline")
+    args = parser.parse_args()
+
+    process = None
+    if args.target:
+        host, _, port_text = args.target.rpartition(":")
+        host, port = host or "127.0.0.1", int(port_text)
+    else:
+        process, port = start_server(args.server, args.server_arg)
+        host = "127.0.0.1"
+
+    options = {
+        "lengths": args.lengths,
+        "state_polls": args.state_polls,
+        "invalid_rate": args.invalid_rate,
+        "think": args.think_ms / 1e3,
+    }
+    processes = max(1, min(args.processes, args.concurrency))
+    measure_from = time.time() + args.warmup
+    deadline = measure_from + args.duration
+    tasks = [
+        (host, port, len(range(index, args.concurrency, processes)), args.seed + index, measure_from, deadline, options)
+        for index in range(processes)
+    ]
+    try:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            results = list(pool.map(client_process, tasks))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    latencies: dict[str, list[float]] = {}
+    statuses: dict[str, Counter] = {}
+    outcomes: Counter = Counter()
+    for result in results:
+        for endpoint, values in result["latencies"].items():
+            latencies.setdefault(endpoint, []).extend(values)
+        for endpoint, counts in result["statuses"].items():
+            statuses.setdefault(endpoint, Counter()).update(counts)
+        outcomes.update(result["outcomes"])
+
+    report = {
+        "server": {"target": args.target, "mode": None if args.target else args.server, "args": args.server_arg},
+        "config": {
+            "concurrency": args.concurrency,
+            "processes": processes,
+            "duration": args.duration,
+            "lengths": args.lengths,
+            "statePolls": args.state_polls,
+            "invalidRate": args.invalid_rate,
+            "thinkMs": args.think_ms,
+            "seed": args.seed,
+        },
+        "total": summarize(
+            [value for values in latencies.values() for value in values],
+            sum(statuses.values(), Counter()),
+            args.duration,
+        ),
+        "endpoints": {
+            endpoint: summarize(latencies[endpoint], statuses[endpoint], args.duration)
+            for endpoint in sorted(latencies)
+        },
+        "games": dict(outcomes),
+    }
+    if args.baseline:
+        problems = regressions(report, json.loads(args.baseline.read_text()), args.max_regression)
+        report["regressions"] = problems
+    text = json.dumps(report, indent=2)
+    if args.save:
+        args.save.write_text(text + "\n")
+    print(text)
+    if args.baseline and report["regressions"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
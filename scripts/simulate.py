@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""Self-play every answer through the real game logic and report JSON results.
+
+Each game is a ``server.GameState`` driven through ``apply_guess`` by a guessing
+strategy:
+
+- ``entropy``: the /api/hint engine (``server.hint_for_game``)
+- ``first``: the first answer still consistent with the feedback
+- ``random``: a random answer still consistent with the feedback
+- ``module:function``: any callable taking ``(game, rng)`` and returning a word
+
+Games are spread over a process pool. The output covers, per length, the
+guess-count distribution, the win rate and games per second, plus the commit
+and word-bank digests so runs can be compared across changes.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import importlib
+import io
+import json
+import os
+import random
+import subprocess
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable
+
+from _server_import import ROOT, server
+
+Strategy = Callable[["server.GameState", random.Random], str]
+
+
+def entropy_strategy(game: server.GameState, rng: random.Random) -> str:
+    hint = server.hint_for_game(game)
+    if hint is None:
+        # The engine is cold (spawn and forkserver workers inherit none), and hint_for_game() only
+        # starts warming it in the background; build it here instead.
+        server.get_hint_engine(game.word_length, game.bank).opener()
+        hint = server.hint_for_game(game)
+    return str(hint["guess"])
+
+
+def first_candidate_strategy(game: server.GameState, rng: random.Random) -> str:
+    history = [(row["word"], row["result"]) for row in game.guesses]
+    _count, words = server.remaining_answers(game.word_length, history, limit=1)
+    return words[0]
+
+
+def random_candidate_strategy(game: server.GameState, rng: random.Random) -> str:
+    history = [(row["word"], row["result"]) for row in game.guesses]
+    _count, words = server.remaining_answers(game.word_length, history)
+    return rng.choice(words)
+
+
+STRATEGIES: dict[str, Strategy] = {
+    "entropy": entropy_strategy,
+    "first": first_candidate_strategy,
+    "random": random_candidate_strategy,
+}
+
+
+def resolve_strategy(name: str) -> Strategy:
+    if name in STRATEGIES:
+        return STRATEGIES[name]
+    module_name, _, attr = name.partition(":")
+    if not attr:
+        raise SystemExit(f"Unknown strategy {name!r}; use one of {sorted(STRATEGIES)} or module:function.")
+    return getattr(importlib.import_module(module_name), attr)
+
+
+def play_batch(task: tuple[int, list[str], str, int, str, bool]) -> Counter:
+    """Play each answer in the batch; return a Counter of guess counts (0 = loss)."""
+    word_length, answers, strategy_name, max_guesses, seed, use_table = task
+    strategy = resolve_strategy(strategy_name)
+    bank = server.WORD_BANK[word_length]
+    feedback = server.get_feedback_table(word_length, build=True) if use_table else None
+    rng = random.Random(seed)
+    outcomes: Counter = Counter()
+    for answer in answers:
+        game = server.GameState(answer, bank.guesses, word_length, max_guesses=max_guesses, feedback=feedback)
+        while game.status == "in_progress":
+            game.apply_guess(strategy(game, rng))
+        outcomes[len(game.guesses) if game.status == "won" else 0] += 1
+    return outcomes
+
+
+def git_commit() -> str | None:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True, timeout=10
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip()
+
+
+def simulate_length(args: argparse.Namespace, word_length: int, pool: ProcessPoolExecutor) -> dict[str, object]:
+    answers = list(server.WORD_BANK[word_length].answers)
+    if args.sample and args.sample < len(answers):
+        answers = random.Random(args.seed).sample(answers, args.sample)
+    tasks = [
+        (
+            word_length,
+            answers[start : start + args.batch],
+            args.strategy,
+            args.max_guesses,
+            # Independent of the answer sampling stream, but reproducible per batch.
+            f"{args.seed}:{word_length}:{start}",
+            not args.no_table,
+        )
+        for start in range(0, len(answers), args.batch)
+    ]
+    started = time.perf_counter()
+    outcomes: Counter = Counter()
+    for batch in pool.map(play_batch, tasks):
+        outcomes.update(batch)
+    elapsed = time.perf_counter() - started
+    games = sum(outcomes.values())
+    wins = games - outcomes[0]
+    return {
+        "wordLength": word_length,
+        "bankDigest": server.WORD_BANK[word_length].digest,
+        "games": games,
+        "wins": wins,
+        "winRate": round(wins / games, 4) if games else 0.0,
+        "meanGuessesWhenWon": round(sum(k * v for k, v in outcomes.items()) / wins, 4) if wins else None,
+        "distribution": {str(k): outcomes[k] for k in range(1, args.max_guesses + 1)} | {"lost": outcomes[0]},
+        "seconds": round(elapsed, 3),
+        "gamesPerSecond": round(games / elapsed, 1) if elapsed else None,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--strategy", default="entropy", help=f"one of {sorted(STRATEGIES)} or module:function")
+    parser.add_argument("--length", type=int, action="append", choices=server.SUPPORTED_WORD_LENGTHS)
+    parser.add_argument("--sample", type=int, default=0, help="play a random subset of N answers per length")
+    parser.add_argument("--max-guesses", type=int, default=6)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--batch", type=int, default=64, help="answers per worker task")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-table", action="store_true", help="score with score_guess instead of feedback tables")
+    parser.add_argument("--output", type=Path, help="write JSON here instead of stdout")
+    args = parser.parse_args()
+    resolve_strategy(args.strategy)
+    lengths = args.length or list(server.SUPPORTED_WORD_LENGTHS)
+
+    # Warm shared state before forking so workers inherit it.
+    with contextlib.redirect_stdout(io.StringIO()):
+        for length in lengths:
+            if not args.no_table:
+                server.get_feedback_table(length, build=True)
+            if args.strategy == "entropy" and server.np is not None:
+                server.get_hint_engine(length).opener()
+
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        results = [simulate_length(args, length, pool) for length in lengths]
+    report = {
+        "commit": git_commit(),
+        "strategy": args.strategy,
+        "maxGuesses": args.max_guesses,
+        "workers": args.workers,
+        "feedbackTables": not args.no_table and server.np is not None,
+        "results": results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""Hammer the game registry over HTTP to check guess serialization and throughput.
+
+Starts ``server.WordleHandler`` on an ephemeral port inside this process and runs
+two scenarios against it:
+
+- hot game: many threads post guesses to the same cookie at once. Every game must
+  end with at most ``maxGuesses`` guesses, and the number of accepted (200) guesses
+  must match the final guess count.
+- many games: many threads each play their own games start to finish. This shows
+  that unrelated games do not serialize on a shared lock.
+
+Exits non-zero if any invariant is violated.
+"""
+
+from __future__ import annotations
+
+import argparse
+import http.client
+import json
+import random
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+
+from _server_import import server
+
+
+class QuietHandler(server.WordleHandler):
+    def log_message(self, fmt: str, *args) -> None:
+        pass
+
+
+class StressServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 512
+
+
+def request(conn: http.client.HTTPConnection, method: str, path: str, payload=None, cookie=None):
+    headers = {"Content-Type": "application/json"}
+    if cookie:
+        headers["Cookie"] = cookie
+    body = json.dumps(payload).encode("utf-8") if payload is not None else None
+    conn.request(method, path, body=body, headers=headers)
+    response = conn.getresponse()
+    data = response.read()
+    set_cookie = response.getheader("Set-Cookie")
+    return response.status, (json.loads(data) if data.startswith(b"{") else None), set_cookie
+
+
+def new_game(conn, word_length: int) -> tuple[str, dict]:
+    status, body, set_cookie = request(conn, "POST", "/api/new-game", {"wordLength": word_length})
+    if status != 200 or not set_cookie:
+        raise RuntimeError(f"new-game failed with {status}")
+    return set_cookie.split(";", 1)[0], body
+
+
+def hot_game(port: int, word_length: int, threads: int, rounds: int) -> dict[str, object]:
+    words = list(server.WORD_BANK[word_length].guesses)
+    violations = []
+    accepted_total = 0
+    started = time.perf_counter()
+    for _ in range(rounds):
+        conn = http.client.HTTPConnection("127.0.0.1", port)
+        cookie, game = new_game(conn, word_length)
+        conn.close()
+        barrier = threading.Barrier(threads)
+
+        def worker(_idx: int) -> int:
+            local = http.client.HTTPConnection("127.0.0.1", port)
+            barrier.wait()
+            status, _body, _ = request(local, "POST", "/api/guess", {"guess": random.choice(words)}, cookie)
+            local.close()
+            return 1 if status == 200 else 0
+
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            accepted = sum(pool.map(worker, range(threads)))
+        conn = http.client.HTTPConnection("127.0.0.1", port)
+        _status, final, _ = request(conn, "GET", "/api/state", cookie=cookie)
+        conn.close()
+        accepted_total += accepted
+        if len(final["guesses"]) > game["maxGuesses"] or len(final["guesses"]) != accepted:
+            violations.append({"accepted": accepted, "final": len(final["guesses"]), "status": final["status"]})
+    elapsed = time.perf_counter() - started
+    return {
+        "rounds": rounds,
+        "threadsPerGame": threads,
+        "acceptedGuesses": accepted_total,
+        "violations": violations,
+        "requestsPerSecond": round(rounds * (threads + 2) / elapsed, 1),
+    }
+
+
+def many_games(port: int, word_length: int, threads: int, games_per_thread: int) -> dict[str, object]:
+    words = list(server.WORD_BANK[word_length].guesses)
+    violations = []
+    requests = 0
+    lock = threading.Lock()
+
+    def worker(_idx: int) -> None:
+        nonlocal requests
+        conn = http.client.HTTPConnection("127.0.0.1", port)
+        sent = 0
+        for _ in range(games_per_thread):
+            cookie, game = new_game(conn, word_length)
+            sent += 1
+            accepted = 0
+            while True:
+                status, body, _ = request(conn, "POST", "/api/guess", {"guess": random.choice(words)}, cookie)
+                sent += 1
+                if status != 200:
+                    break
+                accepted += 1
+                if body["status"] != "in_progress":
+                    break
+            if accepted > game["maxGuesses"]:
+                with lock:
+                    violations.append({"accepted": accepted})
+        conn.close()
+        with lock:
+            requests += sent
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(worker, range(threads)))
+    elapsed = time.perf_counter() - started
+    return {
+        "games": threads * games_per_thread,
+        "threads": threads,
+        "requests": requests,
+        "violations": violations,
+        "requestsPerSecond": round(requests / elapsed, 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--length", type=int, default=5, choices=server.SUPPORTED_WORD_LENGTHS)
+    parser.add_argument("--threads", type=int, default=32)
+    parser.add_argument("--rounds", type=int, default=50, help="hot-game rounds")
+    parser.add_argument("--games-per-thread", type=int, default=20)
+    parser.add_argument("--sessions", choices=("memory", "durable", "sqlite"), default="memory")
+    parser.add_argument("--session-db", type=Path, help="SQLite file for durable/sqlite (default: a temp file)")
+    args = parser.parse_args()
+    server.configure_access_log(None)
+    if args.sessions != "memory":
+        db = args.session_db or Path(tempfile.mkdtemp()) / "sessions.sqlite3"
+        server.configure_sessions(args.sessions, db)
+
+    httpd = StressServer(("127.0.0.1", 0), QuietHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    port = httpd.server_address[1]
+    try:
+        report = {
+            "hotGame": hot_game(port, args.length, args.threads, args.rounds),
+            "manyGames": many_games(port, args.length, args.threads, args.games_per_thread),
+            "sessions": server.GAMES.stats(),
+        }
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+        server.GAMES.close()
+    print(json.dumps(report, indent=2))
+    if report["hotGame"]["violations"] or report["manyGames"]["violations"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
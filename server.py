@@ -1,19 +1,77 @@
+import abc
+import argparse
+import asyncio
+import base64
+import bisect
+import contextlib
+import cProfile
+import datetime
+import email.message
+import email.utils
+import functools
+import gzip
+import hashlib
+import heapq
+import hmac
+import html
 import json
+import math
+import mimetypes
+import mmap
+import os
+import queue
 import random
+import signal
+import socket
+import sqlite3
+import struct
 import sys
+import threading
+import time
+import traceback
 import uuid
-from collections import Counter
+import weakref
+from collections import Counter, OrderedDict, deque
+from contextlib import contextmanager
 from http import HTTPStatus
-from http.cookies import SimpleCookie
-from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from http.server import DEFAULT_ERROR_CONTENT_TYPE, DEFAULT_ERROR_MESSAGE, SimpleHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import (
+    Callable,
+    Container,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+    overload,
+)
 import urllib.parse
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; scoring falls back to pure Python.
+    np = None
+
+try:
+    import brotli
+except ImportError:  # Brotli is optional; static assets are then only gzipped.
+    brotli = None
+
+
+T = TypeVar("T")
 
 ROOT = Path(__file__).parent.resolve()
 STATIC_DIR = ROOT / "static"
 WORDLIST_DIR = ROOT / "wordlist"
+# Derived, regenerable artifacts (feedback tables, ...) keyed by word-list digest.
+CACHE_DIR = ROOT / "wordlist-cache"
 
 FALLBACK_WORDS = [
     "apple",
@@ -109,7 +167,8 @@ def has_standard_vowel(word: str) -> bool:
 
 
 def is_allowed_word(word: str, word_length: int) -> bool:
-    if len(word) != word_length or not word.isalpha() or not has_standard_vowel(word):
+    # ASCII only: word banks are packed as ASCII bytes, and isalpha() accepts words like "éclat".
+    if len(word) != word_length or not word.isascii() or not word.isalpha() or not has_standard_vowel(word):
         return False
     if word_length >= 5 and word.endswith("s") and not word.endswith("ss"):
         return False
@@ -122,6 +181,23 @@ def score_word(word: str) -> float:
     return sum(LETTER_FREQUENCY.get(ch, 0.0) for ch in uniques) - duplicate_penalty
 
 
+SYSTEM_WORD_FILES = (
+    Path("/usr/share/dict/words"),
+    Path("/usr/share/dict/web2"),  # macOS supplemental word list
+    Path("/usr/share/dict/web2a"),
+    Path("/usr/share/dict/connectives"),
+    Path("/usr/share/dict/propernames"),
+)
+
+
+def word_list_files(word_length: int) -> Tuple[Path, Path]:
+    """Return the (guesses, answers) list files for ``word_length``."""
+    # Preserve existing 5-letter list behavior; only generated lists are for 3/4/6.
+    if word_length == 5:
+        return WORDLIST_DIR / "allowed-guesses.txt", WORDLIST_DIR / "allowed-answers.txt"
+    return WORDLIST_DIR / f"allowed-guesses-{word_length}.txt", WORDLIST_DIR / f"allowed-answers-{word_length}.txt"
+
+
 def load_words_for_length(word_length: int) -> Dict[str, List[str]]:
     """Load guess/answer lists for a specific word length.
 
@@ -168,14 +244,7 @@ def load_words_for_length(word_length: int) -> Dict[str, List[str]]:
             print(f"Loaded {len(words)} {word_length}-letter words from {label}.")
         return words
 
-    guess_file = WORDLIST_DIR / f"allowed-guesses-{word_length}.txt"
-    answer_file = WORDLIST_DIR / f"allowed-answers-{word_length}.txt"
-
-    # Preserve existing 5-letter list behavior; only generated lists are for 3/4/6.
-    if word_length == 5:
-        guess_file = WORDLIST_DIR / "allowed-guesses.txt"
-        answer_file = WORDLIST_DIR / "allowed-answers.txt"
-
+    guess_file, answer_file = word_list_files(word_length)
     guesses = load_file(guess_file, guess_file.name) if guess_file.exists() else set()
     answers = load_file(answer_file, answer_file.name) if answer_file.exists() else set()
     guesses -= banned_words
@@ -194,15 +263,8 @@ def load_words_for_length(word_length: int) -> Dict[str, List[str]]:
         )
         return {"guesses": sorted(guesses), "answers": sorted(answers)}
 
-    word_files = [
-        Path("/usr/share/dict/words"),
-        Path("/usr/share/dict/web2"),  # macOS supplemental word list
-        Path("/usr/share/dict/web2a"),
-        Path("/usr/share/dict/connectives"),
-        Path("/usr/share/dict/propernames"),
-    ]
     candidates: Set[str] = set()
-    for path in word_files:
+    for path in SYSTEM_WORD_FILES:
         if not path.exists():
             continue
         candidates.update(load_file(path, path.name))
@@ -230,195 +292,3776 @@ def load_words_for_length(word_length: int) -> Dict[str, List[str]]:
     raise RuntimeError(f"No word lists found for {word_length}-letter mode.")
 
 
-WORD_BANK: Dict[int, Dict[str, List[str]]] = {length: load_words_for_length(length) for length in SUPPORTED_WORD_LENGTHS}
+class PackedWords(Sequence[str]):
+    """Immutable sorted list of same-length words packed into a single ASCII buffer.
+
+    Word ``i`` lives at ``data[i * word_length:(i + 1) * word_length]``, so the whole
+    list costs ``word_length`` bytes per word and membership is a binary search.
+    Instances are shared by every game of the same length and never copied.
+    """
+
+    def __init__(self, data: bytes, word_length: int) -> None:
+        if word_length <= 0 or len(data) % word_length:
+            raise ValueError(f"Packed buffer is not a multiple of {word_length} bytes.")
+        self.word_length = word_length
+        self._data = data
+        self._count = len(data) // word_length
+
+    @classmethod
+    def from_words(cls, words: Iterable[str], word_length: int) -> "PackedWords":
+        ordered = sorted(set(words))
+        if any(len(word) != word_length for word in ordered):
+            raise ValueError(f"All words must be exactly {word_length} letters.")
+        return cls("".join(ordered).encode("ascii"), word_length)
+
+    def __len__(self) -> int:
+        return self._count
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[str]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, List[str]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("word index out of range")
+        start = index * self.word_length
+        return self._data[start : start + self.word_length].decode("ascii")
+
+    def __iter__(self) -> Iterator[str]:
+        width = self.word_length
+        data = self._data
+        for start in range(0, len(data), width):
+            yield data[start : start + width].decode("ascii")
+
+    def find(self, word: str) -> int:
+        """Return the index of ``word`` or -1 when it is not in the list."""
+        if len(word) != self.word_length:
+            return -1
+        try:
+            key = word.encode("ascii")
+        except UnicodeEncodeError:
+            return -1
+        width = self.word_length
+        data = self._data
+        idx = bisect.bisect_left(range(self._count), key, key=lambda i: data[i * width : (i + 1) * width])
+        if idx < self._count and data[idx * width : (idx + 1) * width] == key:
+            return idx
+        return -1
+
+    def index(self, word: str, start: int = 0, stop: Optional[int] = None) -> int:
+        idx = self.find(word)
+        if idx < start or (stop is not None and idx >= stop):
+            raise ValueError(f"{word!r} is not in the word list")
+        return idx
+
+    def __contains__(self, word: object) -> bool:
+        return isinstance(word, str) and self.find(word) >= 0
+
+    @property
+    def data(self) -> bytes:
+        """The packed buffer, ``word_length`` ASCII bytes per word (``bytes`` or a read-only ``mmap``)."""
+        return self._data
+
+
+class WordBank:
+    """Shared, read-only guess/answer lists for one word length."""
+
+    # Bump when load_words_for_length changes what it returns for unchanged files.
+    CACHE_VERSION = 1
+    CACHE_MAGIC = b"WBNK"
+    # magic, version, word length, guess count, answer count, guesses offset, answers offset,
+    # word-bank digest, source fingerprint
+    CACHE_HEADER = struct.Struct("<4sHHIIQQ16s20s")
+
+    def __init__(
+        self, word_length: int, guesses: PackedWords, answers: PackedWords, digest: Optional[str] = None
+    ) -> None:
+        self.word_length = word_length
+        self.guesses = guesses
+        self.answers = answers
+        if digest is None:
+            hasher = hashlib.sha1()
+            hasher.update(guesses.data)
+            hasher.update(b"|")
+            hasher.update(answers.data)
+            digest = hasher.hexdigest()[:16]
+        # Identifies the exact list contents; derived caches are keyed on it.
+        self.digest = digest
+        # source_fingerprint() of the files this bank was loaded from, when known.
+        self.fingerprint: Optional[bytes] = None
+
+    @classmethod
+    def from_lists(cls, word_length: int, lists: Dict[str, List[str]]) -> "WordBank":
+        return cls(
+            word_length,
+            guesses=PackedWords.from_words(lists["guesses"], word_length),
+            answers=PackedWords.from_words(lists["answers"], word_length),
+        )
+
+    @staticmethod
+    def cache_path(word_length: int) -> Path:
+        return CACHE_DIR / f"words-{word_length}.bin"
+
+    @classmethod
+    def source_fingerprint(cls, word_length: int) -> bytes:
+        """Hash of the size and mtime of every file ``load_words_for_length`` may read."""
+        hasher = hashlib.sha1(f"{cls.CACHE_VERSION}:{word_length}".encode("ascii"))
+        for path in (*word_list_files(word_length), *SYSTEM_WORD_FILES):
+            try:
+                stat = path.stat()
+            except OSError:
+                hasher.update(f"|{path}:-".encode())
+                continue
+            hasher.update(f"|{path}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+        return hasher.digest()
+
+    @classmethod
+    def load_cached(cls, word_length: int, fingerprint: bytes) -> Optional["WordBank"]:
+        """Memory-map the cached bank, or return ``None`` if it is missing or stale.
+
+        Each list starts on an allocation-granularity boundary so it can be
+        mapped on its own and wrapped by :class:`PackedWords` without copying.
+        """
+        try:
+            with cls.cache_path(word_length).open("rb") as handle:
+                header = handle.read(cls.CACHE_HEADER.size)
+                if len(header) != cls.CACHE_HEADER.size:
+                    return None
+                magic, version, length, guess_count, answer_count, guess_offset, answer_offset, digest, source = (
+                    cls.CACHE_HEADER.unpack(header)
+                )
+                if (magic, version, length, source) != (cls.CACHE_MAGIC, cls.CACHE_VERSION, word_length, fingerprint):
+                    return None
+                lists = [
+                    PackedWords(cls._map(handle, offset, count * word_length), word_length)
+                    for offset, count in ((guess_offset, guess_count), (answer_offset, answer_count))
+                ]
+        except (OSError, ValueError):
+            return None
+        return cls(word_length, lists[0], lists[1], digest=digest.decode("ascii"))
+
+    def save_cache(self, fingerprint: bytes) -> Path:
+        path = self.cache_path(self.word_length)
+        granularity = mmap.ALLOCATIONGRANULARITY
+        guess_offset = granularity
+        answer_offset = guess_offset + -(-len(self.guesses.data) // granularity) * granularity
+        header = self.CACHE_HEADER.pack(
+            self.CACHE_MAGIC,
+            self.CACHE_VERSION,
+            self.word_length,
+            len(self.guesses),
+            len(self.answers),
+            guess_offset,
+            answer_offset,
+            self.digest.encode("ascii"),
+            fingerprint,
+        )
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename so concurrent readers never map a partial file.
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with tmp_path.open("wb") as handle:
+            handle.write(header)
+            handle.seek(guess_offset)
+            handle.write(self.guesses.data)
+            handle.seek(answer_offset)
+            handle.write(self.answers.data)
+        os.replace(tmp_path, path)
+        return path
+
+    @staticmethod
+    def _map(handle, offset: int, size: int) -> Union[bytes, mmap.mmap]:
+        if size == 0:
+            return b""
+        return mmap.mmap(handle.fileno(), size, access=mmap.ACCESS_READ, offset=offset)
+
+
+def build_word_bank(word_length: int) -> WordBank:
+    return WordBank.from_lists(word_length, load_words_for_length(word_length))
+
+
+def load_word_bank(word_length: int) -> WordBank:
+    """Map the cached bank for ``word_length``, rebuilding the cache if the sources changed."""
+    fingerprint = WordBank.source_fingerprint(word_length)
+    bank = WordBank.load_cached(word_length, fingerprint)
+    if bank is None:
+        bank = build_word_bank(word_length)
+        try:
+            bank.save_cache(fingerprint)
+        except OSError as exc:
+            print(f"Could not cache the {word_length}-letter word bank: {exc}")
+    bank.fingerprint = fingerprint
+    return bank
+
+
+class WordBanks(Mapping[int, WordBank]):
+    """Word banks by length, each loaded by :func:`load_word_bank` on first use.
+
+    The current bank of a length is replaced only by :meth:`install`, which
+    swaps in a fully built snapshot with one dict assignment, so readers see
+    either the old bank or the new one. Each install bumps the length's
+    version. The newest ``history`` snapshots stay reachable by digest, so
+    games, stored records and tokens created before a reload keep decoding
+    against the lists they started with.
+    """
+
+    def __init__(self, lengths: Iterable[int], history: int = 4) -> None:
+        self._lengths = tuple(lengths)
+        self._banks: Dict[int, WordBank] = {}
+        self._versions: Dict[int, int] = {}
+        # Newest first, including the current bank.
+        self._history: Dict[int, "deque[WordBank]"] = {length: deque(maxlen=history) for length in self._lengths}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, word_length: int) -> WordBank:
+        bank = self._banks.get(word_length)
+        if bank is not None:
+            return bank
+        if word_length not in self._lengths:
+            raise KeyError(word_length)
+        with self._lock:
+            bank = self._banks.get(word_length)
+            if bank is None:
+                bank = load_word_bank(word_length)
+                self._install(bank)
+        return bank
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._lengths)
+
+    def __len__(self) -> int:
+        return len(self._lengths)
+
+    def loaded(self) -> Dict[int, WordBank]:
+        """Banks loaded so far, without loading the rest."""
+        return dict(self._banks)
+
+    def version(self, word_length: int) -> int:
+        """How many banks of ``word_length`` have been installed: 1 after the first load, +1 per reload."""
+        return self._versions.get(word_length, 0)
+
+    def snapshots(self, word_length: int) -> Tuple[WordBank, ...]:
+        """Retained banks of ``word_length``, newest (current) first."""
+        return tuple(self._history.get(word_length, ()))
+
+    def snapshot(self, word_length: int, digest: str) -> Optional[WordBank]:
+        """The retained bank of ``word_length`` with ``digest``, if any."""
+        for bank in self.snapshots(word_length):
+            if bank.digest == digest:
+                return bank
+        return None
+
+    def install(self, bank: WordBank) -> Optional[WordBank]:
+        """Make ``bank`` current for its length; return the snapshot that aged out of the history."""
+        with self._lock:
+            return self._install(bank)
+
+    def _install(self, bank: WordBank) -> Optional[WordBank]:
+        history = self._history[bank.word_length]
+        for retained in history:
+            if retained.digest == bank.digest:
+                history.remove(retained)
+                break
+        retired = history[-1] if len(history) == history.maxlen else None
+        history.appendleft(bank)
+        self._banks[bank.word_length] = bank
+        self._versions[bank.word_length] = self._versions.get(bank.word_length, 0) + 1
+        return retired
+
+
+WORD_BANK: WordBanks = WordBanks(SUPPORTED_WORD_LENGTHS)
+
+VERDICTS = ("absent", "present", "correct")
+
+
+def score_guess(guess: str, answer: str) -> List[str]:
+    """Return the per-letter verdicts for ``guess`` against ``answer``."""
+    verdicts = ["absent"] * len(guess)
+    remaining = Counter(answer)
+
+    # First pass: mark correct positions.
+    for idx, letter in enumerate(guess):
+        if answer[idx] == letter:
+            verdicts[idx] = "correct"
+            remaining[letter] -= 1
+
+    # Second pass: mark letters present elsewhere.
+    for idx, letter in enumerate(guess):
+        if verdicts[idx] == "correct":
+            continue
+        if remaining[letter] > 0:
+            verdicts[idx] = "present"
+            remaining[letter] -= 1
+
+    return verdicts
+
+
+def encode_verdicts(verdicts: Sequence[str]) -> int:
+    """Pack verdicts into a base-3 pattern; position ``i`` is the ``3**i`` digit."""
+    pattern = 0
+    for idx, verdict in enumerate(verdicts):
+        pattern += VERDICTS.index(verdict) * 3**idx
+    return pattern
+
+
+@functools.lru_cache(maxsize=None)
+def decode_pattern(pattern: int, word_length: int) -> Tuple[str, ...]:
+    verdicts = []
+    for _ in range(word_length):
+        pattern, digit = divmod(pattern, 3)
+        verdicts.append(VERDICTS[digit])
+    return tuple(verdicts)
+
+
+def pattern_dtype(word_length: int):
+    return np.uint8 if 3**word_length <= 256 else np.uint16
+
+
+def build_feedback_matrix(guesses: PackedWords, answers: PackedWords, chunk_cells: int = 1 << 22):
+    """Score every guess against every answer, returning an answers x guesses pattern matrix.
+
+    Uses the same rules as :func:`score_guess`: greens first, then each remaining
+    guess letter (left to right) is yellow while unmatched copies of it remain in
+    the answer.
+    """
+    word_length = guesses.word_length
+    guess_letters = np.frombuffer(guesses.data, dtype=np.uint8).reshape(-1, word_length)
+    answer_letters = np.frombuffer(answers.data, dtype=np.uint8).reshape(-1, word_length)
+    # letter_counts[c, a]: copies of byte ``c`` in answer ``a``.
+    letter_counts = np.zeros((256, len(answers)), dtype=np.int8)
+    for k in range(word_length):
+        np.add.at(letter_counts, (answer_letters[:, k], np.arange(len(answers))), 1)
+
+    matrix = np.empty((len(answers), len(guesses)), dtype=pattern_dtype(word_length))
+    step = max(1, chunk_cells // max(1, len(answers)))
+    for start in range(0, len(guesses), step):
+        g = guess_letters[start : start + step]
+        green = [g[:, k, None] == answer_letters[None, :, k] for k in range(word_length)]
+        pattern = np.zeros((len(g), len(answers)), dtype=np.uint16)
+        for i in range(word_length):
+            same = [(g[:, k] == g[:, i])[:, None] for k in range(word_length)]
+            # Copies of this letter in the answer not already claimed by a green ...
+            available = letter_counts[g[:, i]].copy()
+            for k in range(word_length):
+                available -= same[k] & green[k]
+            # ... minus those claimed by earlier non-green guess positions.
+            for j in range(i):
+                available -= same[j] & ~green[j]
+            yellow = ~green[i] & (available > 0)
+            pattern += (2 * green[i] + yellow).astype(np.uint16) * 3**i
+        matrix[:, start : start + step] = pattern.T
+    return matrix
+
+
+class FeedbackTable:
+    """Precomputed guess x answer feedback patterns for one :class:`WordBank`.
+
+    ``matrix[a, g]`` is the base-3 pattern (see :func:`encode_verdicts`) for
+    ``bank.guesses[g]`` against ``bank.answers[a]``. Rows are answers so that the
+    patterns for a set of candidate answers are a contiguous row gather. Tables
+    are persisted as ``.npy`` files under ``CACHE_DIR`` and memory-mapped, so
+    processes share pages.
+    """
+
+    def __init__(self, bank: WordBank, matrix) -> None:
+        self.bank = bank
+        self.word_length = bank.word_length
+        self.matrix = matrix
+
+    @staticmethod
+    def path_for(bank: WordBank) -> Path:
+        return CACHE_DIR / f"patterns-{bank.word_length}-{bank.digest}.npy"
+
+    @classmethod
+    def load(cls, bank: WordBank) -> Optional["FeedbackTable"]:
+        path = cls.path_for(bank)
+        try:
+            matrix = np.load(path, mmap_mode="r")
+        except (OSError, ValueError):
+            return None
+        if matrix.shape != (len(bank.answers), len(bank.guesses)):
+            return None
+        return cls(bank, matrix)
+
+    @classmethod
+    def build(cls, bank: WordBank) -> "FeedbackTable":
+        matrix = build_feedback_matrix(bank.guesses, bank.answers)
+        path = cls.path_for(bank)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename so concurrent readers never map a partial file.
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with tmp_path.open("wb") as handle:
+            np.save(handle, matrix)
+        os.replace(tmp_path, path)
+        return cls.load(bank) or cls(bank, matrix)
+
+    def pattern(self, guess_index: int, answer_index: int) -> int:
+        return int(self.matrix[answer_index, guess_index])
+
+
+_FEEDBACK_TABLES: Dict[str, FeedbackTable] = {}
+# Digest -> event set when that bank's load or build finishes. The lock guards these two
+# dicts only; the build itself runs outside it.
+_FEEDBACK_BUILDS: Dict[str, threading.Event] = {}
+_FEEDBACK_LOCK = threading.Lock()
+
+
+def get_feedback_table(
+    word_length: int, build: bool = False, bank: Optional[WordBank] = None
+) -> Optional[FeedbackTable]:
+    """Return the feedback table for ``bank``, by default the current bank of ``word_length``.
+
+    Without ``build`` this is a lock-free lookup that returns ``None`` until the
+    table has been loaded, so request paths never wait and games score with
+    :func:`score_guess` meanwhile. With ``build=True`` a persisted table is
+    loaded, or a missing one computed and written to disk; concurrent callers
+    for the same bank wait for that one build. Always ``None`` when NumPy is
+    unavailable.
+    """
+    if np is None:
+        return None
+    if bank is None:
+        bank = WORD_BANK[word_length]
+    table = _FEEDBACK_TABLES.get(bank.digest)
+    if table is not None or not build:
+        return table
+    with _FEEDBACK_LOCK:
+        table = _FEEDBACK_TABLES.get(bank.digest)
+        if table is not None:
+            return table
+        done = _FEEDBACK_BUILDS.get(bank.digest)
+        owner = done is None
+        if owner:
+            done = _FEEDBACK_BUILDS[bank.digest] = threading.Event()
+    if not owner:
+        done.wait()
+        return _FEEDBACK_TABLES.get(bank.digest)
+    try:
+        table = FeedbackTable.load(bank) or FeedbackTable.build(bank)
+        _FEEDBACK_TABLES[bank.digest] = table
+    finally:
+        with _FEEDBACK_LOCK:
+            del _FEEDBACK_BUILDS[bank.digest]
+        done.set()
+    return table
+
+
+def warm_feedback_tables() -> None:
+    """Load or build the feedback table for every supported length."""
+    if np is None:
+        print("NumPy not installed; scoring guesses without feedback tables.")
+        return
+    for length in SUPPORTED_WORD_LENGTHS:
+        started = time.perf_counter()
+        table = get_feedback_table(length, build=True)
+        if table is not None:
+            print(
+                f"Feedback table ready for {length}-letter games "
+                f"({table.matrix.shape[1]}x{table.matrix.shape[0]}, {time.perf_counter() - started:.2f}s)."
+            )
 
 
 class GameState:
-    def __init__(self, answer: str, allowed_guesses: Set[str], word_length: int, max_guesses: int = 6) -> None:
-        self.id = str(uuid.uuid4())
+    def __init__(
+        self,
+        answer: str,
+        allowed_guesses: Container[str],
+        word_length: int,
+        max_guesses: int = 6,
+        feedback: Optional[FeedbackTable] = None,
+        game_id: Optional[str] = None,
+        answer_index: Optional[int] = None,
+        bank: Optional[WordBank] = None,
+    ) -> None:
+        self.id = game_id or str(uuid.uuid4())
         self.answer = answer
         self.allowed_guesses = allowed_guesses
         self.word_length = word_length
         self.max_guesses = max_guesses
+        self.feedback = feedback
+        # The word-bank snapshot the game started on; hot reloads do not move it to a newer one.
+        self.bank = bank if bank is not None else (feedback.bank if feedback else None)
+        if answer_index is None:
+            answer_index = feedback.bank.answers.find(answer) if feedback else -1
+        # Index into feedback.bank.answers, or -1 when scoring without a table.
+        self.answer_index = answer_index if feedback else -1
         self.guesses: List[Dict[str, object]] = []
         self.status = "in_progress"
+        # Puzzle number when this is a /api/daily game, else None.
+        self.daily: Optional[int] = None
+        # Serializes guesses from concurrent handler threads on the same game.
+        self.lock = threading.RLock()
+        # JSON for each row of ``guesses`` and for the fixed fields, reused by encode_response().
+        self._encoded_rows: List[bytes] = []
+        self._encoded_head: Tuple[str, bytes, bytes] = ("", b"", b"")
 
     def to_response(self) -> Dict[str, object]:
-        response = {
-            "id": self.id,
-            "status": self.status,
-            "maxGuesses": self.max_guesses,
-            "wordLength": self.word_length,
-            "guesses": self.guesses,
-        }
-        if self.status != "in_progress":
-            response["answer"] = self.answer
-        return response
+        with self.lock:
+            response = {
+                "id": self.id,
+                "status": self.status,
+                "maxGuesses": self.max_guesses,
+                "wordLength": self.word_length,
+                "guesses": list(self.guesses),
+            }
+            if self.status != "in_progress":
+                response["answer"] = self.answer
+            return response
+
+    def encode_response(self) -> bytes:
+        """Return ``json.dumps(self.to_response())`` encoded, without re-serializing history.
+
+        Each guess row is serialized once, the first time it is sent, so a
+        response is a join of cached byte strings. Rows are only ever appended
+        to ``guesses``; if the list is replaced by a shorter one the cache is
+        rebuilt.
+        """
+        with self.lock:
+            rows = self._encoded_rows
+            if len(rows) > len(self.guesses):
+                rows.clear()
+            for row in self.guesses[len(rows) :]:
+                rows.append(json.dumps(row).encode("utf-8"))
+            game_id, head, middle = self._encoded_head
+            if game_id != self.id:
+                head = f'{{"id": {json.dumps(self.id)}, "status": "'.encode("utf-8")
+                middle = f'", "maxGuesses": {self.max_guesses}, "wordLength": {self.word_length}, "guesses": ['.encode()
+                self._encoded_head = (self.id, head, middle)
+            parts = [head, self.status.encode("ascii"), middle, b", ".join(rows)]
+            if self.status == "in_progress":
+                parts.append(b"]}")
+            else:
+                parts += [b'], "answer": ', json.dumps(self.answer).encode("utf-8"), b"}"]
+            return b"".join(parts)
 
     def apply_guess(self, guess: str) -> Dict[str, object]:
+        with self.lock:
+            self._record_guess(guess)
+            return self.to_response()
+
+    def apply_guess_encoded(self, guess: str) -> bytes:
+        """Like :meth:`apply_guess`, but return the response as :meth:`encode_response` bytes."""
+        with self.lock:
+            self._record_guess(guess)
+            return self.encode_response()
+
+    def _record_guess(self, guess: str) -> None:
         guess = guess.lower().strip()
-        if self.status != "in_progress":
-            raise ValueError("Game is already finished. Start a new game.")
-        if len(guess) != self.word_length or not guess.isalpha():
-            raise ValueError(f"Guesses must be exactly {self.word_length} letters.")
-        if guess not in self.allowed_guesses:
-            raise ValueError("Guess must be a valid word from the list.")
-
-        result = self._score_guess(guess)
-        self.guesses.append({"word": guess, "result": result})
-
-        if guess == self.answer:
-            self.status = "won"
-        elif len(self.guesses) >= self.max_guesses:
-            self.status = "lost"
-
-        return self.to_response()
-
-    def _score_guess(self, guess: str) -> List[str]:
-        verdicts = ["absent"] * self.word_length
-        remaining = Counter(self.answer)
-
-        # First pass: mark correct positions.
-        for idx, letter in enumerate(guess):
-            if self.answer[idx] == letter:
-                verdicts[idx] = "correct"
-                remaining[letter] -= 1
-
-        # Second pass: mark letters present elsewhere.
-        for idx, letter in enumerate(guess):
-            if verdicts[idx] == "correct":
-                continue
-            if remaining[letter] > 0:
-                verdicts[idx] = "present"
-                remaining[letter] -= 1
+        with self.lock:
+            if self.status != "in_progress":
+                raise ValueError("Game is already finished. Start a new game.")
+            if len(guess) != self.word_length or not guess.isalpha():
+                raise ValueError(f"Guesses must be exactly {self.word_length} letters.")
+            if guess not in self.allowed_guesses:
+                raise ValueError("Guess must be a valid word from the list.")
 
-        return verdicts
+            guess_index = self.feedback.bank.guesses.find(guess) if self.answer_index >= 0 else -1
+            result = self._score_guess(guess, guess_index)
+            self.guesses.append({"word": guess, "result": result})
 
+            if guess == self.answer:
+                self.status = "won"
+            elif len(self.guesses) >= self.max_guesses:
+                self.status = "lost"
+            GAME_STATS.guess(self.word_length, guess, len(self.guesses), self.status)
+            if EVENT_LOG is not None:
+                EVENT_LOG.guess(self, guess, result, guess_index)
 
-GAMES: Dict[str, GameState] = {}
+    def to_record(self) -> Dict[str, object]:
+        """Full game state, including the answer, for session backends."""
+        with self.lock:
+            record = {
+                "id": self.id,
+                "answer": self.answer,
+                "wordLength": self.word_length,
+                "maxGuesses": self.max_guesses,
+                "status": self.status,
+                "guesses": [dict(row) for row in self.guesses],
+            }
+            if self.bank is not None:
+                record["bank"] = self.bank.digest
+            if self.daily is not None:
+                record["daily"] = self.daily
+            return record
 
+    @classmethod
+    def from_record(cls, record: Mapping[str, object]) -> "GameState":
+        word_length = int(record["wordLength"])
+        # Resume on the snapshot the game started on while it is retained, else on the current lists.
+        bank = WORD_BANK.snapshot(word_length, str(record.get("bank", ""))) or WORD_BANK[word_length]
+        game = cls(
+            answer=str(record["answer"]),
+            allowed_guesses=bank.guesses,
+            word_length=word_length,
+            max_guesses=int(record["maxGuesses"]),
+            feedback=get_feedback_table(word_length, bank=bank),
+            bank=bank,
+        )
+        game.id = str(record["id"])
+        game.status = str(record["status"])
+        game.guesses = [dict(row) for row in record["guesses"]]
+        daily = record.get("daily")
+        game.daily = int(daily) if daily is not None else None
+        return game
 
-def pick_word(word_length: int) -> str:
-    return random.choice(WORD_BANK[word_length]["answers"])
+    def _score_guess(self, guess: str, guess_index: Optional[int] = None) -> List[str]:
+        if self.answer_index >= 0:
+            if guess_index is None:
+                guess_index = self.feedback.bank.guesses.find(guess)
+            if guess_index >= 0:
+                pattern = self.feedback.pattern(guess_index, self.answer_index)
+                return list(decode_pattern(pattern, self.word_length))
+        return score_guess(guess, self.answer)
 
 
-class WordleHandler(SimpleHTTPRequestHandler):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, directory=str(STATIC_DIR), **kwargs)
+# Largest sample of remaining answers /api/remaining will return.
+REMAINING_SAMPLE_LIMIT = 50
 
-    def do_GET(self) -> None:
-        parsed = urllib.parse.urlparse(self.path)
-        if parsed.path == "/api/state":
-            self._handle_state()
-            return
-        super().do_GET()
 
-    def do_POST(self) -> None:
-        parsed = urllib.parse.urlparse(self.path)
-        if parsed.path == "/api/new-game":
-            self._handle_new_game()
-            return
-        if parsed.path == "/api/guess":
-            self._handle_guess()
-            return
-        self.send_error(HTTPStatus.NOT_FOUND, "Unknown endpoint")
+class LetterIndex:
+    """Bitset index over a bank's answers for filtering by guess feedback.
 
-    def _handle_state(self) -> None:
-        game = self._get_game_from_cookie()
-        if not game:
-            self.send_error(HTTPStatus.NOT_FOUND, "No active game")
-            return
-        self._write_json(game.to_response())
+    Bit ``a`` of ``positions[i][c]`` is set when ``answers[a][i] == c`` and bit
+    ``a`` of ``at_least[c][k]`` when answer ``a`` has at least ``k`` copies of
+    ``c``. A guess history reduces to the still-possible answers with a handful
+    of integer ANDs, following the same rules as :func:`score_guess`.
+    """
 
-    def _handle_new_game(self) -> None:
-        length = int(self.headers.get("Content-Length", "0"))
-        raw_body = self.rfile.read(length) if length else b""
-        try:
-            payload = json.loads(raw_body) if raw_body else {}
-        except json.JSONDecodeError:
-            self.send_error(HTTPStatus.BAD_REQUEST, "Invalid JSON body")
+    def __init__(self, bank: WordBank) -> None:
+        self.bank = bank
+        length = bank.word_length
+        self.all = (1 << len(bank.answers)) - 1
+        self.positions: List[Dict[str, int]] = [{} for _ in range(length)]
+        self.at_least: Dict[str, List[int]] = {}
+        for idx, word in enumerate(bank.answers):
+            bit = 1 << idx
+            for pos, letter in enumerate(word):
+                self.positions[pos][letter] = self.positions[pos].get(letter, 0) | bit
+            for letter, count in Counter(word).items():
+                levels = self.at_least.setdefault(letter, [self.all] + [0] * length)
+                for k in range(1, count + 1):
+                    levels[k] |= bit
+
+    def filter(self, history: Iterable[Tuple[str, Sequence[str]]], mask: Optional[int] = None) -> int:
+        """Return the bitmask of answers consistent with every ``(word, verdicts)``."""
+        mask = self.all if mask is None else mask
+        for word, verdicts in history:
+            known: Counter = Counter()
+            capped: Set[str] = set()
+            for pos, (letter, verdict) in enumerate(zip(word, verdicts)):
+                at_pos = self.positions[pos].get(letter, 0)
+                if verdict == "correct":
+                    mask &= at_pos
+                    known[letter] += 1
+                else:
+                    mask &= ~at_pos
+                    if verdict == "present":
+                        known[letter] += 1
+                    else:
+                        capped.add(letter)
+            for letter in set(word):
+                levels = self.at_least.get(letter)
+                count = known[letter]
+                if levels is None:
+                    if count:
+                        return 0
+                    continue
+                if count:
+                    mask &= levels[count] if count < len(levels) else 0
+                if letter in capped and count + 1 < len(levels):
+                    # An absent copy means the answer has exactly ``count`` of this letter.
+                    mask &= ~levels[count + 1]
+        return mask
+
+    def words(self, mask: int, limit: Optional[int] = None) -> List[str]:
+        """Answers whose bits are set in ``mask``, in list order."""
+        words: List[str] = []
+        while mask and (limit is None or len(words) < limit):
+            low = mask & -mask
+            words.append(self.bank.answers[low.bit_length() - 1])
+            mask ^= low
+        return words
+
+
+_LETTER_INDEXES: Dict[str, LetterIndex] = {}
+
+
+def get_letter_index(bank: WordBank) -> LetterIndex:
+    index = _LETTER_INDEXES.get(bank.digest)
+    if index is None:
+        index = _LETTER_INDEXES.setdefault(bank.digest, LetterIndex(bank))
+    return index
+
+
+def remaining_answers(
+    word_length: int, history: Iterable[Tuple[str, Sequence[str]]], limit: Optional[int] = None
+) -> Tuple[int, List[str]]:
+    """Count the answers still possible after ``history`` and list up to ``limit`` of them."""
+    index = get_letter_index(WORD_BANK[word_length])
+    mask = index.filter(history)
+    return mask.bit_count(), index.words(mask, limit)
+
+
+def remaining_for_game(game: GameState, sample: int = 0) -> Dict[str, object]:
+    with game.lock:
+        history = [(str(row["word"]), list(row["result"])) for row in game.guesses]
+    index = get_letter_index(game.bank or WORD_BANK[game.word_length])
+    mask = index.filter(history)
+    response: Dict[str, object] = {"remaining": mask.bit_count()}
+    if sample > 0:
+        response["sample"] = index.words(mask, min(sample, REMAINING_SAMPLE_LIMIT))
+    return response
+
+
+# Upper bound on (candidate x guess) cells scored per hint request.
+HINT_CELL_BUDGET = 1 << 20
+HINT_MEMO_SIZE = 4096
+# Guesses scored per hint by the pure-Python fallback.
+HINT_FALLBACK_BUDGET = 20_000
+# Seconds a client is asked to wait when /api/hint arrives before the hint engine is warm.
+HINT_RETRY_AFTER = 1
+
+
+class HintEngine:
+    """Entropy-maximizing guess suggestions backed by a :class:`FeedbackTable`.
+
+    For a feedback history the candidate answers are the rows whose pattern
+    matches every guess so far. Each guess column is then bucketed by pattern in
+    one ``bincount`` and scored by the Shannon entropy of the buckets. When
+    ``guesses x max(candidates, patterns)`` exceeds ``HINT_CELL_BUDGET``, only
+    the best openers (ranked once per bank) are scored. The opener is computed
+    once and later results are memoized by feedback history.
+    """
+
+    def __init__(self, table: FeedbackTable) -> None:
+        self.table = table
+        self.bank = table.bank
+        self.patterns = 3**table.word_length
+        self.answer_guess_index = np.array([self.bank.guesses.find(word) for word in self.bank.answers], dtype=np.int64)
+        self._opener: Optional[Dict[str, object]] = None
+        self._ranked = None
+        self._memo: "OrderedDict[Tuple[Tuple[int, int], ...], Dict[str, object]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def ready(self) -> bool:
+        """Whether the opener, which every later hint may rank against, has been computed."""
+        return self._opener is not None
+
+    def candidates(self, history: Sequence[Tuple[int, int]]):
+        """Answer indices consistent with every ``(guess_index, pattern)`` in ``history``."""
+        mask = np.ones(len(self.bank.answers), dtype=bool)
+        for guess_index, pattern in history:
+            mask &= self.table.matrix[:, guess_index] == pattern
+        return np.flatnonzero(mask)
+
+    def entropies(self, candidates, pool=None):
+        """Expected information (bits) of each guess in ``pool`` (default: all guesses)."""
+        if pool is None:
+            rows = np.asarray(self.table.matrix[candidates])
+        else:
+            rows = np.asarray(self.table.matrix[np.ix_(candidates, pool)])
+        width = rows.shape[1]
+        keys = rows.astype(np.int32) + np.arange(width, dtype=np.int32) * self.patterns
+        counts = np.bincount(keys.ravel(), minlength=width * self.patterns).reshape(width, self.patterns)
+        sizes = np.arange(len(candidates) + 1, dtype=np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            weight = np.nan_to_num(sizes * np.log2(sizes))
+        total = float(len(candidates))
+        return np.log2(total) - weight[counts].sum(axis=1) / total
+
+    def opener(self) -> Dict[str, object]:
+        with self._lock:
+            if self._opener is None:
+                candidates = np.arange(len(self.bank.answers))
+                scores = self.entropies(candidates)
+                self._ranked = np.argsort(-scores, kind="stable")
+                best = int(self._ranked[0])
+                self._opener = self._hint(best, float(scores[best]), len(candidates))
+            return self._opener
+
+    def suggest(self, history: Sequence[Tuple[int, int]]) -> Dict[str, object]:
+        if not history:
+            return self.opener()
+        key = tuple(history)
+        with self._lock:
+            cached = self._memo.get(key)
+            if cached is not None:
+                self._memo.move_to_end(key)
+                return cached
+
+        candidates = self.candidates(history)
+        if len(candidates) == 0:
+            raise ValueError("No answers match the guesses so far.")
+        candidate_guesses = self.answer_guess_index[candidates]
+        if len(candidates) <= 2:
+            result = self._hint(int(candidate_guesses[0]), float(len(candidates) - 1), len(candidates))
+        else:
+            pool = None
+            limit = HINT_CELL_BUDGET // max(len(candidates), self.patterns)
+            if limit < len(self.bank.guesses):
+                self.opener()
+                pool = np.union1d(self._ranked[:limit], candidate_guesses[: max(1, limit // 4)])
+            scores = self.entropies(candidates, pool)
+            guess_ids = pool if pool is not None else np.arange(len(self.bank.guesses))
+            # Among equally informative guesses, prefer one that could win outright.
+            scores = scores + np.isin(guess_ids, candidate_guesses) * 1e-6
+            best = int(np.argmax(scores))
+            result = self._hint(int(guess_ids[best]), float(scores[best]), len(candidates))
+
+        with self._lock:
+            self._memo[key] = result
+            if len(self._memo) > HINT_MEMO_SIZE:
+                self._memo.popitem(last=False)
+        return result
+
+    def _hint(self, guess_index: int, entropy: float, remaining: int) -> Dict[str, object]:
+        return {"guess": self.bank.guesses[guess_index], "entropy": round(entropy, 4), "remaining": remaining}
+
+
+_HINT_ENGINES: Dict[str, HintEngine] = {}
+# Digests of banks whose engine is being warmed by warm_hint_engine_async().
+_HINT_WARMING: Set[str] = set()
+_HINT_WARMING_LOCK = threading.Lock()
+
+
+def get_hint_engine(word_length: int, bank: Optional[WordBank] = None) -> Optional[HintEngine]:
+    table = get_feedback_table(word_length, build=True, bank=bank)
+    if table is None:
+        return None
+    engine = _HINT_ENGINES.get(table.bank.digest)
+    if engine is None:
+        engine = _HINT_ENGINES.setdefault(table.bank.digest, HintEngine(table))
+    return engine
+
+
+def warm_hint_engine_async(word_length: int, bank: WordBank) -> None:
+    """Build ``bank``'s feedback table and opener on a background thread, once at a time per bank."""
+    with _HINT_WARMING_LOCK:
+        if bank.digest in _HINT_WARMING:
             return
+        _HINT_WARMING.add(bank.digest)
 
-        requested_length = payload.get("wordLength", 5)
+    def warm() -> None:
         try:
-            word_length = int(requested_length)
-        except (TypeError, ValueError):
-            self.send_error(HTTPStatus.BAD_REQUEST, "wordLength must be an integer")
-            return
-        if word_length not in SUPPORTED_WORD_LENGTHS:
-            self.send_error(HTTPStatus.BAD_REQUEST, "Unsupported word length")
-            return
+            engine = get_hint_engine(word_length, bank)
+            if engine is not None:
+                engine.opener()
+        finally:
+            with _HINT_WARMING_LOCK:
+                _HINT_WARMING.discard(bank.digest)
 
-        bank = WORD_BANK[word_length]
-        game = GameState(
-            answer=pick_word(word_length),
-            allowed_guesses=set(bank["guesses"]),
-            word_length=word_length,
+    threading.Thread(target=warm, name=f"hint-warmup-{word_length}", daemon=True).start()
+
+
+def suggest_guess_slow(bank: WordBank, history: Sequence[Tuple[str, Sequence[str]]]) -> Dict[str, object]:
+    """Pure-Python hint used without NumPy: scores a sample of candidate guesses."""
+    index = get_letter_index(bank)
+    candidates = index.words(index.filter(history))
+    if not candidates:
+        raise ValueError("No answers match the guesses so far.")
+    pool = candidates[: max(1, HINT_FALLBACK_BUDGET // len(candidates))]
+    best_word, best_entropy = candidates[0], -1.0
+    for word in pool:
+        buckets = Counter(encode_verdicts(score_guess(word, answer)) for answer in candidates)
+        entropy = -sum(count / len(candidates) * math.log2(count / len(candidates)) for count in buckets.values())
+        if entropy > best_entropy:
+            best_word, best_entropy = word, entropy
+    return {"guess": best_word, "entropy": round(best_entropy, 4), "remaining": len(candidates)}
+
+
+def hint_for_game(game: GameState) -> Optional[Dict[str, object]]:
+    """Suggest the most informative next guess for ``game``.
+
+    Returns ``None`` while the game's hint engine is still warming up. The
+    feedback table and opener take seconds to build, so they are built on a
+    background thread, never on the calling (request) thread.
+    """
+    with game.lock:
+        if game.status != "in_progress":
+            raise ValueError("Game is already finished. Start a new game.")
+        history = [(str(row["word"]), list(row["result"])) for row in game.guesses]
+    bank = game.bank or WORD_BANK[game.word_length]
+    if np is None:
+        return suggest_guess_slow(bank, history)
+    engine = _HINT_ENGINES.get(bank.digest)
+    if engine is None or not engine.ready:
+        warm_hint_engine_async(game.word_length, bank)
+        return None
+    if engine.bank.guesses is not game.allowed_guesses:
+        return suggest_guess_slow(bank, history)
+    return engine.suggest([(engine.bank.guesses.find(word), encode_verdicts(result)) for word, result in history])
+
+
+def warm_solver() -> None:
+    """Background startup work: feedback tables, then each length's hint opener."""
+    warm_feedback_tables()
+    if np is None:
+        return
+    for length in SUPPORTED_WORD_LENGTHS:
+        engine = get_hint_engine(length)
+        if engine is not None:
+            engine.opener()
+
+
+_RELOAD_LOCK = threading.Lock()
+
+
+def reload_word_bank(word_length: int) -> Optional[WordBank]:
+    """Rebuild the bank of ``word_length`` from its word lists and swap it in if the contents changed.
+
+    Everything slow happens before the swap, on the calling thread: parsing the
+    lists (and rewriting the ``words-*.bin`` cache), the feedback table, the
+    letter index, the hint opener and the daily schedule. Requests keep using
+    the old snapshot until :meth:`WordBanks.install` replaces it. Returns the
+    new bank, or ``None`` when the lists still hold the same words.
+    """
+    with _RELOAD_LOCK:
+        started = time.perf_counter()
+        current = WORD_BANK[word_length]
+        bank = load_word_bank(word_length)
+        if bank.digest == current.digest:
+            return None
+        if not bank.answers:
+            raise ValueError(f"The {word_length}-letter word lists have no answers.")
+        # Lists reverted to a retained snapshot: reuse it, and everything cached for it.
+        bank = WORD_BANK.snapshot(word_length, bank.digest) or bank
+        get_letter_index(bank)
+        daily_schedule(word_length, bank)
+        if np is not None:
+            get_hint_engine(word_length, bank).opener()
+        retired = WORD_BANK.install(bank)
+        if retired is not None and WORD_BANK.snapshot(word_length, retired.digest) is None:
+            # Games still on the retired snapshot hold their own references; only shared lookups go.
+            for cache in (_FEEDBACK_TABLES, _LETTER_INDEXES, _HINT_ENGINES, _DAILY_SCHEDULES):
+                cache.pop(retired.digest, None)
+        print(
+            f"Reloaded the {word_length}-letter word bank as version {WORD_BANK.version(word_length)} "
+            f"({len(bank.guesses)} guesses, {len(bank.answers)} answers, {time.perf_counter() - started:.2f}s)."
         )
-        GAMES[game.id] = game
-        self.send_response(HTTPStatus.OK)
-        self.send_header("Content-Type", "application/json")
-        self.send_header("Set-Cookie", f"gameId={game.id}; Path=/")
-        self.end_headers()
-        self.wfile.write(json.dumps(game.to_response()).encode("utf-8"))
+        return bank
 
-    def _handle_guess(self) -> None:
-        game = self._get_game_from_cookie()
-        if not game:
-            self.send_error(HTTPStatus.NOT_FOUND, "No active game. Start a new one first.")
+
+class WordListWatcher:
+    """Polls the word-list files on a daemon thread and hot-reloads banks whose lists changed.
+
+    Changes are detected with :meth:`WordBank.source_fingerprint` (sizes and
+    mtimes), which needs nothing beyond the standard library and works on any
+    filesystem. A change is acted on once the fingerprint has held still for one
+    more interval, so a generator rewriting several files is picked up once,
+    complete. Only loaded lengths are watched; the rest load fresh on first use.
+    """
+
+    def __init__(self, interval: float = 2.0) -> None:
+        self.interval = interval
+        self.reloads = 0
+        self.failures = 0
+        self._seen: Dict[int, bytes] = {}
+        self._changed: Dict[int, bytes] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def check(self) -> List[int]:
+        """Poll once; return the lengths whose banks were swapped."""
+        swapped = []
+        for word_length, bank in sorted(WORD_BANK.loaded().items()):
+            fingerprint = WordBank.source_fingerprint(word_length)
+            if self._seen.setdefault(word_length, bank.fingerprint or fingerprint) == fingerprint:
+                self._changed.pop(word_length, None)
+                continue
+            if self._changed.get(word_length) != fingerprint:
+                self._changed[word_length] = fingerprint
+                continue
+            del self._changed[word_length]
+            self._seen[word_length] = fingerprint
+            try:
+                bank = reload_word_bank(word_length)
+            except Exception:
+                # Keep serving the current snapshot; the next edit gets another try.
+                self.failures += 1
+                traceback.print_exc()
+                continue
+            if bank is not None:
+                self.reloads += 1
+                swapped.append(word_length)
+        return swapped
+
+    def start(self) -> None:
+        if self._thread is not None:
             return
-        length = int(self.headers.get("Content-Length", "0"))
-        raw_body = self.rfile.read(length) if length else b""
-        try:
-            payload = json.loads(raw_body) if raw_body else {}
-        except json.JSONDecodeError:
-            self.send_error(HTTPStatus.BAD_REQUEST, "Invalid JSON body")
+
+        def loop() -> None:
+            self.check()
+            while not self._stop.wait(self.interval):
+                self.check()
+
+        self._thread = threading.Thread(target=loop, name="wordlist-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._stop.clear()
+
+
+# Set by --watch-wordlists; started by run() and in each worker.
+WORDLIST_WATCHER: Optional[WordListWatcher] = None
+
+
+def configure_wordlist_watch(interval: Optional[float]) -> None:
+    """Poll the word lists every ``interval`` seconds and hot-reload changed banks; ``None`` disables it."""
+    global WORDLIST_WATCHER
+    WORDLIST_WATCHER = WordListWatcher(interval) if interval else None
+
+
+class _BackgroundSweeper(abc.ABC):
+    """Base for stores whose ``sweep()`` runs periodically on a daemon thread."""
+
+    _sweeper: Optional[threading.Thread] = None
+    _stop: threading.Event
+
+    @abc.abstractmethod
+    def __len__(self) -> int:
+        """Number of live games."""
+
+    @abc.abstractmethod
+    def sweep(self) -> int:
+        """Evict every expired game and return how many were removed."""
+
+    def start_sweeper(self, interval: float = 60.0) -> None:
+        if self._sweeper is not None:
             return
 
-        guess = payload.get("guess", "")
-        try:
-            response = game.apply_guess(str(guess))
-        except ValueError as exc:
-            self._write_json({"error": str(exc)}, status=HTTPStatus.BAD_REQUEST)
+        def loop() -> None:
+            while not self._stop.wait(interval):
+                evicted = self.sweep()
+                if evicted:
+                    print(f"Session sweep evicted {evicted} games ({len(self)} live).")
+
+        self._sweeper = threading.Thread(target=loop, name="session-sweeper", daemon=True)
+        self._sweeper.start()
+
+    def stop_sweeper(self) -> None:
+        self._stop.set()
+        if self._sweeper is not None:
+            self._sweeper.join()
+            self._sweeper = None
+        self._stop.clear()
+
+    def close(self) -> None:
+        """Stop background work before the process exits."""
+        self.stop_sweeper()
+
+
+class _SessionShard:
+    """One independently locked slice of a :class:`SessionStore`."""
+
+    def __init__(self, max_entries: int, idle_ttl: float, finished_ttl: float, sweep_batch: int) -> None:
+        self.max_entries = max_entries
+        self.idle_ttl = idle_ttl
+        self.finished_ttl = finished_ttl
+        self.sweep_batch = sweep_batch
+        self.active: "OrderedDict[str, Tuple[GameState, float]]" = OrderedDict()
+        self.finished: "OrderedDict[str, Tuple[GameState, float]]" = OrderedDict()
+        self.lock = threading.Lock()
+        self.evicted_expired = 0
+        self.evicted_lru = 0
+
+    def __len__(self) -> int:
+        return len(self.active) + len(self.finished)
+
+    def add(self, game: GameState) -> None:
+        now = time.monotonic()
+        with self.lock:
+            self._file(game, now)
+            self._sweep_locked(now, limit=self.sweep_batch)
+            self._enforce_capacity_locked()
+
+    def get(self, game_id: str) -> Optional[GameState]:
+        now = time.monotonic()
+        with self.lock:
+            for entries, ttl in ((self.active, self.idle_ttl), (self.finished, self.finished_ttl)):
+                entry = entries.get(game_id)
+                if entry is None:
+                    continue
+                game, last_seen = entry
+                if now - last_seen > ttl:
+                    del entries[game_id]
+                    self.evicted_expired += 1
+                    return None
+                entries[game_id] = (game, now)
+                entries.move_to_end(game_id)
+                return game
+        return None
+
+    def save(self, game: GameState) -> None:
+        with self.lock:
+            # Only re-file games that are still registered; an evicted game stays gone.
+            if game.id in self.active or game.id in self.finished:
+                self._file(game, time.monotonic())
+
+    def sweep(self) -> int:
+        with self.lock:
+            return self._sweep_locked(time.monotonic(), limit=None)
+
+    def _file(self, game: GameState, now: float) -> None:
+        self.active.pop(game.id, None)
+        self.finished.pop(game.id, None)
+        entries = self.active if game.status == "in_progress" else self.finished
+        entries[game.id] = (game, now)
+
+    def _sweep_locked(self, now: float, limit: Optional[int]) -> int:
+        evicted = 0
+        for entries, ttl in ((self.finished, self.finished_ttl), (self.active, self.idle_ttl)):
+            # Queues are ordered by last access, so the oldest entries come first.
+            while entries and (limit is None or evicted < limit):
+                game_id, (_game, last_seen) = next(iter(entries.items()))
+                if now - last_seen <= ttl:
+                    break
+                del entries[game_id]
+                evicted += 1
+        self.evicted_expired += evicted
+        return evicted
+
+    def _enforce_capacity_locked(self) -> None:
+        while len(self.active) + len(self.finished) > self.max_entries:
+            entries = self.finished if self.finished else self.active
+            entries.popitem(last=False)
+            self.evicted_lru += 1
+
+
+class SessionStore(_BackgroundSweeper):
+    """Thread-safe in-memory game registry with idle TTLs and LRU eviction.
+
+    Games are spread over ``shards`` independently locked shards by id, so requests
+    for unrelated games rarely contend. Within a shard, games live in one of two
+    access-ordered queues: in-progress games expire after ``idle_ttl`` seconds
+    without a request, finished (won/lost) games after the shorter
+    ``finished_ttl``. When a shard exceeds its share of ``max_entries`` its least
+    recently used game is dropped, finished games first. Expired entries are swept
+    lazily on lookup, incrementally on every insert, and optionally by a
+    background thread.
+    """
+
+    # Whether every change to a game needs a fresh cookie (true for token sessions).
+    reissue_cookie = False
+    # Whether lookups can wait on SQLite; the asyncio server runs session routes off the loop then.
+    blocking = False
+
+    def __init__(
+        self,
+        max_entries: int = 100_000,
+        idle_ttl: float = 6 * 60 * 60,
+        finished_ttl: float = 15 * 60,
+        sweep_batch: int = 64,
+        shards: int = 16,
+    ) -> None:
+        per_shard = max(1, -(-max_entries // shards))
+        self.max_entries = max_entries
+        self._shards = [_SessionShard(per_shard, idle_ttl, finished_ttl, sweep_batch) for _ in range(shards)]
+        self._sweeper: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def _shard(self, game_id: str) -> _SessionShard:
+        return self._shards[hash(game_id) % len(self._shards)]
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
+
+    def __contains__(self, game_id: object) -> bool:
+        if not isinstance(game_id, str):
+            return False
+        shard = self._shard(game_id)
+        return game_id in shard.active or game_id in shard.finished
+
+    def session_key(self, game: GameState) -> str:
+        """Cookie value that identifies ``game`` on later requests."""
+        return game.id
+
+    def add(self, game: GameState) -> None:
+        self._shard(game.id).add(game)
+
+    def get(self, game_id: str) -> Optional[GameState]:
+        return self._shard(game_id).get(game_id)
+
+    def save(self, game: GameState) -> None:
+        """Record that ``game`` changed so it is filed under its current status."""
+        self._shard(game.id).save(game)
+
+    @contextmanager
+    def locked(self, game_id: str) -> Iterator[Optional[GameState]]:
+        """Yield the game with its lock held, saving it afterwards.
+
+        Mutations made inside the block are serialized against every other
+        ``locked`` block for the same game. Yields ``None`` for unknown ids.
+        """
+        game = self.get(game_id)
+        if game is None:
+            yield None
             return
+        with game.lock:
+            yield game
+        self.save(game)
 
-        self._write_json(response)
+    def sweep(self) -> int:
+        """Evict every expired game and return how many were removed."""
+        return sum(shard.sweep() for shard in self._shards)
 
-    def _get_game_from_cookie(self) -> Optional[GameState]:
-        cookie_header = self.headers.get("Cookie")
-        if not cookie_header:
-            return None
-        cookie = SimpleCookie()
-        cookie.load(cookie_header)
-        raw_id = cookie.get("gameId")
-        if not raw_id:
-            return None
-        return GAMES.get(raw_id.value)
+    def stats(self) -> Dict[str, int]:
+        totals = {"live": 0, "live_in_progress": 0, "live_finished": 0, "evicted_expired": 0, "evicted_lru": 0}
+        for shard in self._shards:
+            with shard.lock:
+                totals["live"] += len(shard)
+                totals["live_in_progress"] += len(shard.active)
+                totals["live_finished"] += len(shard.finished)
+                totals["evicted_expired"] += shard.evicted_expired
+                totals["evicted_lru"] += shard.evicted_lru
+        return totals
 
-    def _write_json(self, payload: Dict[str, object], status: HTTPStatus = HTTPStatus.OK) -> None:
-        body = json.dumps(payload).encode("utf-8")
-        self.send_response(status)
-        self.send_header("Content-Type", "application/json")
-        self.send_header("Content-Length", str(len(body)))
-        self.end_headers()
-        self.wfile.write(body)
 
-    def log_message(self, fmt: str, *args) -> None:
-        sys.stdout.write("%s - - [%s] %s\n" % (self.client_address[0], self.log_date_time_string(), fmt % args))
+def _connect_session_db(path: Path) -> sqlite3.Connection:
+    conn = sqlite3.connect(path, timeout=30.0, isolation_level=None, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
 
 
-def run(port: int = 8000) -> None:
-    server_address = ("", port)
-    httpd = ThreadingHTTPServer(server_address, WordleHandler)
-    print(f"Wordle server running at http://localhost:{port}")
-    print("Press Ctrl+C to stop.")
-    try:
-        httpd.serve_forever()
-    except KeyboardInterrupt:
+class SqliteSessionStore(_BackgroundSweeper):
+    """Game registry in a local SQLite file, shared by every process that opens it.
+
+    Used by the pre-fork mode so a game created by one worker can be guessed on
+    another. It offers the same interface and TTL/capacity rules as
+    :class:`SessionStore`. :meth:`locked` wraps load-guess-save in a
+    ``BEGIN IMMEDIATE`` transaction, which serializes guesses across processes.
+    Each thread in each process gets its own connection.
+    """
+
+    reissue_cookie = False
+    blocking = True
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS games (
+            id TEXT PRIMARY KEY,
+            status TEXT NOT NULL,
+            last_seen REAL NOT NULL,
+            record TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS games_by_age ON games (status, last_seen);
+        CREATE TABLE IF NOT EXISTS counters (name TEXT PRIMARY KEY, value INTEGER NOT NULL);
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        max_entries: int = 100_000,
+        idle_ttl: float = 6 * 60 * 60,
+        finished_ttl: float = 15 * 60,
+        sweep_every: int = 256,
+        touch_after: float = 60.0,
+    ) -> None:
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.idle_ttl = idle_ttl
+        self.finished_ttl = finished_ttl
+        self.sweep_every = sweep_every
+        # Lookups only rewrite last_seen when it is older than this, to keep reads read-only.
+        self.touch_after = touch_after
+        self._local = threading.local()
+        self._adds = 0
+        self._sweeper: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(self.SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        return _connect_session_db(self.path)
+
+    @property
+    def _conn(self) -> sqlite3.Connection:
+        # Connections must not cross fork(), so they are cached per thread *and* pid.
+        cached = getattr(self._local, "conn", None)
+        if cached is None or cached[0] != os.getpid():
+            cached = (os.getpid(), self._connect())
+            self._local.conn = cached
+        return cached[1]
+
+    def _ttl(self, status: str) -> float:
+        return self.idle_ttl if status == "in_progress" else self.finished_ttl
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM games").fetchone()[0]
+
+    def __contains__(self, game_id: object) -> bool:
+        if not isinstance(game_id, str):
+            return False
+        return self._conn.execute("SELECT 1 FROM games WHERE id = ?", (game_id,)).fetchone() is not None
+
+    def session_key(self, game: GameState) -> str:
+        return game.id
+
+    def add(self, game: GameState) -> None:
+        self._write(self._conn, game)
+        self._adds += 1
+        if self._adds % self.sweep_every == 0:
+            self.sweep()
+
+    def get(self, game_id: str) -> Optional[GameState]:
+        return self._load(self._conn, game_id)
+
+    def save(self, game: GameState) -> None:
+        conn = self._conn
+        if conn.execute("SELECT 1 FROM games WHERE id = ?", (game.id,)).fetchone() is not None:
+            self._write(conn, game)
+
+    @contextmanager
+    def locked(self, game_id: str) -> Iterator[Optional[GameState]]:
+        conn = self._conn
+        with self._transaction(conn):
+            game = self._load(conn, game_id)
+            yield game
+            if game is not None:
+                self._write(conn, game)
+
+    @staticmethod
+    @contextmanager
+    def _transaction(conn: sqlite3.Connection) -> Iterator[None]:
+        # IMMEDIATE takes the write lock up front, so concurrent guessers queue here.
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def sweep(self) -> int:
+        now = time.time()
+        conn = self._conn
+        with self._transaction(conn):
+            expired = conn.execute(
+                "DELETE FROM games WHERE (status = 'in_progress' AND last_seen < ?)"
+                " OR (status != 'in_progress' AND last_seen < ?)",
+                (now - self.idle_ttl, now - self.finished_ttl),
+            ).rowcount
+            overflow = max(0, conn.execute("SELECT COUNT(*) FROM games").fetchone()[0] - self.max_entries)
+            if overflow:
+                # Finished games go first, then the least recently seen.
+                conn.execute(
+                    "DELETE FROM games WHERE id IN "
+                    "(SELECT id FROM games ORDER BY status = 'in_progress', last_seen LIMIT ?)",
+                    (overflow,),
+                )
+            self._bump(conn, "evicted_expired", expired)
+            self._bump(conn, "evicted_lru", overflow)
+        return expired
+
+    def stats(self) -> Dict[str, int]:
+        conn = self._conn
+        rows = dict(conn.execute("SELECT status = 'in_progress', COUNT(*) FROM games GROUP BY 1").fetchall())
+        counters = dict(conn.execute("SELECT name, value FROM counters").fetchall())
+        return {
+            "live": rows.get(1, 0) + rows.get(0, 0),
+            "live_in_progress": rows.get(1, 0),
+            "live_finished": rows.get(0, 0),
+            "evicted_expired": counters.get("evicted_expired", 0),
+            "evicted_lru": counters.get("evicted_lru", 0),
+        }
+
+    def _load(self, conn: sqlite3.Connection, game_id: str) -> Optional[GameState]:
+        row = conn.execute("SELECT status, last_seen, record FROM games WHERE id = ?", (game_id,)).fetchone()
+        if row is None:
+            return None
+        status, last_seen, record = row
+        now = time.time()
+        if now - last_seen > self._ttl(status):
+            with contextlib.suppress(sqlite3.OperationalError):
+                conn.execute("DELETE FROM games WHERE id = ?", (game_id,))
+                self._bump(conn, "evicted_expired", 1)
+            return None
+        if now - last_seen > self.touch_after:
+            with contextlib.suppress(sqlite3.OperationalError):
+                conn.execute("UPDATE games SET last_seen = ? WHERE id = ?", (now, game_id))
+        return GameState.from_record(json.loads(record))
+
+    @staticmethod
+    def _write(conn: sqlite3.Connection, game: GameState) -> None:
+        record = game.to_record()
+        conn.execute(
+            "INSERT OR REPLACE INTO games (id, status, last_seen, record) VALUES (?, ?, ?, ?)",
+            (game.id, record["status"], time.time(), json.dumps(record, separators=(",", ":"))),
+        )
+
+    @staticmethod
+    def _bump(conn: sqlite3.Connection, name: str, amount: int) -> None:
+        if amount:
+            conn.execute(
+                "INSERT INTO counters (name, value) VALUES (?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+                (name, amount),
+            )
+
+
+class DurableSessionStore(SessionStore):
+    """In-memory :class:`SessionStore` backed by a write-behind SQLite file.
+
+    Requests only ever touch memory: :meth:`add` and :meth:`save` snapshot the
+    game into a pending map, and a writer thread commits the pending snapshots
+    in batches every ``flush_interval`` seconds (or sooner once ``batch_size``
+    games are waiting). Repeated guesses on one game between flushes collapse
+    into a single row write. Nothing is read at startup; a game that is not in
+    memory (after a restart or an LRU eviction) is loaded from disk on its first
+    lookup. The file uses the :class:`SqliteSessionStore` schema, so either
+    backend can open it. A crash loses at most the last unflushed batch.
+    """
+
+    # Cold games are read from disk on lookup.
+    blocking = True
+    # Misses are serialized per stripe of game ids, each with its own reader
+    # connection. A slow read only holds up misses that hash to its stripe.
+    LOAD_STRIPES = 16
+
+    def __init__(
+        self,
+        path: Path,
+        max_entries: int = 100_000,
+        idle_ttl: float = 6 * 60 * 60,
+        finished_ttl: float = 15 * 60,
+        sweep_batch: int = 64,
+        shards: int = 16,
+        flush_interval: float = 0.05,
+        batch_size: int = 512,
+    ) -> None:
+        super().__init__(max_entries, idle_ttl, finished_ttl, sweep_batch, shards)
+        self.path = Path(path)
+        self.idle_ttl = idle_ttl
+        self.finished_ttl = finished_ttl
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._writer_conn = _connect_session_db(self.path)
+        self._writer_conn.executescript(SqliteSessionStore.SCHEMA)
+        # Opened on first use under the stripe's lock, which also serializes its use.
+        self._readers: List[Optional[sqlite3.Connection]] = [None] * self.LOAD_STRIPES
+        # game id -> (record, wall-clock time); "flushing" is the batch being committed.
+        self._pending: Dict[str, Tuple[Dict[str, object], float]] = {}
+        self._flushing: Dict[str, Tuple[Dict[str, object], float]] = {}
+        self._pending_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._load_locks = [threading.Lock() for _ in range(self.LOAD_STRIPES)]
+        self._wake = threading.Event()
+        self._closed = threading.Event()
+        self.flushed_writes = 0
+        self.flush_batches = 0
+        self.lazy_loads = 0
+        self._writer = threading.Thread(target=self._writer_loop, name="session-writer", daemon=True)
+        self._writer.start()
+
+    def __contains__(self, game_id: object) -> bool:
+        return isinstance(game_id, str) and self.get(game_id) is not None
+
+    def add(self, game: GameState) -> None:
+        super().add(game)
+        self._enqueue(game)
+
+    def get(self, game_id: str) -> Optional[GameState]:
+        game = super().get(game_id)
+        if game is not None:
+            return game
+        # Misses for one id always meet on the same stripe, so two requests for the same cold
+        # game share one GameState.
+        stripe = hash(game_id) % self.LOAD_STRIPES
+        with self._load_locks[stripe]:
+            game = super().get(game_id)
+            if game is None:
+                game = self._load(game_id, stripe)
+                if game is not None:
+                    super().add(game)
+        return game
+
+    def save(self, game: GameState) -> None:
+        super().save(game)
+        self._enqueue(game)
+
+    def sweep(self) -> int:
+        evicted = super().sweep()
+        now = time.time()
+        with self._write_lock:
+            self._writer_conn.execute(
+                "DELETE FROM games WHERE (status = 'in_progress' AND last_seen < ?)"
+                " OR (status != 'in_progress' AND last_seen < ?)",
+                (now - self.idle_ttl, now - self.finished_ttl),
+            )
+        return evicted
+
+    def stats(self) -> Dict[str, int]:
+        totals = super().stats()
+        with self._pending_lock:
+            totals["pending_writes"] = len(self._pending) + len(self._flushing)
+        totals["flushed_writes"] = self.flushed_writes
+        totals["flush_batches"] = self.flush_batches
+        totals["lazy_loads"] = self.lazy_loads
+        return totals
+
+    def flush(self) -> int:
+        """Commit every pending snapshot now and return how many rows were written."""
+        with self._write_lock:
+            with self._pending_lock:
+                if not self._pending:
+                    return 0
+                self._flushing, self._pending = self._pending, {}
+            rows = [
+                (game_id, record["status"], seen, json.dumps(record, separators=(",", ":")))
+                for game_id, (record, seen) in self._flushing.items()
+            ]
+            conn = self._writer_conn
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO games (id, status, last_seen, record) VALUES (?, ?, ?, ?)", rows
+                )
+            except BaseException:
+                conn.execute("ROLLBACK")
+                with self._pending_lock:
+                    # Put the batch back without clobbering newer snapshots.
+                    self._pending = {**self._flushing, **self._pending}
+                    self._flushing = {}
+                raise
+            conn.execute("COMMIT")
+            with self._pending_lock:
+                self._flushing = {}
+            self.flushed_writes += len(rows)
+            self.flush_batches += 1
+            return len(rows)
+
+    def close(self) -> None:
+        super().close()
+        self._closed.set()
+        self._wake.set()
+        self._writer.join()
+        self.flush()
+
+    def _enqueue(self, game: GameState) -> None:
+        record = game.to_record()
+        with self._pending_lock:
+            self._pending[game.id] = (record, time.time())
+            waiting = len(self._pending)
+        if waiting >= self.batch_size:
+            self._wake.set()
+
+    def _writer_loop(self) -> None:
+        while not self._closed.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except sqlite3.Error:
+                traceback.print_exc()
+                time.sleep(1.0)
+
+    def _load(self, game_id: str, stripe: int) -> Optional[GameState]:
+        """Read ``game_id`` from the pending writes or the file; the caller holds the stripe's lock."""
+        with self._pending_lock:
+            entry = self._pending.get(game_id) or self._flushing.get(game_id)
+        if entry is not None:
+            record, last_seen = entry
+        else:
+            reader = self._readers[stripe]
+            if reader is None:
+                reader = self._readers[stripe] = _connect_session_db(self.path)
+            row = reader.execute(
+                "SELECT last_seen, record FROM games WHERE id = ?", (game_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            last_seen, record = row[0], json.loads(row[1])
+        ttl = self.idle_ttl if record["status"] == "in_progress" else self.finished_ttl
+        if time.time() - last_seen > ttl:
+            return None
+        self.lazy_loads += 1
+        return GameState.from_record(record)
+
+
+class TokenSessionStore:
+    """Stateless sessions: the whole game travels in an encrypted, signed cookie.
+
+    Nothing is stored server side, so any replica holding the same secret can
+    serve any request. The plaintext holds the word length, max guesses, answer
+    index into ``WORD_BANK``, a word-bank digest prefix, issue time, daily puzzle number, game id and one 16-bit
+    guess index per guess. Results and status are recomputed on load. The plaintext is XORed
+    with a keyed BLAKE2b keystream under a random 96-bit nonce, and the
+    version, nonce and ciphertext are authenticated by a second keyed BLAKE2b
+    (a MAC in its own right, so no HMAC wrapper is needed). A finished 6-guess
+    game is 65 bytes, or 87 cookie characters. Every guess reissues the cookie.
+
+    Tokens cannot be revoked: a client may replay an older cookie for its game,
+    which is the usual trade-off for stateless sessions.
+    """
+
+    # Version 2 added the daily puzzle number.
+    VERSION = 2
+    NONCE_SIZE = 12
+    TAG_SIZE = 12
+    # word length, max guesses, word-bank digest prefix, answer index, issue time (minutes),
+    # daily puzzle number + 1 (0 for other games), game id
+    HEADER = struct.Struct("<BBHHIH16s")
+    reissue_cookie = True
+    blocking = False
+
+    def __init__(self, secret: bytes, idle_ttl: float = 6 * 60 * 60, finished_ttl: float = 15 * 60) -> None:
+        if len(secret) < 16:
+            raise ValueError("Session secret must be at least 16 bytes.")
+        self._enc_key = hashlib.blake2b(secret, digest_size=32, person=b"wordle-enc").digest()
+        self._mac_key = hashlib.blake2b(secret, digest_size=32, person=b"wordle-mac").digest()
+        self.idle_ttl = idle_ttl
+        self.finished_ttl = finished_ttl
+        self.issued = 0
+        self.rejected = 0
+
+    def __len__(self) -> int:
+        return 0
+
+    def __contains__(self, token: object) -> bool:
+        return isinstance(token, str) and self.get(token) is not None
+
+    def session_key(self, game: GameState) -> str:
+        return self.encode(game)
+
+    def add(self, game: GameState) -> None:
+        pass
+
+    def get(self, token: str) -> Optional[GameState]:
+        game = self.decode(token)
+        if game is None:
+            self.rejected += 1
+        return game
+
+    def save(self, game: GameState) -> None:
+        pass
+
+    @contextmanager
+    def locked(self, token: str) -> Iterator[Optional[GameState]]:
+        # Each request decodes its own copy, so there is nothing shared to lock.
+        yield self.get(token)
+
+    def sweep(self) -> int:
+        return 0
+
+    def start_sweeper(self, interval: float = 60.0) -> None:
+        pass
+
+    def stop_sweeper(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def stats(self) -> Dict[str, int]:
+        return {"tokens_issued": self.issued, "tokens_rejected": self.rejected}
+
+    def encode(self, game: GameState) -> str:
+        bank = game.bank or WORD_BANK[game.word_length]
+        with game.lock:
+            answer_index = game.answer_index if game.answer_index >= 0 else bank.answers.find(game.answer)
+            if answer_index < 0:
+                raise ValueError("Token sessions need an answer from the word bank.")
+            guess_indexes = [bank.guesses.find(str(row["word"])) for row in game.guesses]
+            plaintext = self.HEADER.pack(
+                game.word_length,
+                game.max_guesses,
+                int(bank.digest[:4], 16),
+                answer_index,
+                int(time.time() // 60),
+                0 if game.daily is None else game.daily + 1,
+                bytes.fromhex(game.id.replace("-", "")),
+            ) + struct.pack(f"<{len(guess_indexes)}H", *guess_indexes)
+        nonce = os.urandom(self.NONCE_SIZE)
+        sealed = bytes((self.VERSION,)) + nonce + self._xor(nonce, plaintext)
+        self.issued += 1
+        return base64.urlsafe_b64encode(sealed + self._tag(sealed)).rstrip(b"=").decode("ascii")
+
+    def decode(self, token: str) -> Optional[GameState]:
+        """Return the game in ``token``, or ``None`` if it is malformed, forged or expired."""
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        except ValueError:
+            return None
+        minimum = 1 + self.NONCE_SIZE + self.HEADER.size + self.TAG_SIZE
+        if len(raw) < minimum or raw[0] != self.VERSION or (len(raw) - minimum) % 2:
+            return None
+        sealed, tag = raw[: -self.TAG_SIZE], raw[-self.TAG_SIZE :]
+        if not hmac.compare_digest(tag, self._tag(sealed)):
+            return None
+        nonce = sealed[1 : 1 + self.NONCE_SIZE]
+        plaintext = self._xor(nonce, sealed[1 + self.NONCE_SIZE :])
+        word_length, max_guesses, digest, answer_index, issued, daily, game_id = self.HEADER.unpack_from(plaintext)
+        count = (len(plaintext) - self.HEADER.size) // 2
+        guess_indexes = struct.unpack_from(f"<{count}H", plaintext, self.HEADER.size)
+        if WORD_BANK.get(word_length) is None:
+            return None
+        # A token minted against different word lists would decode to the wrong words, so it needs
+        # the snapshot it was minted on: the current bank or one retained across a reload.
+        bank = next((bank for bank in WORD_BANK.snapshots(word_length) if digest == int(bank.digest[:4], 16)), None)
+        if bank is None:
+            return None
+        if answer_index >= len(bank.answers) or count > max_guesses:
+            return None
+
+        game = GameState(
+            bank.answers[answer_index],
+            bank.guesses,
+            word_length,
+            max_guesses,
+            feedback=get_feedback_table(word_length, bank=bank),
+            game_id=str(uuid.UUID(bytes=game_id)),
+            answer_index=answer_index,
+            bank=bank,
+        )
+        game.daily = daily - 1 if daily else None
+        for index in guess_indexes:
+            word = bank.guesses[index]
+            game.guesses.append({"word": word, "result": game._score_guess(word, index)})
+            if word == game.answer:
+                game.status = "won"
+        if game.status == "in_progress" and len(game.guesses) >= max_guesses:
+            game.status = "lost"
+        ttl = self.idle_ttl if game.status == "in_progress" else self.finished_ttl
+        if time.time() - issued * 60 > ttl:
+            return None
+        return game
+
+    def _tag(self, sealed: bytes) -> bytes:
+        return hashlib.blake2b(sealed, digest_size=self.TAG_SIZE, key=self._mac_key).digest()
+
+    def _xor(self, nonce: bytes, data: bytes) -> bytes:
+        # One 64-byte block covers games of up to 20 guesses; longer ones chain more blocks.
+        stream = b"".join(
+            hashlib.blake2b(nonce + bytes((block,)), key=self._enc_key).digest()
+            for block in range(-(-len(data) // 64))
+        )
+        return (int.from_bytes(data, "little") ^ int.from_bytes(stream[: len(data)], "little")).to_bytes(
+            len(data), "little"
+        )
+
+
+GAMES: Union[SessionStore, SqliteSessionStore, TokenSessionStore] = SessionStore()
+DEFAULT_SESSION_DB = ROOT / "sessions.sqlite3"
+
+
+def configure_sessions(backend: str, path: Path = DEFAULT_SESSION_DB) -> None:
+    """Swap the process-wide ``GAMES`` registry for the named backend."""
+    global GAMES
+    if backend == "memory":
+        GAMES = SessionStore()
+    elif backend == "sqlite":
+        GAMES = SqliteSessionStore(path)
+    elif backend == "durable":
+        GAMES = DurableSessionStore(path)
+    elif backend == "token":
+        secret = os.environ.get("WORDLE_SESSION_SECRET", "").encode("utf-8")
+        if not secret:
+            print("WORDLE_SESSION_SECRET is not set; using a random key, so tokens die with this process.")
+            secret = os.urandom(32)
+        GAMES = TokenSessionStore(secret)
+    else:
+        raise ValueError(f"Unknown session backend: {backend}")
+
+
+def pick_word(word_length: int, bank: Optional[WordBank] = None) -> str:
+    return random.choice((bank or WORD_BANK[word_length]).answers)
+
+
+class SeededGenerator:
+    """Python port of ``SeededGenerator`` in ``web/src/rng.js``.
+
+    A 64-bit linear congruential generator, bit-compatible with the web client,
+    so both sides derive the same sequences from the same seed.
+    """
+
+    MULTIPLIER = 2862933555777941757
+    INCREMENT = 3037000493
+    MASK = (1 << 64) - 1
+
+    def __init__(self, seed: int) -> None:
+        self.state = seed
+
+    def next(self) -> int:
+        self.state = (self.MULTIPLIER * self.state + self.INCREMENT) & self.MASK
+        return self.state
+
+    def next_float(self) -> float:
+        return (self.next() % 1_000_000) / 1_000_000
+
+
+def shuffle_with_seed(items: Iterable[T], seed: int) -> List[T]:
+    """Port of ``shuffleWithSeed`` in ``web/src/rng.js`` (Fisher-Yates driven by :class:`SeededGenerator`)."""
+    generator = SeededGenerator(seed)
+    shuffled = list(items)
+    for i in range(len(shuffled) - 1, 0, -1):
+        j = generator.next() % (i + 1)
+        shuffled[i], shuffled[j] = shuffled[j], shuffled[i]
+    return shuffled
+
+
+# The web client's default seed; the daily schedule is this shuffle of the sorted answer bank.
+DAILY_SEED = 12345
+# Puzzle number 0. Later days walk the schedule and wrap around after len(answers) days.
+DAILY_EPOCH = datetime.date(2024, 1, 1)
+_DAILY_SCHEDULES: Dict[str, List[int]] = {}
+
+
+def daily_schedule(word_length: int, bank: Optional[WordBank] = None) -> List[int]:
+    """Answer indexes in daily order, shuffled once per word-bank digest."""
+    if bank is None:
+        bank = WORD_BANK[word_length]
+    schedule = _DAILY_SCHEDULES.get(bank.digest)
+    if schedule is None:
+        schedule = _DAILY_SCHEDULES.setdefault(bank.digest, shuffle_with_seed(range(len(bank.answers)), DAILY_SEED))
+    return schedule
+
+
+def daily_answer(word_length: int, day: datetime.date, bank: Optional[WordBank] = None) -> Tuple[int, str]:
+    """Return ``(puzzle number, answer)`` for ``day``."""
+    if bank is None:
+        bank = WORD_BANK[word_length]
+    schedule = daily_schedule(word_length, bank)
+    number = (day - DAILY_EPOCH).days
+    if number < 0:
+        raise ValueError(f"Daily puzzles start on {DAILY_EPOCH.isoformat()}.")
+    return number, bank.answers[schedule[number % len(schedule)]]
+
+
+class SpaceSaving:
+    """Approximate top-k counter in fixed memory (the Space-Saving algorithm).
+
+    At most ``capacity`` items are tracked. When a new item arrives and the
+    table is full, it replaces the item with the lowest count and inherits that
+    count, which is recorded as its possible overcount (``error``). Any item
+    seen more than ``total / capacity`` times is always tracked, and its true
+    count lies in ``[count - error, count]``. The minimum is found through a
+    heap whose entries are refreshed lazily, since counts only grow, so updates
+    cost O(log capacity). Not thread-safe; callers lock.
+    """
+
+    def __init__(self, capacity: int = 100) -> None:
+        self.capacity = capacity
+        self.total = 0
+        # item -> [count, error]
+        self._counts: Dict[str, List[int]] = {}
+        # (count when pushed, item); one entry per tracked item, possibly stale.
+        self._heap: List[Tuple[int, str]] = []
+
+    def add(self, item: str) -> None:
+        self.total += 1
+        entry = self._counts.get(item)
+        if entry is not None:
+            entry[0] += 1
+            return
+        if len(self._counts) < self.capacity:
+            self._counts[item] = [1, 0]
+            heapq.heappush(self._heap, (1, item))
+            return
+        while True:
+            count, victim = self._heap[0]
+            current = self._counts[victim][0]
+            if current == count:
+                break
+            heapq.heapreplace(self._heap, (current, victim))
+        del self._counts[victim]
+        self._counts[item] = [count + 1, count]
+        heapq.heapreplace(self._heap, (count + 1, item))
+
+    def top(self, limit: int) -> List[Tuple[str, int, int]]:
+        """Up to ``limit`` ``(item, count, error)`` tuples, highest count first."""
+        ranked = sorted(self._counts.items(), key=lambda item: (-item[1][0], item[0]))
+        return [(item, count, error) for item, (count, error) in ranked[:limit]]
+
+
+class _LengthStats:
+    __slots__ = ("lock", "started", "won", "lost", "wins_by_guesses", "openers")
+
+    def __init__(self, opener_capacity: int) -> None:
+        self.lock = threading.Lock()
+        self.started = 0
+        self.won = 0
+        self.lost = 0
+        self.wins_by_guesses: Counter = Counter()
+        self.openers = SpaceSaving(opener_capacity)
+
+
+class GameStats:
+    """Live game counters per word length, updated as games start and finish.
+
+    Counters change only when a game is created, on its first guess (the
+    opener) and on the guess that wins or loses it, so reading them never
+    touches the session store. Each length has its own lock. Opening words are
+    counted with a :class:`SpaceSaving` sketch, so their memory stays fixed.
+    Counts are per process, like :class:`Metrics`.
+    """
+
+    def __init__(self, opener_capacity: int = 100) -> None:
+        self.opener_capacity = opener_capacity
+        self.started_at = time.time()
+        self._lengths: Dict[int, _LengthStats] = {}
+        self._lock = threading.Lock()
+
+    def _for(self, word_length: int) -> _LengthStats:
+        stats = self._lengths.get(word_length)
+        if stats is None:
+            with self._lock:
+                stats = self._lengths.setdefault(word_length, _LengthStats(self.opener_capacity))
+        return stats
+
+    def start(self, word_length: int) -> None:
+        stats = self._for(word_length)
+        with stats.lock:
+            stats.started += 1
+
+    def guess(self, word_length: int, word: str, number: int, status: str) -> None:
+        """Count guess ``number`` of a game, given the game's status after it."""
+        if number != 1 and status == "in_progress":
+            return
+        stats = self._for(word_length)
+        with stats.lock:
+            if number == 1:
+                stats.openers.add(word)
+            if status == "won":
+                stats.won += 1
+                stats.wins_by_guesses[number] += 1
+            elif status == "lost":
+                stats.lost += 1
+
+    def snapshot(self, top: int = 10) -> Dict[str, object]:
+        lengths: Dict[str, object] = {}
+        for word_length, stats in sorted(self._lengths.items()):
+            with stats.lock:
+                finished = stats.won + stats.lost
+                lengths[str(word_length)] = {
+                    "started": stats.started,
+                    "won": stats.won,
+                    "lost": stats.lost,
+                    "solveRate": round(stats.won / finished, 4) if finished else None,
+                    "winsByGuessCount": {str(n): stats.wins_by_guesses[n] for n in sorted(stats.wins_by_guesses)},
+                    "topOpeners": [
+                        {"word": word, "count": count, "maxOvercount": error}
+                        for word, count, error in stats.openers.top(top)
+                    ],
+                }
+        since = datetime.datetime.fromtimestamp(self.started_at, datetime.timezone.utc)
+        return {"since": since.isoformat(timespec="seconds"), "lengths": lengths}
+
+
+GAME_STATS = GameStats()
+
+
+# Upper bounds, in seconds, of the request latency histogram buckets (plus an implicit +Inf).
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+
+class _ShardOwner:
+    __slots__ = ("__weakref__",)
+
+
+class _MetricsShard:
+    __slots__ = ("requests", "latency")
+
+    def __init__(self) -> None:
+        # (route, method, status) -> count
+        self.requests: Dict[Tuple[str, str, int], int] = {}
+        # route -> per-bucket counts (not cumulative), then the +Inf count, then the sum of seconds
+        self.latency: Dict[str, List[float]] = {}
+
+    def merge(self, other: "_MetricsShard") -> None:
+        # list() snapshots are taken in C, so they are consistent even while the owning thread records.
+        for key, count in list(other.requests.items()):
+            self.requests[key] = self.requests.get(key, 0) + count
+        for route, row in list(other.latency.items()):
+            total = self.latency.setdefault(route, [0] * len(row))
+            for index, value in enumerate(list(row)):
+                total[index] += value
+
+
+class Metrics:
+    """Request counters and latency histograms, rendered in the Prometheus text format.
+
+    Each thread records into its own shard without taking a lock; only the
+    thread that owns a shard writes to it. Scrapes merge the live shards. When
+    a thread exits, its shard is folded into ``_retired`` so that
+    thread-per-connection servers do not accumulate shards.
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._live: Set[_MetricsShard] = set()
+        self._retired = _MetricsShard()
+        self.started = time.time()
+
+    def _shard(self) -> _MetricsShard:
+        shard = _MetricsShard()
+        # The owner token dies with the thread's locals, which retires the shard.
+        owner = self._local.owner = _ShardOwner()
+        weakref.finalize(owner, self._retire, shard)
+        self._local.shard = shard
+        with self._lock:
+            self._live.add(shard)
+        return shard
+
+    def _retire(self, shard: _MetricsShard) -> None:
+        with self._lock:
+            self._live.discard(shard)
+            self._retired.merge(shard)
+
+    def record(self, route: str, method: str, status: int, seconds: float) -> None:
+        shard = getattr(self._local, "shard", None) or self._shard()
+        key = (route, method, status)
+        shard.requests[key] = shard.requests.get(key, 0) + 1
+        row = shard.latency.get(route)
+        if row is None:
+            row = shard.latency[route] = [0] * (len(LATENCY_BUCKETS) + 2)
+        row[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        row[-1] += seconds
+
+    def snapshot(self) -> Tuple[Dict[Tuple[str, str, int], int], Dict[str, List[float]]]:
+        total = _MetricsShard()
+        with self._lock:
+            total.merge(self._retired)
+            for shard in self._live:
+                total.merge(shard)
+        return total.requests, total.latency
+
+    def render(self) -> str:
+        requests, latency = self.snapshot()
+        lines = [
+            "# HELP wordle_http_requests_total HTTP requests by route, method and status.",
+            "# TYPE wordle_http_requests_total counter",
+        ]
+        for (route, method, status), count in sorted(requests.items()):
+            lines.append(f'wordle_http_requests_total{{route="{route}",method="{method}",status="{status}"}} {count}')
+
+        errors: Dict[int, int] = {}
+        for (_, _, status), count in requests.items():
+            if status >= 400:
+                errors[status] = errors.get(status, 0) + count
+        lines += [
+            "# HELP wordle_http_errors_total HTTP responses with a 4xx or 5xx status.",
+            "# TYPE wordle_http_errors_total counter",
+        ]
+        for status, count in sorted(errors.items()):
+            lines.append(f'wordle_http_errors_total{{status="{status}"}} {count}')
+
+        lines += [
+            "# HELP wordle_http_request_duration_seconds Time from request line to response, by route.",
+            "# TYPE wordle_http_request_duration_seconds histogram",
+        ]
+        for route, row in sorted(latency.items()):
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS + (math.inf,), row):
+                cumulative += count
+                le = "+Inf" if bound == math.inf else repr(bound)
+                lines.append(f'wordle_http_request_duration_seconds_bucket{{route="{route}",le="{le}"}} {cumulative}')
+            lines.append(f'wordle_http_request_duration_seconds_sum{{route="{route}"}} {row[-1]:.6f}')
+            lines.append(f'wordle_http_request_duration_seconds_count{{route="{route}"}} {cumulative}')
+
+        lines += [
+            "# HELP wordle_sessions Session store statistics (games by status, evictions, backend counters).",
+            "# TYPE wordle_sessions gauge",
+        ]
+        lines.extend(f'wordle_sessions{{stat="{name}"}} {value}' for name, value in sorted(GAMES.stats().items()))
+
+        lines += [
+            "# HELP wordle_word_bank_words Words per loaded word bank.",
+            "# TYPE wordle_word_bank_words gauge",
+        ]
+        for word_length, bank in sorted(WORD_BANK.loaded().items()):
+            lines.append(f'wordle_word_bank_words{{length="{word_length}",list="guesses"}} {len(bank.guesses)}')
+            lines.append(f'wordle_word_bank_words{{length="{word_length}",list="answers"}} {len(bank.answers)}')
+        lines += [
+            "# HELP wordle_word_bank_version Word banks installed per length: 1 at load, +1 per hot reload.",
+            "# TYPE wordle_word_bank_version gauge",
+        ]
+        for word_length in sorted(WORD_BANK.loaded()):
+            lines.append(f'wordle_word_bank_version{{length="{word_length}"}} {WORD_BANK.version(word_length)}')
+        if WORDLIST_WATCHER is not None:
+            lines += [
+                "# HELP wordle_word_bank_reloads_total Word-list changes handled by the watcher.",
+                "# TYPE wordle_word_bank_reloads_total counter",
+                f'wordle_word_bank_reloads_total{{result="swapped"}} {WORDLIST_WATCHER.reloads}',
+                f'wordle_word_bank_reloads_total{{result="failed"}} {WORDLIST_WATCHER.failures}',
+            ]
+
+        if HTTP_POOL is not None:
+            pool = HTTP_POOL.pool_stats()
+            lines += [
+                "# HELP wordle_http_pool Handler pool state: worker threads, busy workers, queued and max connections.",
+                "# TYPE wordle_http_pool gauge",
+            ]
+            for name in ("workers", "busy", "queued", "queue_size"):
+                lines.append(f'wordle_http_pool{{state="{name}"}} {pool[name]}')
+            lines += [
+                "# HELP wordle_http_shed_total Connections answered 503 because the handler queue was full.",
+                "# TYPE wordle_http_shed_total counter",
+                f"wordle_http_shed_total {pool['shed']}",
+            ]
+
+        if ACCESS_LOG is not None:
+            lines += [
+                "# HELP wordle_access_log_records_total Access log records by outcome (sampled: kept while shedding).",
+                "# TYPE wordle_access_log_records_total counter",
+            ]
+            stats = ACCESS_LOG.stats()
+            for outcome in ("written", "dropped", "sampled"):
+                lines.append(f'wordle_access_log_records_total{{outcome="{outcome}"}} {stats[outcome]}')
+            lines += [
+                "# HELP wordle_access_log_queued Access log records waiting for the writer.",
+                "# TYPE wordle_access_log_queued gauge",
+                f"wordle_access_log_queued {stats['queued']}",
+            ]
+
+        if EVENT_LOG is not None:
+            lines += [
+                "# HELP wordle_event_log_records_total Game event records written to the log or dropped.",
+                "# TYPE wordle_event_log_records_total counter",
+            ]
+            stats = EVENT_LOG.stats()
+            for outcome in ("written", "dropped"):
+                lines.append(f'wordle_event_log_records_total{{outcome="{outcome}"}} {stats[outcome]}')
+            lines += [
+                "# HELP wordle_event_log_commits_total Batches written and synced by the event log writer.",
+                "# TYPE wordle_event_log_commits_total counter",
+                f"wordle_event_log_commits_total {stats['commits']}",
+                "# HELP wordle_event_log_queued Game events waiting for the writer.",
+                "# TYPE wordle_event_log_queued gauge",
+                f"wordle_event_log_queued {stats['queued']}",
+            ]
+
+        lines += [
+            "# HELP wordle_start_time_seconds Unix time the server process started.",
+            "# TYPE wordle_start_time_seconds gauge",
+            f"wordle_start_time_seconds {self.started:.3f}",
+        ]
+        return "\n".join(lines) + "\n"
+
+
+METRICS = Metrics()
+
+
+def metrics_route(method: str, path: str) -> str:
+    """Label for a request: its API route, or ``static``/``other`` so label cardinality stays bounded."""
+    if (method, path) in API_ROUTES:
+        return path
+    return "static" if method in ("GET", "HEAD") else "other"
+
+
+class ApiRequest:
+    """Transport-independent view of an HTTP request to an ``/api/`` route."""
+
+    def __init__(self, method: str, path: str, query: str, headers: Mapping[str, str], body: bytes) -> None:
+        self.method = method
+        self.path = path
+        self.query = urllib.parse.parse_qs(query)
+        self.headers = headers
+        self.body = body
+
+    def game_id(self) -> Optional[str]:
+        return game_id_from_cookie(self.headers.get("Cookie"))
+
+    def game(self) -> Optional[GameState]:
+        game_id = self.game_id()
+        return GAMES.get(game_id) if game_id else None
+
+    def json(self) -> Dict[str, object]:
+        payload = json.loads(self.body) if self.body else {}
+        if not isinstance(payload, dict):
+            raise json.JSONDecodeError("Expected a JSON object", self.body.decode("utf-8", "replace"), 0)
+        return payload
+
+
+class ApiResponse:
+    """Result of an API route: a JSON payload, or an error rendered like ``send_error``."""
+
+    def __init__(
+        self,
+        status: HTTPStatus = HTTPStatus.OK,
+        payload: Optional[Dict[str, object]] = None,
+        error: Optional[str] = None,
+        cookie: Optional[str] = None,
+        encoded: Optional[bytes] = None,
+        content_type: str = "application/json",
+        headers: Sequence[Tuple[str, str]] = (),
+    ) -> None:
+        self.status = status
+        self.payload = payload
+        self.error = error
+        self.cookie = cookie
+        # Pre-serialized body, used instead of encoding ``payload`` as JSON.
+        self.encoded = encoded
+        self.content_type = content_type
+        # Extra response headers, e.g. Retry-After.
+        self.headers = headers
+
+    @classmethod
+    def fail(cls, status: HTTPStatus, message: str) -> "ApiResponse":
+        return cls(status, error=message)
+
+    def body(self) -> bytes:
+        if self.encoded is not None:
+            return self.encoded
+        return json.dumps(self.payload).encode("utf-8")
+
+
+def game_id_from_cookie(cookie_header: Optional[str]) -> Optional[str]:
+    # A plain split is several times cheaper than SimpleCookie, and our values are never quoted.
+    if not cookie_header:
+        return None
+    for part in cookie_header.split(";"):
+        name, sep, value = part.partition("=")
+        if sep and name.strip() == "gameId":
+            return value.strip().strip('"') or None
+    return None
+
+
+def session_cookie(game: GameState) -> str:
+    return f"gameId={GAMES.session_key(game)}; Path=/"
+
+
+def api_state(request: ApiRequest) -> ApiResponse:
+    game = request.game()
+    if not game:
+        return ApiResponse.fail(HTTPStatus.NOT_FOUND, "No active game")
+    return ApiResponse(encoded=game.encode_response())
+
+
+def api_hint(request: ApiRequest) -> ApiResponse:
+    game = request.game()
+    if not game:
+        return ApiResponse.fail(HTTPStatus.NOT_FOUND, "No active game")
+    try:
+        hint = hint_for_game(game)
+    except ValueError as exc:
+        return ApiResponse(HTTPStatus.BAD_REQUEST, {"error": str(exc)})
+    if hint is None:
+        return ApiResponse(
+            HTTPStatus.SERVICE_UNAVAILABLE,
+            {"error": "Hints are still warming up. Try again shortly."},
+            headers=[("Retry-After", str(HINT_RETRY_AFTER))],
+        )
+    return ApiResponse(payload=hint)
+
+
+def api_remaining(request: ApiRequest) -> ApiResponse:
+    game = request.game()
+    if not game:
+        return ApiResponse.fail(HTTPStatus.NOT_FOUND, "No active game")
+    try:
+        sample = int(request.query.get("sample", ["0"])[0])
+    except ValueError:
+        return ApiResponse.fail(HTTPStatus.BAD_REQUEST, "sample must be an integer")
+    return ApiResponse(payload=remaining_for_game(game, sample))
+
+
+def api_daily(request: ApiRequest) -> ApiResponse:
+    try:
+        word_length = int(request.query.get("length", ["5"])[0])
+    except ValueError:
+        return ApiResponse.fail(HTTPStatus.BAD_REQUEST, "length must be an integer")
+    if word_length not in SUPPORTED_WORD_LENGTHS:
+        return ApiResponse.fail(HTTPStatus.BAD_REQUEST, "Unsupported word length")
+    today = datetime.datetime.now(datetime.timezone.utc).date()
+    raw_date = request.query.get("date", [None])[0]
+    try:
+        day = datetime.date.fromisoformat(raw_date) if raw_date else today
+    except ValueError:
+        return ApiResponse.fail(HTTPStatus.BAD_REQUEST, "date must be YYYY-MM-DD")
+    # Allow one day of lead for clients ahead of UTC, but no further peeking.
+    if day > today + datetime.timedelta(days=1):
+        return ApiResponse.fail(HTTPStatus.BAD_REQUEST, "That puzzle is not out yet")
+    if day < DAILY_EPOCH:
+        return ApiResponse.fail(HTTPStatus.BAD_REQUEST, f"Daily puzzles start on {DAILY_EPOCH.isoformat()}")
+
+    bank = WORD_BANK[word_length]
+    number, answer = daily_answer(word_length, day, bank)
+    cookie = None
+    game = request.game()
+    # Resume the caller's attempt at this puzzle instead of restarting it. A random game that
+    # happens to share today's answer is not that attempt.
+    if game is None or game.word_length != word_length or game.daily != number:
+        game = GameState(
+            answer, bank.guesses, word_length, feedback=get_feedback_table(word_length, bank=bank), bank=bank
+        )
+        game.daily = number
+        GAMES.add(game)
+        GAME_STATS.start(word_length)
+        if EVENT_LOG is not None:
+            EVENT_LOG.start(game)
+        cookie = session_cookie(game)
+    payload = game.to_response()
+    payload["daily"] = {"date": day.isoformat(), "number": number}
+    return ApiResponse(payload=payload, cookie=cookie)
+
+
+def api_new_game(request: ApiRequest) -> ApiResponse:
+    try:
+        payload = request.json()
+    except json.JSONDecodeError:
+        return ApiResponse.fail(HTTPStatus.BAD_REQUEST, "Invalid JSON body")
+
+    requested_length = payload.get("wordLength", 5)
+    try:
+        word_length = int(requested_length)
+    except (TypeError, ValueError):
+        return ApiResponse.fail(HTTPStatus.BAD_REQUEST, "wordLength must be an integer")
+    if word_length not in SUPPORTED_WORD_LENGTHS:
+        return ApiResponse.fail(HTTPStatus.BAD_REQUEST, "Unsupported word length")
+
+    # One read of the current snapshot, so a concurrent reload cannot mix two banks in one game.
+    bank = WORD_BANK[word_length]
+    game = GameState(
+        answer=pick_word(word_length, bank),
+        allowed_guesses=bank.guesses,
+        word_length=word_length,
+        feedback=get_feedback_table(word_length, bank=bank),
+        bank=bank,
+    )
+    GAMES.add(game)
+    GAME_STATS.start(word_length)
+    if EVENT_LOG is not None:
+        EVENT_LOG.start(game)
+    return ApiResponse(encoded=game.encode_response(), cookie=session_cookie(game))
+
+
+def api_guess(request: ApiRequest) -> ApiResponse:
+    game_id = request.game_id()
+    if not game_id:
+        return ApiResponse.fail(HTTPStatus.NOT_FOUND, "No active game. Start a new one first.")
+    try:
+        payload = request.json()
+    except json.JSONDecodeError:
+        return ApiResponse.fail(HTTPStatus.BAD_REQUEST, "Invalid JSON body")
+
+    guess = payload.get("guess", "")
+    # locked() yields None for unknown ids; a separate membership test would load (or decrypt) the game twice.
+    with GAMES.locked(game_id) as game:
+        if not game:
+            return ApiResponse.fail(HTTPStatus.NOT_FOUND, "No active game. Start a new one first.")
+        try:
+            encoded = game.apply_guess_encoded(str(guess))
+        except ValueError as exc:
+            return ApiResponse(HTTPStatus.BAD_REQUEST, {"error": str(exc)})
+    return ApiResponse(encoded=encoded, cookie=session_cookie(game) if GAMES.reissue_cookie else None)
+
+
+METRICS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def api_stats(request: ApiRequest) -> ApiResponse:
+    return ApiResponse(payload=GAME_STATS.snapshot())
+
+
+def api_metrics(request: ApiRequest) -> ApiResponse:
+    return ApiResponse(encoded=METRICS.render().encode("utf-8"), content_type=METRICS_CONTENT_TYPE)
+
+
+API_ROUTES: Dict[Tuple[str, str], Callable[[ApiRequest], ApiResponse]] = {
+    ("GET", "/api/state"): api_state,
+    ("GET", "/api/hint"): api_hint,
+    ("GET", "/api/remaining"): api_remaining,
+    ("GET", "/api/daily"): api_daily,
+    ("GET", "/api/stats"): api_stats,
+    ("POST", "/api/new-game"): api_new_game,
+    ("POST", "/api/guess"): api_guess,
+    ("GET", "/metrics"): api_metrics,
+}
+# Routes that look up or store games in GAMES.
+SESSION_ROUTES = frozenset((api_state, api_hint, api_remaining, api_daily, api_new_game, api_guess))
+
+
+# Types worth compressing; images and fonts are already compressed.
+COMPRESSIBLE_TYPES = ("text/", "application/javascript", "application/json", "application/xml", "image/svg+xml")
+
+
+class StaticAsset:
+    """One static file held in memory with its precompressed variants."""
+
+    def __init__(self, body: bytes, content_type: str, mtime: float) -> None:
+        self.content_type = content_type
+        self.last_modified = email.utils.formatdate(mtime, usegmt=True)
+        tag = hashlib.sha1(body).hexdigest()[:16]
+        # encoding -> (body, ETag); each representation gets its own strong validator.
+        self.variants: Dict[str, Tuple[bytes, str]] = {"identity": (body, f'"{tag}"')}
+        if content_type.startswith(COMPRESSIBLE_TYPES):
+            compressed = {"gzip": gzip.compress(body, 9, mtime=0)}
+            if brotli is not None:
+                compressed["br"] = brotli.compress(body)
+            for encoding, data in compressed.items():
+                if len(data) < len(body):
+                    self.variants[encoding] = (data, f'"{tag}-{encoding}"')
+        self.etags = {etag for _body, etag in self.variants.values()}
+
+    @classmethod
+    def load(cls, path: Path) -> "StaticAsset":
+        content_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+        return cls(path.read_bytes(), content_type, path.stat().st_mtime)
+
+    def select(self, accept_encoding: Optional[str]) -> Tuple[str, bytes, str]:
+        """Return ``(encoding, body, etag)`` for the best variant the client accepts."""
+        weights = accepted_encodings(accept_encoding)
+        for encoding in ("br", "gzip"):
+            if encoding in self.variants and weights.get(encoding, weights.get("*", 0.0)) > 0:
+                return (encoding, *self.variants[encoding])
+        return ("identity", *self.variants["identity"])
+
+    def matches(self, if_none_match: Optional[str]) -> bool:
+        if not if_none_match:
+            return False
+        for candidate in if_none_match.split(","):
+            candidate = candidate.strip()
+            # If-None-Match uses weak comparison, and every variant has the same content.
+            if candidate == "*" or candidate.removeprefix("W/") in self.etags:
+                return True
+        return False
+
+    def validators(self, etag: str) -> List[Tuple[str, str]]:
+        """Headers sent with both 200 and 304 responses."""
+        return [
+            ("ETag", etag),
+            ("Last-Modified", self.last_modified),
+            ("Cache-Control", "no-cache"),
+            ("Vary", "Accept-Encoding"),
+        ]
+
+    def headers(self, encoding: str, etag: str) -> List[Tuple[str, str]]:
+        headers = self.validators(etag)
+        if encoding != "identity":
+            headers.append(("Content-Encoding", encoding))
+        return headers
+
+
+def accepted_encodings(header: Optional[str]) -> Dict[str, float]:
+    """Map each content coding in an ``Accept-Encoding`` header to its q-value."""
+    weights: Dict[str, float] = {}
+    for item in (header or "").split(","):
+        name, _, params = item.partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        weight = params.strip().lower()
+        try:
+            weights[name] = float(weight[2:]) if weight.startswith("q=") else 1.0
+        except ValueError:
+            weights[name] = 0.0
+    return weights
+
+
+class StaticAssets:
+    """In-memory copy of a static directory, keyed by URL path.
+
+    Every file is read (and compressed) once. Lookups re-check the directory's
+    sizes and mtimes at most every ``check_interval`` seconds and reload only
+    the files that changed, so edits show up without a restart. Paths outside
+    the directory can never match, because only scanned files are keys.
+    """
+
+    def __init__(self, root: Path, check_interval: float = 1.0) -> None:
+        self.root = Path(root).resolve()
+        self.check_interval = check_interval
+        self._assets: Dict[str, StaticAsset] = {}
+        self._stamps: Dict[str, Tuple[int, int]] = {}
+        self._checked = -math.inf
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._assets)
+
+    def lookup(self, url_path: str) -> Optional[StaticAsset]:
+        if time.monotonic() - self._checked > self.check_interval:
+            self.refresh()
+        key = urllib.parse.unquote(url_path).lstrip("/")
+        if not key or key.endswith("/"):
+            key += "index.html"
+        return self._assets.get(key)
+
+    def refresh(self) -> bool:
+        """Reload changed files; return whether anything changed."""
+        # One thread rescans; the others keep serving the current snapshot.
+        if not self._lock.acquire(blocking=False):
+            return False
+        try:
+            self._checked = time.monotonic()
+            stamps: Dict[str, Tuple[int, int]] = {}
+            for directory, _subdirs, names in os.walk(self.root):
+                for name in names:
+                    path = Path(directory) / name
+                    with contextlib.suppress(OSError):
+                        stat = path.stat()
+                        stamps[path.relative_to(self.root).as_posix()] = (stat.st_size, stat.st_mtime_ns)
+            if stamps == self._stamps:
+                return False
+            assets: Dict[str, StaticAsset] = {}
+            for key, stamp in stamps.items():
+                asset = self._assets.get(key)
+                if asset is None or self._stamps.get(key) != stamp:
+                    try:
+                        asset = StaticAsset.load(self.root / key)
+                    except OSError:
+                        continue
+                assets[key] = asset
+            self._assets, self._stamps = assets, stamps
+            return True
+        finally:
+            self._lock.release()
+
+
+STATIC_ASSETS: Optional[StaticAssets] = StaticAssets(STATIC_DIR)
+
+
+def configure_static_cache(enabled: bool) -> None:
+    """Serve ``static/`` from memory (the default) or straight from disk on every request."""
+    global STATIC_ASSETS
+    STATIC_ASSETS = StaticAssets(STATIC_DIR) if enabled else None
+
+
+DEFAULT_PROFILE_DIR = ROOT / "profiles"
+
+
+class RequestProfiler:
+    """Opt-in profiling of live ``WordleHandler`` requests.
+
+    A ``sample_rate`` fraction of requests runs under ``cProfile`` and is written
+    as a ``.pstats`` file. Slowness is only known once a request ends, so when
+    ``slow_threshold`` is set, a background thread samples the stack of every
+    in-flight request every ``interval`` seconds. Requests that finish slower
+    than the threshold have their samples written as a ``.collapsed`` file: one
+    ``frame;frame;... count`` line per stack, the format flamegraph.pl and
+    speedscope read. Only the newest ``keep`` files are kept.
+    """
+
+    def __init__(
+        self,
+        directory: Path = DEFAULT_PROFILE_DIR,
+        sample_rate: float = 0.0,
+        slow_threshold: Optional[float] = None,
+        keep: int = 200,
+        interval: float = 0.005,
+    ) -> None:
+        self.directory = directory
+        self.sample_rate = sample_rate
+        self.slow_threshold = slow_threshold
+        self.keep = keep
+        self.interval = interval
+        self.written = 0
+        # Thread id -> stack samples of the request that thread is serving.
+        self._inflight: Dict[int, Counter] = {}
+        # Python 3.12+ allows one active cProfile per process; a sampled request that finds it busy goes unprofiled.
+        self._cprofile_lock = threading.Lock()
+        self._sequence = 0
+        self._files_lock = threading.Lock()
+        existing = [path for path in directory.glob("*") if path.suffix in (".pstats", ".collapsed")]
+        self._files = deque(sorted(existing, key=lambda path: path.stat().st_mtime))
+        self._stop = threading.Event()
+        self._sampler: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self.slow_threshold is None or self._sampler is not None:
+            return
+        self._stop.clear()
+        self._sampler = threading.Thread(target=self._sample_loop, name="request-sampler", daemon=True)
+        self._sampler.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._sampler is not None:
+            self._sampler.join(timeout=1.0)
+            self._sampler = None
+
+    def begin(self) -> Optional[cProfile.Profile]:
+        """Start watching the calling thread's request; returns a running profile if it was sampled."""
+        if self.slow_threshold is not None:
+            self._inflight[threading.get_ident()] = Counter()
+        if self.sample_rate and random.random() < self.sample_rate and self._cprofile_lock.acquire(blocking=False):
+            profile = cProfile.Profile()
+            profile.enable()
+            return profile
+        return None
+
+    def end(self, profile: Optional[cProfile.Profile], route: str, seconds: float) -> None:
+        samples = self._inflight.pop(threading.get_ident(), None)
+        if profile is not None:
+            profile.disable()
+            self._cprofile_lock.release()
+            self._write(route, seconds, ".pstats", profile.dump_stats)
+        if samples and self.slow_threshold is not None and seconds >= self.slow_threshold:
+            # Copy first: the sampler may still be adding to this Counter.
+            lines = "".join(f"{stack} {count}\n" for stack, count in dict(samples).items())
+            self._write(route, seconds, ".collapsed", lambda path: path.write_text(lines, encoding="utf-8"))
+
+    def _sample_loop(self) -> None:
+        while not self._stop.wait(self.interval):
+            if not self._inflight:
+                continue
+            frames = sys._current_frames()
+            for ident, samples in list(self._inflight.items()):
+                frame = frames.get(ident)
+                if frame is not None:
+                    samples[self._collapse(frame)] += 1
+
+    @staticmethod
+    def _collapse(frame) -> str:
+        names = []
+        while frame is not None:
+            code = frame.f_code
+            names.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+            frame = frame.f_back
+        return ";".join(reversed(names))
+
+    def _write(self, route: str, seconds: float, suffix: str, dump: Callable[[Path], object]) -> None:
+        with self._files_lock:
+            self._sequence += 1
+            sequence = self._sequence
+        slug = route.strip("/").replace("/", "-") or "root"
+        stamp = time.strftime("%Y%m%dT%H%M%S")
+        path = self.directory / f"{stamp}-{os.getpid()}-{sequence}-{slug}-{seconds * 1e3:.0f}ms{suffix}"
+        self.directory.mkdir(parents=True, exist_ok=True)
+        dump(path)
+        with self._files_lock:
+            self.written += 1
+            self._files.append(path)
+            while len(self._files) > self.keep:
+                self._files.popleft().unlink(missing_ok=True)
+
+
+PROFILER: Optional[RequestProfiler] = None
+
+
+def configure_profiling(
+    sample_rate: float = 0.0, slow_ms: Optional[float] = None, directory: Path = DEFAULT_PROFILE_DIR, keep: int = 200
+) -> None:
+    """Profile threaded-server requests; disabled unless a sample rate or slow threshold is given."""
+    global PROFILER
+    if sample_rate <= 0 and slow_ms is None:
+        PROFILER = None
+        return
+    slow_threshold = slow_ms / 1e3 if slow_ms is not None else None
+    PROFILER = RequestProfiler(directory, sample_rate, slow_threshold, keep)
+
+
+class AccessLog:
+    """Buffered access log written by a background thread.
+
+    Request threads only append a small tuple to a deque, which is thread-safe
+    without a lock. Formatting, timestamps included, happens on the writer
+    thread, which drains the queue every ``flush_interval`` seconds and writes
+    each batch with one call. Output is the ``http.server`` common format or
+    JSON lines, to stdout (``"-"``) or a file rotated at ``max_bytes``.
+
+    Past ``max_queue`` records the log sheds load instead of blocking. Only one
+    record in ``sample_every`` is still queued, up to twice the limit; the rest
+    are dropped and counted.
+    """
+
+    FORMATS = ("common", "json")
+
+    def __init__(
+        self,
+        target: str = "-",
+        fmt: str = "common",
+        max_queue: int = 100_000,
+        sample_every: int = 100,
+        flush_interval: float = 0.1,
+        max_bytes: int = 64 << 20,
+        backups: int = 5,
+    ) -> None:
+        if fmt not in self.FORMATS:
+            raise ValueError(f"Unknown access log format: {fmt}")
+        self.target = target
+        self.fmt = fmt
+        self.max_queue = max_queue
+        self.sample_every = sample_every
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.written = 0
+        self.dropped = 0
+        self.sampled = 0
+        self._overflow = 0
+        # (unix time, client, request line or message, status or None, seconds or None)
+        self._queue: deque = deque()
+        self._drop_lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._writer: Optional[threading.Thread] = None
+        self._file = None
+        self._size = 0
+        self._stamp_second = -1
+        self._stamp = ""
+
+    def request(self, client: str, request_line: str, status: int, seconds: float) -> None:
+        self._put((time.time(), client, request_line, status, seconds))
+
+    def message(self, client: str, text: str) -> None:
+        self._put((time.time(), client, text, None, None))
+
+    def _put(self, record: tuple) -> None:
+        pending = self._queue
+        if len(pending) >= self.max_queue:
+            with self._drop_lock:
+                self._overflow += 1
+                # Keep a thin sample of traffic while shedding, but never let the queue grow without bound.
+                if self._overflow % self.sample_every or len(pending) >= 2 * self.max_queue:
+                    self.dropped += 1
+                    return
+                self.sampled += 1
+        pending.append(record)
+        if self._writer is None:
+            self._start()
+
+    def _start(self) -> None:
+        # Started on first use, so a pre-forked worker gets its own writer.
+        with self._start_lock:
+            if self._writer is None:
+                self._stop.clear()
+                self._writer = threading.Thread(target=self._run, name="access-log", daemon=True)
+                self._writer.start()
+
+    def close(self) -> None:
+        """Write everything queued so far and stop the writer."""
+        writer = self._writer
+        if writer is not None:
+            self._stop.set()
+            writer.join(timeout=5.0)
+            self._writer = None
+        self._drain()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def stats(self) -> Dict[str, int]:
+        return {"written": self.written, "dropped": self.dropped, "sampled": self.sampled, "queued": len(self._queue)}
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.flush_interval):
+            self._drain()
+
+    def _drain(self) -> None:
+        pending = self._queue
+        while pending:
+            lines = []
+            for _ in range(min(len(pending), 4096)):
+                lines.append(self._format(pending.popleft()))
+            self._emit("".join(lines))
+            self.written += len(lines)
+
+    def _format(self, record: tuple) -> str:
+        timestamp, client, text, status, seconds = record
+        if self.fmt == "json":
+            entry: Dict[str, object] = {
+                "time": datetime.datetime.fromtimestamp(timestamp, datetime.timezone.utc).isoformat(
+                    timespec="milliseconds"
+                ),
+                "client": client,
+            }
+            if status is None:
+                entry["message"] = text
+            else:
+                method, _, rest = text.partition(" ")
+                target, _, protocol = rest.rpartition(" ") if " " in rest else (rest, "", "")
+                entry.update(
+                    method=method, path=target, protocol=protocol, status=status, durationMs=round(seconds * 1e3, 3)
+                )
+            return json.dumps(entry) + "\n"
+        second = int(timestamp)
+        if second != self._stamp_second:
+            self._stamp_second = second
+            self._stamp = time.strftime("%d/%b/%Y %H:%M:%S", time.localtime(second))
+        if status is None:
+            return f"{client} - - [{self._stamp}] {text}\n"
+        return f'{client} - - [{self._stamp}] "{text}" {status} -\n'
+
+    def _emit(self, text: str) -> None:
+        if self.target == "-":
+            sys.stdout.write(text)
+            sys.stdout.flush()
+            return
+        if self._file is None:
+            self._file = open(self.target, "a", encoding="utf-8")
+            self._size = self._file.tell()
+        self._file.write(text)
+        self._file.flush()
+        self._size += len(text)
+        if self._size >= self.max_bytes:
+            self._rotate()
+
+    def _rotate(self) -> None:
+        self._file.close()
+        self._file = None
+        for index in range(self.backups - 1, 0, -1):
+            older = Path(f"{self.target}.{index}")
+            if older.exists():
+                older.replace(f"{self.target}.{index + 1}")
+        if self.backups:
+            Path(self.target).replace(f"{self.target}.1")
+        else:
+            Path(self.target).unlink(missing_ok=True)
+
+
+ACCESS_LOG: Optional[AccessLog] = AccessLog()
+
+
+def configure_access_log(target: Optional[str] = "-", fmt: str = "common", max_bytes: int = 64 << 20) -> None:
+    """Log requests to ``target`` (``"-"`` for stdout, a file path, or ``None`` for no access log)."""
+    global ACCESS_LOG
+    ACCESS_LOG = AccessLog(target, fmt, max_bytes=max_bytes) if target is not None else None
+
+
+class GameEventLog:
+    """Append-only binary log of game starts and guesses, for offline analytics.
+
+    Each event is one fixed-size :attr:`RECORD`: game id, Unix time, bank digest
+    prefix, answer index, guess index, feedback pattern (see
+    :func:`encode_verdicts`), kind, word length, guess number and outcome.
+    Indexes refer to the bank snapshot named by the prefix. The first time a
+    snapshot is seen, its lists are saved next to the segments as
+    ``bank-<length>-<digest>.json``, so records stay decodable after a reload.
+
+    Request threads append a tuple to a deque, as :class:`AccessLog` does, and
+    the writer packs each batch into one buffer. The batch is written with one
+    ``write`` and committed with one ``fsync`` (group commit), so a crash loses
+    at most the last ``flush_interval``. Segments are ``events-<ns>-<pid>.wev``
+    files: a :attr:`HEADER` then records. A new one starts past
+    ``segment_bytes``, so workers never share a file. Readers ignore a torn
+    trailing record. Past ``max_queue`` queued events, new ones are dropped and
+    counted.
+    """
+
+    MAGIC = b"WEVT"
+    VERSION = 1
+    # magic, version, record size, segment creation time (ns); padded to one record
+    HEADER = struct.Struct("<4sHHQ16x")
+    # game id, unix seconds, bank digest prefix, answer index, guess index, pattern,
+    # kind, word length, guess number, outcome
+    RECORD = struct.Struct("<16sIHHHHBBBB")
+    START, GUESS = 0, 1
+    OUTCOMES = {"in_progress": 0, "won": 1, "lost": 2}
+    # Index stored when a word is not in the bank snapshot.
+    NO_INDEX = 0xFFFF
+
+    def __init__(
+        self,
+        directory: Path,
+        segment_bytes: int = 256 << 20,
+        max_queue: int = 1_000_000,
+        flush_interval: float = 0.05,
+        sync: bool = True,
+    ) -> None:
+        self.directory = Path(directory)
+        self.segment_bytes = segment_bytes
+        self.max_queue = max_queue
+        self.flush_interval = flush_interval
+        self.sync = sync
+        self.written = 0
+        self.dropped = 0
+        self.commits = 0
+        # (kind, unix time, game id, bank, answer index, answer, guess index, guess, guess number, outcome, verdicts)
+        self._queue: deque = deque()
+        self._start_lock = threading.Lock()
+        # close() may drain while a slow writer is still finishing its batch.
+        self._drain_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._writer: Optional[threading.Thread] = None
+        self._file = None
+        self._size = 0
+        self._banks_saved: Set[str] = set()
+        self._patterns: Dict[Tuple[str, ...], int] = {}
+
+    def start(self, game: GameState) -> None:
+        """Record a new game; call after it is created, before any guess."""
+        if game.bank is not None:
+            event = (self.START, time.time(), game.id, game.bank, game.answer_index, game.answer, -1, None, 0, 0, None)
+            self._put(event)
+
+    def guess(self, game: GameState, word: str, verdicts: Sequence[str], guess_index: int = -1) -> None:
+        """Record ``word`` just added to ``game.guesses``; call with ``game.lock`` held.
+
+        Indexes already known to the caller (``-1`` when not) save the writer a lookup.
+        """
+        if game.bank is not None:
+            self._put(
+                (
+                    self.GUESS,
+                    time.time(),
+                    game.id,
+                    game.bank,
+                    game.answer_index,
+                    game.answer,
+                    guess_index,
+                    word,
+                    len(game.guesses),
+                    self.OUTCOMES[game.status],
+                    verdicts,
+                )
+            )
+
+    def _put(self, event: tuple) -> None:
+        if len(self._queue) >= self.max_queue:
+            self.dropped += 1
+            return
+        self._queue.append(event)
+        if self._writer is None:
+            self._start()
+
+    def _start(self) -> None:
+        # Started on first use, so a pre-forked worker gets its own writer and segments.
+        with self._start_lock:
+            if self._writer is None:
+                self._stop.clear()
+                self._writer = threading.Thread(target=self._run, name="event-log", daemon=True)
+                self._writer.start()
+
+    def close(self) -> None:
+        """Commit everything queued so far and stop the writer."""
+        writer = self._writer
+        if writer is not None:
+            self._stop.set()
+            writer.join(timeout=5.0)
+            self._writer = None
+        self._drain()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def stats(self) -> Dict[str, int]:
+        return {"written": self.written, "dropped": self.dropped, "commits": self.commits, "queued": len(self._queue)}
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self._drain()
+            except OSError:
+                traceback.print_exc()
+                time.sleep(1.0)
+
+    def _drain(self) -> None:
+        with self._drain_lock:
+            self._drain_locked()
+
+    def _drain_locked(self) -> None:
+        pending = self._queue
+        record = self.RECORD
+        while pending:
+            count = min(len(pending), 65536)
+            buffer = bytearray(count * record.size)
+            for offset in range(0, len(buffer), record.size):
+                event = pending.popleft()
+                kind, when, game_id, bank, answer_index, answer, guess_index, word, number, outcome, verdicts = event
+                if bank.digest not in self._banks_saved:
+                    self._save_bank(bank)
+                if answer_index < 0:
+                    answer_index = bank.answers.find(answer)
+                if kind == self.GUESS:
+                    if guess_index < 0:
+                        guess_index = bank.guesses.find(word)
+                    verdicts = tuple(verdicts)
+                    pattern = self._patterns.get(verdicts)
+                    if pattern is None:
+                        pattern = self._patterns[verdicts] = encode_verdicts(verdicts)
+                else:
+                    pattern = self.NO_INDEX
+                record.pack_into(
+                    buffer,
+                    offset,
+                    bytes.fromhex(game_id.replace("-", "")),
+                    int(when),
+                    int(bank.digest[:4], 16),
+                    answer_index if answer_index >= 0 else self.NO_INDEX,
+                    guess_index if guess_index >= 0 else self.NO_INDEX,
+                    pattern,
+                    kind,
+                    bank.word_length,
+                    number,
+                    outcome,
+                )
+            self._commit(buffer)
+            self.written += count
+
+    def _commit(self, buffer: bytearray) -> None:
+        if self._file is None or self._size >= self.segment_bytes:
+            self._open_segment()
+        self._file.write(buffer)
+        self._file.flush()
+        if self.sync:
+            os.fsync(self._file.fileno())
+        self._size += len(buffer)
+        self.commits += 1
+
+    def _open_segment(self) -> None:
+        if self._file is not None:
+            self._file.close()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        created = time.time_ns()
+        self._file = open(self.directory / f"events-{created}-{os.getpid()}.wev", "ab")
+        self._file.write(self.HEADER.pack(self.MAGIC, self.VERSION, self.RECORD.size, created))
+        self._size = self.HEADER.size
+
+    def _save_bank(self, bank: WordBank) -> None:
+        path = self.directory / f"bank-{bank.word_length}-{bank.digest}.json"
+        if not path.exists():
+            self.directory.mkdir(parents=True, exist_ok=True)
+            payload = {
+                "wordLength": bank.word_length,
+                "digest": bank.digest,
+                "guesses": list(bank.guesses),
+                "answers": list(bank.answers),
+            }
+            # Write then rename so a reader never loads a partial list.
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(payload))
+            os.replace(tmp_path, path)
+        self._banks_saved.add(bank.digest)
+
+
+EVENT_LOG: Optional[GameEventLog] = None
+
+
+def configure_event_log(directory: Optional[Path], segment_bytes: int = 256 << 20) -> None:
+    """Write game events under ``directory``; ``None`` (the default) turns the event log off."""
+    global EVENT_LOG
+    EVENT_LOG = GameEventLog(directory, segment_bytes) if directory is not None else None
+
+
+# API bodies are small JSON objects; anything larger is refused before it is read.
+MAX_REQUEST_BODY = 64 * 1024
+
+
+class WordleHandler(SimpleHTTPRequestHandler):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, directory=str(STATIC_DIR), **kwargs)
+
+    def parse_request(self) -> bool:
+        # Runs once the request line is read, so keep-alive idle time is not counted as latency.
+        self._started = time.perf_counter()
+        if self._profiler is not None:
+            self._profile = self._profiler.begin()
+            self._profiling = True
+        return super().parse_request()
+
+    def send_response(self, code: int, message: Optional[str] = None) -> None:
+        self._status = int(code)
+        super().send_response(code, message)
+
+    def handle_one_request(self) -> None:
+        self._started = time.perf_counter()
+        self._status: Optional[int] = None
+        self._profiler = PROFILER
+        self._profile: Optional[cProfile.Profile] = None
+        self._profiling = False
+        try:
+            super().handle_one_request()
+        finally:
+            self._finish_request()
+
+    def _finish_request(self) -> None:
+        if self._status is None and not self._profiling:
+            return
+        elapsed = time.perf_counter() - self._started
+        method = self.command or "-"
+        route = metrics_route(method, urllib.parse.urlparse(self.path).path) if self.command else "other"
+        if self._profiling:
+            self._profiler.end(self._profile, route, elapsed)
+        if self._status is not None:
+            METRICS.record(route, method, self._status, elapsed)
+            if ACCESS_LOG is not None:
+                ACCESS_LOG.request(self.client_address[0], self.requestline, self._status, elapsed)
+
+    def do_GET(self) -> None:
+        if not self._dispatch_api("GET") and not self._send_static(head=False):
+            super().do_GET()
+
+    def do_HEAD(self) -> None:
+        if not self._send_static(head=True):
+            super().do_HEAD()
+
+    def do_POST(self) -> None:
+        if not self._dispatch_api("POST"):
+            self.send_error(HTTPStatus.NOT_FOUND, "Unknown endpoint")
+
+    def _dispatch_api(self, method: str) -> bool:
+        parsed = urllib.parse.urlparse(self.path)
+        route = API_ROUTES.get((method, parsed.path))
+        if route is None:
+            return False
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            length = -1
+        if length < 0:
+            self.send_error(HTTPStatus.BAD_REQUEST, "Invalid Content-Length")
+            return True
+        if length > MAX_REQUEST_BODY:
+            self.close_connection = True
+            self.send_error(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Request body too large")
+            return True
+        raw_body = self.rfile.read(length) if length else b""
+        self._send_api_response(route(ApiRequest(method, parsed.path, parsed.query, self.headers, raw_body)))
+        return True
+
+    def _send_static(self, head: bool) -> bool:
+        """Answer from the in-memory asset cache; return False to fall back to the disk handler."""
+        if STATIC_ASSETS is None:
+            return False
+        asset = STATIC_ASSETS.lookup(urllib.parse.urlparse(self.path).path)
+        if asset is None:
+            return False
+        encoding, body, etag = asset.select(self.headers.get("Accept-Encoding"))
+        if asset.matches(self.headers.get("If-None-Match")):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            for name, value in asset.validators(etag):
+                self.send_header(name, value)
+            self.end_headers()
+            return True
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", asset.content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in asset.headers(encoding, etag):
+            self.send_header(name, value)
+        self.end_headers()
+        if not head:
+            self.wfile.write(body)
+        return True
+
+    def _send_api_response(self, response: ApiResponse) -> None:
+        if response.error is not None:
+            self.send_error(response.status, response.error)
+            return
+        body = response.body()
+        self.send_response(response.status)
+        self.send_header("Content-Type", response.content_type)
+        self.send_header("Content-Length", str(len(body)))
+        if response.cookie:
+            self.send_header("Set-Cookie", response.cookie)
+        for name, value in response.headers:
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_request(self, code: object = "-", size: object = "-") -> None:
+        # Requests are logged from _finish_request, once their duration is known.
+        pass
+
+    def log_message(self, fmt: str, *args) -> None:
+        if ACCESS_LOG is not None:
+            ACCESS_LOG.message(self.client_address[0], fmt % args)
+
+
+# Limits for the asyncio server's request parser.
+MAX_REQUEST_LINE = 8192
+MAX_HEADER_COUNT = 100
+KEEPALIVE_TIMEOUT = 15.0
+# Once the request line has arrived, time allowed for the headers, and then again for the body.
+REQUEST_TIMEOUT = 15.0
+
+
+class AsyncWordleServer:
+    """Single event-loop HTTP/1.1 server for the API routes and ``static/``.
+
+    Connections are persistent by default (HTTP/1.1) and requests are answered in
+    order, so pipelined requests on one connection work. Routes, cookies and
+    payloads are the ones :class:`WordleHandler` serves.
+    """
+
+    server_version = "WordleAsync/1.0"
+
+    def __init__(self, host: str, port: int, static_dir: Path = STATIC_DIR, reuse_port: bool = False) -> None:
+        self.host = host
+        self.port = port
+        self.static_dir = static_dir.resolve()
+        self.reuse_port = reuse_port
+        if self.static_dir == STATIC_DIR.resolve():
+            self.assets = STATIC_ASSETS
+        else:
+            self.assets = StaticAssets(self.static_dir)
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._connections: Set[asyncio.Task] = set()
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(
+            self._handle_connection, self.host, self.port, reuse_address=True, reuse_port=self.reuse_port or None
+        )
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            await self.start()
+        try:
+            async with self._server:
+                await self._server.serve_forever()
+        finally:
+            # Close connections still open at shutdown ourselves, so none is reported as a failed task.
+            for task in self._connections:
+                task.cancel()
+            await asyncio.gather(*self._connections, return_exceptions=True)
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        peer = writer.get_extra_info("peername")
+        client = peer[0] if peer else "-"
+        task = asyncio.current_task()
+        self._connections.add(task)
+        try:
+            while True:
+                try:
+                    async with asyncio.timeout(KEEPALIVE_TIMEOUT):
+                        request_line = await reader.readline()
+                except asyncio.TimeoutError:
+                    break
+                except ValueError:
+                    # readline() gives up on lines longer than the stream limit.
+                    self._reject(writer, time.perf_counter(), HTTPStatus.REQUEST_URI_TOO_LONG, "Request line too long")
+                    await writer.drain()
+                    break
+                if not request_line:
+                    break
+                keep_alive = await self._handle_request(client, request_line, reader, writer)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+            pass
+        except asyncio.CancelledError:
+            # Shutdown. Ending normally keeps asyncio's stream callback from logging the cancelled task.
+            pass
+        finally:
+            self._connections.discard(task)
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def _handle_request(
+        self, client: str, request_line: bytes, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> bool:
+        started = time.perf_counter()
+        parts = request_line.decode("iso-8859-1").rstrip("\r\n").split()
+        if len(request_line) > MAX_REQUEST_LINE or len(parts) != 3 or not parts[2].startswith("HTTP/"):
+            return self._reject(writer, started, HTTPStatus.BAD_REQUEST, "Bad request syntax")
+        method, target, version = parts
+
+        try:
+            async with asyncio.timeout(REQUEST_TIMEOUT):
+                lines = await self._read_header_lines(reader)
+        except asyncio.TimeoutError:
+            return self._reject(writer, started, HTTPStatus.REQUEST_TIMEOUT, "Timed out reading headers")
+        except ValueError:
+            return self._reject(writer, started, HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "Header line too long")
+        if lines is None:
+            return self._reject(writer, started, HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "Too many headers")
+        headers = email.message.Message()
+        for line in lines:
+            name, sep, value = line.decode("iso-8859-1").partition(":")
+            if not sep:
+                return self._reject(writer, started, HTTPStatus.BAD_REQUEST, "Bad header line")
+            headers[name.strip()] = value.strip()
+
+        connection = (headers.get("Connection") or "").lower()
+        if version == "HTTP/1.1":
+            keep_alive = connection != "close"
+        else:
+            keep_alive = connection == "keep-alive"
+        if headers.get("Transfer-Encoding"):
+            return self._reject(writer, started, HTTPStatus.NOT_IMPLEMENTED, "Chunked request bodies are not supported")
+        try:
+            length = int(headers.get("Content-Length") or 0)
+        except ValueError:
+            length = -1
+        if length < 0:
+            return self._reject(writer, started, HTTPStatus.BAD_REQUEST, "Invalid Content-Length")
+        if length > MAX_REQUEST_BODY:
+            return self._reject(writer, started, HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Request body too large")
+        body = b""
+        if length > 0:
+            try:
+                async with asyncio.timeout(REQUEST_TIMEOUT):
+                    body = await reader.readexactly(length)
+            except asyncio.TimeoutError:
+                return self._reject(writer, started, HTTPStatus.REQUEST_TIMEOUT, "Timed out reading the body")
+
+        parsed = urllib.parse.urlparse(target)
+        status = await self._respond(writer, method, parsed, headers, body, keep_alive)
+        route = metrics_route("GET" if method == "HEAD" else method, parsed.path)
+        elapsed = time.perf_counter() - started
+        METRICS.record(route, method, status.value, elapsed)
+        if ACCESS_LOG is not None:
+            ACCESS_LOG.request(client, f"{method} {target} {version}", status.value, elapsed)
+        return keep_alive
+
+    @staticmethod
+    async def _read_header_lines(reader: asyncio.StreamReader) -> Optional[List[bytes]]:
+        """Read header lines up to the blank line; ``None`` if there are more than ``MAX_HEADER_COUNT``."""
+        lines = []
+        for _ in range(MAX_HEADER_COUNT + 1):
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                return lines
+            lines.append(line)
+        return None
+
+    def _reject(self, writer: asyncio.StreamWriter, started: float, status: HTTPStatus, message: str) -> bool:
+        """Answer a malformed request with an error and close the connection."""
+        self._write_error(writer, status, message, keep_alive=False)
+        METRICS.record("other", "-", status.value, time.perf_counter() - started)
+        return False
+
+    async def _respond(
+        self,
+        writer: asyncio.StreamWriter,
+        method: str,
+        parsed: urllib.parse.ParseResult,
+        headers: email.message.Message,
+        body: bytes,
+        keep_alive: bool,
+    ) -> HTTPStatus:
+        lookup_method = "GET" if method == "HEAD" else method
+        route = API_ROUTES.get((lookup_method, parsed.path))
+        if route is not None:
+            request = ApiRequest(lookup_method, parsed.path, parsed.query, headers, body)
+            if route is api_hint or (GAMES.blocking and route in SESSION_ROUTES):
+                # Hints can take tens of milliseconds of NumPy work, and SQLite-backed sessions can wait
+                # out another process's write lock; keep the loop responsive.
+                response = await asyncio.get_running_loop().run_in_executor(None, route, request)
+            else:
+                response = route(request)
+            if response.error is not None:
+                return self._write_error(writer, response.status, response.error, keep_alive)
+            extra = [("Set-Cookie", response.cookie)] if response.cookie else []
+            extra.extend(response.headers)
+            return self._write(
+                writer, response.status, response.content_type, response.body(), keep_alive, extra, method == "HEAD"
+            )
+        if method in ("GET", "HEAD"):
+            return self._serve_static(writer, parsed.path, headers, keep_alive, head=method == "HEAD")
+        if method == "POST":
+            return self._write_error(writer, HTTPStatus.NOT_FOUND, "Unknown endpoint", keep_alive)
+        return self._write_error(writer, HTTPStatus.NOT_IMPLEMENTED, f"Unsupported method ({method!r})", keep_alive)
+
+    def _serve_static(
+        self,
+        writer: asyncio.StreamWriter,
+        url_path: str,
+        headers: email.message.Message,
+        keep_alive: bool,
+        head: bool,
+    ) -> HTTPStatus:
+        asset = self.assets.lookup(url_path) if self.assets is not None else None
+        if asset is None:
+            return self._serve_file(writer, url_path, keep_alive, head)
+        encoding, body, etag = asset.select(headers.get("Accept-Encoding"))
+        if asset.matches(headers.get("If-None-Match")):
+            return self._write(writer, HTTPStatus.NOT_MODIFIED, "", b"", keep_alive, asset.validators(etag), head=True)
+        return self._write(
+            writer, HTTPStatus.OK, asset.content_type, body, keep_alive, asset.headers(encoding, etag), head=head
+        )
+
+    def _serve_file(self, writer: asyncio.StreamWriter, url_path: str, keep_alive: bool, head: bool) -> HTTPStatus:
+        relative = urllib.parse.unquote(url_path).lstrip("/")
+        path = (self.static_dir / relative).resolve()
+        if path.is_dir():
+            path = path / "index.html"
+        if not path.is_relative_to(self.static_dir) or not path.is_file():
+            return self._write_error(writer, HTTPStatus.NOT_FOUND, "File not found", keep_alive)
+        content_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+        return self._write(writer, HTTPStatus.OK, content_type, path.read_bytes(), keep_alive, head=head)
+
+    def _write_error(
+        self, writer: asyncio.StreamWriter, status: HTTPStatus, message: str, keep_alive: bool
+    ) -> HTTPStatus:
+        status = HTTPStatus(status)
+        body = DEFAULT_ERROR_MESSAGE % {
+            "code": status.value,
+            "message": html.escape(message, quote=False),
+            "explain": html.escape(status.description, quote=False),
+        }
+        return self._write(writer, status, DEFAULT_ERROR_CONTENT_TYPE, body.encode("utf-8", "replace"), keep_alive)
+
+    def _write(
+        self,
+        writer: asyncio.StreamWriter,
+        status: HTTPStatus,
+        content_type: str,
+        body: bytes,
+        keep_alive: bool,
+        extra_headers: Sequence[Tuple[str, str]] = (),
+        head: bool = False,
+    ) -> HTTPStatus:
+        status = HTTPStatus(status)
+        lines = [
+            f"HTTP/1.1 {status.value} {status.phrase}",
+            f"Server: {self.server_version}",
+            f"Date: {email.utils.formatdate(usegmt=True)}",
+        ]
+        if status != HTTPStatus.NOT_MODIFIED:
+            # A 304 has no body and must not describe one of a different length.
+            lines += [f"Content-Type: {content_type}", f"Content-Length: {len(body)}"]
+        lines.append(f"Connection: {'keep-alive' if keep_alive else 'close'}")
+        lines.extend(f"{name}: {value}" for name, value in extra_headers)
+        head_bytes = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+        writer.write(head_bytes if head else head_bytes + body)
+        return status
+
+
+class WordleHTTPServer(ThreadingHTTPServer):
+    """``ThreadingHTTPServer`` that can share its port with sibling processes."""
+
+    reuse_port = False
+
+    def server_bind(self) -> None:
+        if self.reuse_port:
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        super().server_bind()
+
+
+class PooledHTTPServer(WordleHTTPServer):
+    """``WordleHTTPServer`` with a fixed pool of handler threads and a bounded queue of accepted connections.
+
+    ``ThreadingHTTPServer`` starts a thread per connection, so a burst can
+    start thousands of threads. Here ``pool_size`` threads take connections
+    from a queue of at most ``queue_size``. When the queue is full, the
+    accepting thread answers 503 with ``Retry-After`` and closes the connection.
+    Each connection gets a socket timeout so a stalled client cannot hold a
+    worker forever.
+    """
+
+    pool_size = 32
+    queue_size = 128
+    request_timeout = 10.0
+    retry_after = 1
+    # socketserver's default listen backlog of 5 drops SYNs in a burst, and clients then back off for seconds
+    # before they ever reach the shedding logic.
+    request_queue_size = 1024
+
+    def __init__(self, server_address: Tuple[str, int], handler_class: type) -> None:
+        self.shed = 0
+        self.busy = 0
+        self._busy_lock = threading.Lock()
+        self._pending: "queue.Queue[Optional[Tuple[socket.socket, Tuple[str, int]]]]" = queue.Queue(self.queue_size)
+        body = b"Server busy; retry later.\n"
+        self._shed_response = (
+            f"HTTP/1.0 503 Service Unavailable\r\nContent-Type: text/plain\r\nContent-Length: {len(body)}\r\n"
+            f"Retry-After: {self.retry_after}\r\nConnection: close\r\n\r\n"
+        ).encode("latin-1") + body
+        super().__init__(server_address, handler_class)
+        self._workers = [
+            threading.Thread(target=self._work, name=f"http-worker-{index}", daemon=True)
+            for index in range(self.pool_size)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def process_request(self, request: socket.socket, client_address: Tuple[str, int]) -> None:
+        request.settimeout(self.request_timeout)
+        try:
+            self._pending.put_nowait((request, client_address))
+        except queue.Full:
+            self._shed(request)
+
+    def _shed(self, request: socket.socket) -> None:
+        self.shed += 1
+        METRICS.record("other", "-", HTTPStatus.SERVICE_UNAVAILABLE.value, 0.0)
+        # The reply fits in a fresh socket's send buffer; never let a slow client stall the accept loop.
+        request.settimeout(0)
+        with contextlib.suppress(OSError):
+            request.sendall(self._shed_response)
+        self.shutdown_request(request)
+
+    def _work(self) -> None:
+        while True:
+            item = self._pending.get()
+            if item is None:
+                return
+            with self._busy_lock:
+                self.busy += 1
+            try:
+                self.process_request_thread(*item)
+            finally:
+                with self._busy_lock:
+                    self.busy -= 1
+
+    def pool_stats(self) -> Dict[str, int]:
+        return {
+            "workers": len(self._workers),
+            "busy": self.busy,
+            "queued": self._pending.qsize(),
+            "queue_size": self.queue_size,
+            "shed": self.shed,
+        }
+
+    def server_close(self) -> None:
+        super().server_close()
+        for _ in self._workers:
+            self._pending.put(None)
+        for worker in self._workers:
+            worker.join(timeout=1.0)
+
+
+# The pooled server while one is running, for /metrics.
+HTTP_POOL: Optional[PooledHTTPServer] = None
+
+
+def _serve(port: int, mode: str, reuse_port: bool = False) -> None:
+    server_address = ("", port)
+    if STATIC_ASSETS is not None:
+        STATIC_ASSETS.refresh()
+    if mode == "asyncio":
+        try:
+            asyncio.run(AsyncWordleServer(*server_address, reuse_port=reuse_port).serve_forever())
+        except KeyboardInterrupt:
+            print("\nShutting down server...")
+        return
+
+    global HTTP_POOL
+    WordleHTTPServer.reuse_port = reuse_port
+    if mode == "pool":
+        httpd = HTTP_POOL = PooledHTTPServer(server_address, WordleHandler)
+    else:
+        httpd = WordleHTTPServer(server_address, WordleHandler)
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
         print("\nShutting down server...")
     finally:
         httpd.server_close()
+        HTTP_POOL = None
+
+
+def _raise_keyboard_interrupt(signum: int, frame: object) -> None:
+    raise KeyboardInterrupt
+
+
+def _worker_main(index: int, port: int, mode: str) -> None:
+    # Replace the supervisor's handlers, which would signal its (copied) list of workers.
+    signal.signal(signal.SIGTERM, _raise_keyboard_interrupt)
+    signal.signal(signal.SIGINT, _raise_keyboard_interrupt)
+    if index == 0:
+        # One sweeper is enough for a shared store.
+        GAMES.start_sweeper()
+    # Threads do not survive fork(), so each worker starts its own sampler and watcher.
+    if PROFILER is not None:
+        PROFILER.start()
+    if WORDLIST_WATCHER is not None:
+        WORDLIST_WATCHER.start()
+    if ACCESS_LOG is not None and ACCESS_LOG.target != "-":
+        # Workers rotating one shared file would race; each writes its own.
+        ACCESS_LOG.target = f"{ACCESS_LOG.target}.worker{index}"
+    try:
+        _serve(port, mode, reuse_port=True)
+    finally:
+        if WORDLIST_WATCHER is not None:
+            WORDLIST_WATCHER.stop()
+        if PROFILER is not None:
+            PROFILER.stop()
+        GAMES.close()
+        if EVENT_LOG is not None:
+            EVENT_LOG.close()
+        if ACCESS_LOG is not None:
+            ACCESS_LOG.close()
+
+
+def run_prefork(port: int, mode: str, workers: int) -> None:
+    """Fork ``workers`` servers sharing ``port`` via SO_REUSEPORT and keep them alive.
+
+    Word banks, feedback tables and hint openers are loaded before forking so the
+    pages are shared copy-on-write. The parent only supervises: it restarts any
+    worker that exits unexpectedly (backing off if one keeps crashing) and
+    forwards SIGINT/SIGTERM to the workers on shutdown.
+    """
+    if not hasattr(socket, "SO_REUSEPORT") or not hasattr(os, "fork"):
+        raise SystemExit("--workers needs a platform with fork() and SO_REUSEPORT.")
+    # warm_solver() skips the banks without NumPy; load them anyway so every worker shares them.
+    for length in SUPPORTED_WORD_LENGTHS:
+        WORD_BANK[length]
+    warm_solver()
+    children: Dict[int, Tuple[int, float]] = {}
+    stopping = False
+
+    def spawn(index: int) -> None:
+        pid = os.fork()
+        if pid == 0:
+            code = 0
+            try:
+                _worker_main(index, port, mode)
+            except BaseException:
+                code = 1
+                traceback.print_exc()
+            finally:
+                sys.stdout.flush()
+                os._exit(code)
+        children[pid] = (index, time.monotonic())
+
+    def stop(signum: int, frame: object) -> None:
+        nonlocal stopping
+        stopping = True
+        for pid in list(children):
+            with contextlib.suppress(ProcessLookupError):
+                os.kill(pid, signal.SIGTERM)
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    for index in range(workers):
+        spawn(index)
+    print(f"Supervisor {os.getpid()} started {workers} workers.")
+
+    while children:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        except InterruptedError:
+            continue
+        index, started = children.pop(pid, (None, 0.0))
+        if stopping or index is None:
+            continue
+        print(f"Worker {index} (pid {pid}) exited with status {status}; restarting.")
+        if time.monotonic() - started < 1.0:
+            time.sleep(1.0)
+        spawn(index)
+    print("All workers stopped.")
+
+
+def run(port: int = 8000, mode: str = "threading", workers: int = 1) -> None:
+    print(f"Wordle server running at http://localhost:{port} ({mode})")
+    print("Press Ctrl+C to stop.")
+    if workers > 1:
+        run_prefork(port, mode, workers)
+        return
+    # Stop cleanly on SIGTERM too, so a durable store flushes its last batch.
+    signal.signal(signal.SIGTERM, _raise_keyboard_interrupt)
+    GAMES.start_sweeper()
+    if PROFILER is not None:
+        PROFILER.start()
+    # Games score with the plain algorithm until the tables are mapped in.
+    threading.Thread(target=warm_solver, name="solver-warmup", daemon=True).start()
+    if WORDLIST_WATCHER is not None:
+        WORDLIST_WATCHER.start()
+    try:
+        _serve(port, mode)
+    finally:
+        if WORDLIST_WATCHER is not None:
+            WORDLIST_WATCHER.stop()
+        if PROFILER is not None:
+            PROFILER.stop()
+        GAMES.close()
+        if EVENT_LOG is not None:
+            EVENT_LOG.close()
+        if ACCESS_LOG is not None:
+            ACCESS_LOG.close()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Serve the Wordle web game and its JSON API.")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument(
+        "--server",
+        choices=("threading", "pool", "asyncio"),
+        default="threading",
+        help=(
+            "threading: one thread per connection (HTTP/1.0); pool: a fixed pool of handler threads that answers "
+            "503 when its queue is full; asyncio: one event loop with HTTP/1.1 keep-alive"
+        ),
+    )
+    parser.add_argument(
+        "--pool-size", type=int, default=PooledHTTPServer.pool_size, help="handler threads for --server pool"
+    )
+    parser.add_argument(
+        "--pool-queue",
+        type=int,
+        default=PooledHTTPServer.queue_size,
+        help="accepted connections waiting for a handler before --server pool sheds load",
+    )
+    parser.add_argument("--workers", type=int, default=1, help="pre-fork N processes sharing the port (SO_REUSEPORT)")
+    parser.add_argument(
+        "--sessions",
+        choices=("memory", "durable", "sqlite", "token"),
+        help=(
+            "where games live: memory; durable (memory plus a write-behind SQLite file that survives restarts); "
+            "sqlite (shared by workers); token (encrypted in the cookie, keyed by $WORDLE_SESSION_SECRET). "
+            "Default: memory, or sqlite when --workers > 1"
+        ),
+    )
+    parser.add_argument(
+        "--session-db", type=Path, default=DEFAULT_SESSION_DB, help="SQLite file for --sessions durable/sqlite"
+    )
+    parser.add_argument(
+        "--no-static-cache", action="store_true", help="read static/ from disk on every request instead of memory"
+    )
+    parser.add_argument(
+        "--profile-sample",
+        type=float,
+        default=float(os.environ.get("WORDLE_PROFILE_SAMPLE", 0)),
+        help="fraction of requests to run under cProfile (threading or pool server; $WORDLE_PROFILE_SAMPLE)",
+    )
+    parser.add_argument(
+        "--profile-slow-ms",
+        type=float,
+        default=float(os.environ["WORDLE_PROFILE_SLOW_MS"]) if os.environ.get("WORDLE_PROFILE_SLOW_MS") else None,
+        help=(
+            "write sampled stacks of requests slower than this many ms "
+            "(threading or pool server; $WORDLE_PROFILE_SLOW_MS)"
+        ),
+    )
+    parser.add_argument(
+        "--profile-dir",
+        type=Path,
+        default=Path(os.environ.get("WORDLE_PROFILE_DIR", DEFAULT_PROFILE_DIR)),
+        help="where profiles go ($WORDLE_PROFILE_DIR)",
+    )
+    parser.add_argument("--profile-keep", type=int, default=200, help="newest profile files kept per process")
+    parser.add_argument(
+        "--access-log",
+        default="-",
+        help="'-' for stdout (default), a file path (rotated; one file per worker with --workers), or 'off'",
+    )
+    parser.add_argument("--access-log-format", choices=AccessLog.FORMATS, default="common")
+    parser.add_argument(
+        "--access-log-max-mb", type=float, default=64, help="rotate the access log file at this size; 5 backups"
+    )
+    parser.add_argument(
+        "--event-log",
+        type=Path,
+        help="append binary game starts and guesses to segment files in this directory (scripts/game_analytics.py)",
+    )
+    parser.add_argument(
+        "--event-log-segment-mb", type=float, default=256, help="start a new event log segment past this size"
+    )
+    parser.add_argument(
+        "--watch-wordlists",
+        type=float,
+        nargs="?",
+        const=2.0,
+        metavar="SECONDS",
+        help="poll wordlist/ every SECONDS (default 2) and hot-reload changed word banks without a restart",
+    )
+    args = parser.parse_args(argv)
+    profiling = args.profile_sample > 0 or args.profile_slow_ms is not None
+    if profiling and args.server == "asyncio":
+        parser.error("request profiling hooks WordleHandler; use it with --server threading or pool.")
+    sessions = args.sessions or ("sqlite" if args.workers > 1 else "memory")
+    if args.workers > 1 and sessions not in ("sqlite", "token"):
+        parser.error("--workers > 1 needs a shared session backend (--sessions sqlite or token).")
+    configure_sessions(sessions, args.session_db)
+    configure_static_cache(not args.no_static_cache)
+    PooledHTTPServer.pool_size = args.pool_size
+    PooledHTTPServer.queue_size = args.pool_queue
+    configure_profiling(args.profile_sample, args.profile_slow_ms, args.profile_dir, args.profile_keep)
+    configure_access_log(
+        None if args.access_log == "off" else args.access_log,
+        args.access_log_format,
+        max_bytes=int(args.access_log_max_mb * (1 << 20)),
+    )
+    configure_wordlist_watch(args.watch_wordlists)
+    configure_event_log(args.event_log, segment_bytes=int(args.event_log_segment_mb * (1 << 20)))
+    run(args.port, mode=args.server, workers=args.workers)
 
 
 if __name__ == "__main__":
-    run()
+    main()